@@ -5,6 +5,9 @@ Confetti celebration widget for goal achievement
 import random
 from PySide6 import QtCore, QtWidgets, QtGui
 
+# Particles are removed once they fall this far (px) below the top of the widget
+MAX_FALL = 800
+
 
 class ConfettiParticle:
     """Single confetti particle with physics"""
@@ -38,7 +41,7 @@ class ConfettiParticle:
             
     def is_alive(self):
         """Check if particle should be removed"""
-        return self.elapsed < self.lifetime and self.y < 800  # Max fall distance
+        return self.elapsed < self.lifetime and self.y < MAX_FALL
 
 
 class ConfettiWidget(QtWidgets.QWidget):
@@ -71,6 +74,7 @@ class ConfettiWidget(QtWidgets.QWidget):
         self.timer = QtCore.QTimer(self)
         self.timer.timeout.connect(self._update_particles)
         self.last_time = QtCore.QTime.currentTime()
+        self._dirty_rect = QtCore.QRect()  # Area covered by the particles at the last frame
         
     def start_celebration(self, width, height):
         """Start confetti animation"""
@@ -86,6 +90,7 @@ class ConfettiWidget(QtWidgets.QWidget):
             self.particles.append(ConfettiParticle(x, y, color))
         
         self.last_time = QtCore.QTime.currentTime()
+        self._dirty_rect = QtCore.QRect()
         self.timer.start(16)  # ~60 FPS
         self.show()
         
@@ -107,8 +112,21 @@ class ConfettiWidget(QtWidgets.QWidget):
             self.timer.stop()
             self.hide()
             self.finished.emit()
+            return
         
-        self.update()
+        # Repaint only where particles were and now are, not the whole widget
+        rect = self._particle_bounds()
+        self.update(rect.united(self._dirty_rect))
+        self._dirty_rect = rect
+    
+    def _particle_bounds(self):
+        """Bounding rect of all particles, padded for rotation and antialiasing"""
+        pad = 12  # Largest particle size; covers any rotation of a size x size/2 piece
+        xs = [p.x for p in self.particles]
+        ys = [p.y for p in self.particles]
+        left = int(min(xs)) - pad
+        top = int(min(ys)) - pad
+        return QtCore.QRect(left, top, int(max(xs)) + pad - left + 1, int(max(ys)) + pad - top + 1)
         
     def paintEvent(self, event):
         """Draw all particles"""
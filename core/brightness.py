@@ -0,0 +1,37 @@
+"""
+Background brightness helpers for HydraPing.
+Computes the mean perceived brightness of a captured BGRA image buffer.
+Uses a Numba-compiled kernel when numba is installed, NumPy otherwise.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def mean_brightness(bgra):
+        """Mean perceived brightness (0-255) of an (h, w, 4) BGRA uint8 array."""
+        h, w, _ = bgra.shape
+        total = 0.0
+        for y in range(h):
+            for x in range(w):
+                total += 0.299 * bgra[y, x, 2] + 0.587 * bgra[y, x, 1] + 0.114 * bgra[y, x, 0]
+        return total / (h * w)
+else:
+    def mean_brightness(bgra):
+        """Mean perceived brightness (0-255) of an (h, w, 4) BGRA uint8 array."""
+        return float(
+            0.299 * bgra[..., 2].mean()
+            + 0.587 * bgra[..., 1].mean()
+            + 0.114 * bgra[..., 0].mean()
+        )
+
+
+def warm_up():
+    """Compile the kernel ahead of the first real capture (no-op without numba)."""
+    mean_brightness(np.zeros((4, 4, 4), dtype=np.uint8))
@@ -31,6 +31,8 @@ AVAILABLE_THEMES = [
 
 LOG_RETENTION_DAYS = 90
 
+DB_MAINTENANCE_INTERVAL_MINUTES = 60  # PRAGMA optimize
+
 DB_SCHEMA_VERSION = 1
 DB_SCHEMA_VERSION = 1
 
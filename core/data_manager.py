@@ -8,7 +8,7 @@ High-level API that encapsulates all data operations including:
 Simplified single-user version.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from core.config import (
     get_database_path,
@@ -43,18 +43,23 @@ class DataManager:
         """Perform database maintenance tasks."""
         self._rotate_old_logs()
     
+    def run_idle_maintenance(self):
+        """Run PRAGMA optimize; called periodically while the app is idle."""
+        try:
+            self.db.optimize()
+        except Exception as e:
+            print(f"[DataManager] Idle maintenance error: {e}")
+    
     def _rotate_old_logs(self):
         """Delete hydration logs older than LOG_RETENTION_DAYS."""
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor()
             
-            cutoff_date = datetime.now() - timedelta(days=LOG_RETENTION_DAYS)
-            
             cursor.execute('''
                 DELETE FROM hydration_logs
-                WHERE timestamp < ?
-            ''', (cutoff_date,))
+                WHERE timestamp < datetime('now', 'localtime', ?)
+            ''', (f'-{LOG_RETENTION_DAYS} days',))
             
             deleted = cursor.rowcount
             conn.commit()
@@ -130,15 +135,14 @@ class DataManager:
         If days is specified, get logs from the last N days instead of using limit.
         """
         if days is not None:
-            cutoff_date = datetime.now() - timedelta(days=days)
             conn = self.db.get_connection()
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT id, amount_ml, timestamp
                 FROM hydration_logs
-                WHERE timestamp >= ?
+                WHERE timestamp >= datetime('now', 'localtime', ?)
                 ORDER BY timestamp ASC
-            ''', (cutoff_date,))
+            ''', (f'-{days} days',))
             
             logs = []
             for row in cursor.fetchall():
@@ -154,15 +158,14 @@ class DataManager:
     
     def get_today_logs(self):
         """Get all logs for today."""
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         conn = self.db.get_connection()
         cursor = conn.cursor()
         cursor.execute('''
             SELECT id, amount_ml, timestamp
             FROM hydration_logs
-            WHERE timestamp >= ?
+            WHERE timestamp >= datetime('now', 'localtime', 'start of day')
             ORDER BY timestamp ASC
-        ''', (today,))
+        ''')
         
         logs = []
         for row in cursor.fetchall():
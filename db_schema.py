@@ -6,9 +6,27 @@ Simplified single-user version without authentication.
 
 import sqlite3
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 
+# Columns of user_settings that may be written through update_user_settings
+SETTINGS_COLUMNS = frozenset({
+    'daily_goal_ml', 'reminder_interval_minutes', 'chime_enabled',
+    'default_sip_ml', 'auto_start', 'theme', 'custom_sound_path',
+    'loop_alert_sound', 'sleep_start_hour', 'sleep_end_hour',
+    'bedtime_warning_enabled', 'snooze_duration_minutes', 'window_shape',
+    'overlay_x', 'overlay_y', 'last_sound_dir'
+})
+
+
+@lru_cache(maxsize=64)
+def _build_settings_update_sql(keys):
+    """Build the UPDATE statement for a sorted tuple of whitelisted columns."""
+    set_clause = ', '.join(f'{key} = ?' for key in keys)
+    return f'UPDATE user_settings SET {set_clause} WHERE id = 1'
+
+
 class Database:
     """SQLite database wrapper for HydraPing."""
     
@@ -20,13 +38,19 @@ class Database:
     
     def get_connection(self):
         """Get a new database connection."""
-        return sqlite3.connect(self.db_file)
+        conn = sqlite3.connect(self.db_file)
+        # WAL makes NORMAL safe: commits no longer fsync, only checkpoints do
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
     
     def _create_tables(self):
         """Create database tables if they don't exist."""
         conn = self.get_connection()
         cursor = conn.cursor()
         
+        # Journal mode is persistent in the database file, so set it once here
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
         # Single-user settings table (no user_id needed)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS user_settings (
@@ -45,7 +69,8 @@ class Database:
                 snooze_duration_minutes INTEGER DEFAULT 5,
                 window_shape TEXT DEFAULT 'rectangular',
                 overlay_x INTEGER,
-                overlay_y INTEGER
+                overlay_y INTEGER,
+                last_sound_dir TEXT
             )
         ''')
         
@@ -110,7 +135,8 @@ class Database:
                         snooze_duration_minutes INTEGER DEFAULT 5,
                         window_shape TEXT DEFAULT 'rectangular',
                         overlay_x INTEGER,
-                        overlay_y INTEGER
+                        overlay_y INTEGER,
+                        last_sound_dir TEXT
                     )
                 ''')
                 
@@ -184,10 +210,22 @@ class Database:
             
             if 'overlay_y' not in columns:
                 cursor.execute('ALTER TABLE user_settings ADD COLUMN overlay_y INTEGER')
+            
+            if 'last_sound_dir' not in columns:
+                cursor.execute('ALTER TABLE user_settings ADD COLUMN last_sound_dir TEXT')
         except Exception as e:
             print(f"[Database] Schema migration note: {e}")
     
     
+    def optimize(self):
+        """Run PRAGMA optimize to refresh query planner statistics."""
+        conn = self.get_connection()
+        try:
+            conn.execute('PRAGMA optimize')
+        finally:
+            conn.close()
+    
+    
     def get_user_settings(self):
         """Get user settings."""
         conn = self.get_connection()
@@ -197,7 +235,7 @@ class Database:
             SELECT daily_goal_ml, reminder_interval_minutes, chime_enabled,
                    default_sip_ml, auto_start, theme, custom_sound_path, loop_alert_sound,
                    sleep_start_hour, sleep_end_hour, bedtime_warning_enabled, snooze_duration_minutes,
-                   window_shape, overlay_x, overlay_y
+                   window_shape, overlay_x, overlay_y, last_sound_dir
             FROM user_settings
             WHERE id = 1
         ''')
@@ -221,33 +259,28 @@ class Database:
                 'snooze_duration_minutes': row[11],
                 'window_shape': row[12] if len(row) > 12 else 'rectangular',
                 'overlay_x': row[13] if len(row) > 13 else None,
-                'overlay_y': row[14] if len(row) > 14 else None
+                'overlay_y': row[14] if len(row) > 14 else None,
+                'last_sound_dir': row[15] if len(row) > 15 else None
             }
         return None
     
     def update_user_settings(self, **kwargs):
         """Update user settings."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        unknown = kwargs.keys() - SETTINGS_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown setting(s): {', '.join(sorted(unknown))}")
         
-        set_clauses = []
-        values = []
+        if not kwargs:
+            return
         
-        for key, value in kwargs.items():
-            set_clauses.append(f"{key} = ?")
-            if isinstance(value, bool):
-                value = int(value)
-            values.append(value)
-        
-        if set_clauses:
-            query = f'''
-                UPDATE user_settings
-                SET {', '.join(set_clauses)}
-                WHERE id = 1
-            '''
-            cursor.execute(query, values)
-            conn.commit()
+        keys = tuple(sorted(kwargs))
+        values = [int(kwargs[key]) if isinstance(kwargs[key], bool) else kwargs[key]
+                  for key in keys]
         
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(_build_settings_update_sql(keys), values)
+        conn.commit()
         conn.close()
     
     def log_water_intake(self, amount_ml):
@@ -268,13 +301,11 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        
         cursor.execute('''
             SELECT COALESCE(SUM(amount_ml), 0)
             FROM hydration_logs
-            WHERE timestamp >= ?
-        ''', (today_start,))
+            WHERE timestamp >= datetime('now', 'localtime', 'start of day')
+        ''')
         
         total = cursor.fetchone()[0]
         conn.close()
@@ -309,17 +340,15 @@ class Database:
         conn.commit()
         conn.close()
     
-    def reset_today_intake(self, user_id):
+    def reset_today_intake(self):
         """Reset today's intake by deleting today's logs."""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        
         cursor.execute('''
             DELETE FROM hydration_logs
-            WHERE user_id = ? AND timestamp >= ?
-        ''', (user_id, today_start))
+            WHERE timestamp >= datetime('now', 'localtime', 'start of day')
+        ''')
         
         deleted = cursor.rowcount
         conn.commit()
@@ -332,15 +361,13 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        start_date = datetime.now() - timedelta(days=days)
-        
         cursor.execute('''
             SELECT DATE(timestamp) as date, SUM(amount_ml) as total
             FROM hydration_logs
-            WHERE user_id = ? AND timestamp >= ?
+            WHERE user_id = ? AND timestamp >= datetime('now', 'localtime', ?)
             GROUP BY DATE(timestamp)
             ORDER BY date DESC
-        ''', (user_id, start_date))
+        ''', (user_id, f'-{days} days'))
         
         stats = [{'date': row[0], 'total_ml': row[1]} for row in cursor.fetchall()]
         
@@ -352,16 +379,14 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        week_start = datetime.now() - timedelta(days=7)
-        
         cursor.execute('''
             SELECT 
                 COUNT(DISTINCT DATE(timestamp)) as days_logged,
                 SUM(amount_ml) as total_ml,
                 AVG(amount_ml) as avg_per_log
             FROM hydration_logs
-            WHERE user_id = ? AND timestamp >= ?
-        ''', (user_id, week_start))
+            WHERE user_id = ? AND timestamp >= datetime('now', 'localtime', '-7 days')
+        ''', (user_id,))
         
         row = cursor.fetchone()
         conn.close()
@@ -379,67 +404,77 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        start_date = datetime.now() - timedelta(days=days)
-        
         cursor.execute('''
             SELECT 
                 CAST(strftime('%H', timestamp) AS INTEGER) as hour,
                 SUM(amount_ml) as total
             FROM hydration_logs
-            WHERE user_id = ? AND timestamp >= ?
+            WHERE user_id = ? AND timestamp >= datetime('now', 'localtime', ?)
             GROUP BY hour
             ORDER BY hour
-        ''', (user_id, start_date))
+        ''', (user_id, f'-{days} days'))
         
         distribution = {row[0]: row[1] for row in cursor.fetchall()}
         
         conn.close()
         return distribution
     
-    def get_hourly_distribution_matrix(self, user_id, days=7):
-        """Get hourly distribution matrix for heatmap."""
+    def get_hourly_distribution_matrix(self, days=7):
+        """Get hourly distribution matrix for heatmap as (days x 24 totals, day labels).
+        
+        The matrix is a NumPy int32 array when numpy is installed, nested lists otherwise.
+        """
+        try:
+            import numpy as np
+        except ImportError:  # Optional dependency
+            np = None
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        start_date = datetime.now() - timedelta(days=days)
+        # One anchor for both the query window and the labels
+        cursor.execute("SELECT DATE('now', 'localtime', ?)", (f'-{days - 1} days',))
+        first_day = cursor.fetchone()[0]
         
         cursor.execute('''
             SELECT 
-                DATE(timestamp) as date,
+                CAST(julianday(DATE(timestamp)) - julianday(?) AS INTEGER) as day,
                 CAST(strftime('%H', timestamp) AS INTEGER) as hour,
                 SUM(amount_ml) as total
             FROM hydration_logs
-            WHERE user_id = ? AND timestamp >= ?
-            GROUP BY date, hour
-            ORDER BY date, hour
-        ''', (user_id, start_date))
-        
-        matrix = {}
-        for row in cursor.fetchall():
-            date, hour, total = row
-            if date not in matrix:
-                matrix[date] = {}
-            matrix[date][hour] = total
+            WHERE timestamp >= ?
+            GROUP BY day, hour
+        ''', (first_day, first_day))
+        
+        if np is not None:
+            matrix = np.zeros((days, 24), dtype=np.int32)
+        else:
+            matrix = [[0] * 24 for _ in range(days)]
+        for day, hour, total in cursor:
+            if 0 <= day < days:
+                matrix[day][hour] = total
         
         conn.close()
-        return matrix
+        
+        start = datetime.strptime(first_day, '%Y-%m-%d').date()
+        day_labels = [(start + timedelta(days=i)).isoformat() for i in range(days)]
+        
+        return matrix, day_labels
     
     def get_today_hourly_breakdown(self, user_id):
         """Get today's intake broken down by hour."""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        
         cursor.execute('''
             SELECT 
                 CAST(strftime('%H', timestamp) AS INTEGER) as hour,
                 SUM(amount_ml) as total
             FROM hydration_logs
-            WHERE user_id = ? AND timestamp >= ?
+            WHERE user_id = ? AND timestamp >= datetime('now', 'localtime', 'start of day')
             GROUP BY hour
             ORDER BY hour
-        ''', (user_id, today_start))
+        ''', (user_id,))
         
         breakdown = {row[0]: row[1] for row in cursor.fetchall()}
         
@@ -459,14 +494,13 @@ class Database:
         
         daily_goal = goal[0]
         
-        start_date = datetime.now() - timedelta(days=30)
         cursor.execute('''
             SELECT DATE(timestamp) as date, SUM(amount_ml) as total
             FROM hydration_logs
-            WHERE user_id = ? AND timestamp >= ?
+            WHERE user_id = ? AND timestamp >= datetime('now', 'localtime', '-30 days')
             GROUP BY DATE(timestamp)
             ORDER BY date DESC
-        ''', (user_id, start_date))
+        ''', (user_id,))
         
         rows = cursor.fetchall()
         conn.close()
@@ -517,21 +551,20 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        this_week_start = datetime.now() - timedelta(days=7)
-        last_week_start = datetime.now() - timedelta(days=14)
-        
         cursor.execute('''
             SELECT COALESCE(SUM(amount_ml), 0)
             FROM hydration_logs
-            WHERE user_id = ? AND timestamp >= ?
-        ''', (user_id, this_week_start))
+            WHERE user_id = ? AND timestamp >= datetime('now', 'localtime', '-7 days')
+        ''', (user_id,))
         this_week = cursor.fetchone()[0]
         
         cursor.execute('''
             SELECT COALESCE(SUM(amount_ml), 0)
             FROM hydration_logs
-            WHERE user_id = ? AND timestamp >= ? AND timestamp < ?
-        ''', (user_id, last_week_start, this_week_start))
+            WHERE user_id = ?
+              AND timestamp >= datetime('now', 'localtime', '-14 days')
+              AND timestamp < datetime('now', 'localtime', '-7 days')
+        ''', (user_id,))
         last_week = cursor.fetchone()[0]
         
         conn.close()
@@ -3,10 +3,10 @@ Layout modules for HydraPing overlay
 """
 
 from .layout_manager import LayoutManager
-from .layout_config import LayoutConfig, get_layout_config, LAYOUT_CONFIGS
+from .layout_config import LayoutConfig, Widget, get_layout_config
 
 # Legacy imports for backward compatibility
 from .normal_layout import NormalLayout
 from .minimal_layout import MinimalLayout
 
-__all__ = ['LayoutManager', 'LayoutConfig', 'get_layout_config', 'LAYOUT_CONFIGS', 'NormalLayout', 'MinimalLayout']
+__all__ = ['LayoutManager', 'LayoutConfig', 'Widget', 'get_layout_config', 'NormalLayout', 'MinimalLayout']
@@ -2,21 +2,42 @@
 Configuration-based layout system for flexible UI management
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Optional, Tuple
 from PySide6 import QtCore
 
 
-@dataclass
+# Shared alignment flags, combined once at import
+_ALIGN_CENTER = QtCore.Qt.AlignmentFlag.AlignCenter
+_ALIGN_LEFT_V = QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
+_ALIGN_RIGHT_V = QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+
+
+class Widget(IntEnum):
+    """Index of each managed widget in LayoutConfig's per-widget tuples (layout order)"""
+    PROGRESS = 0
+    MENU = 1
+    MESSAGE = 2
+    SNOOZE = 3
+    DRINK = 4
+    INFO = 5
+
+
+@dataclass(frozen=True, slots=True)
 class WidgetConfig:
     """Configuration for a single widget"""
     visible: bool = True
     size: Optional[Tuple[int, int]] = None  # (width, height)
-    alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter
+    alignment: QtCore.Qt.AlignmentFlag = _ALIGN_CENTER
     stretch: int = 0
 
 
-@dataclass
+# Shared default for widgets a layout does not configure explicitly
+_DEFAULT_WIDGET_CONFIG = WidgetConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class LayoutConfig:
     """Complete layout configuration"""
     # Window properties
@@ -29,12 +50,12 @@ class LayoutConfig:
     layout_margins: Tuple[int, int, int, int] = (12, 4, 12, 4)
     
     # Widget configurations
-    progress_widget: WidgetConfig = None
-    message_label: WidgetConfig = None
-    info_label: WidgetConfig = None
-    menu_button: WidgetConfig = None
-    drink_button: WidgetConfig = None
-    snooze_button: WidgetConfig = None
+    progress_widget: WidgetConfig = _DEFAULT_WIDGET_CONFIG
+    message_label: WidgetConfig = _DEFAULT_WIDGET_CONFIG
+    info_label: WidgetConfig = _DEFAULT_WIDGET_CONFIG
+    menu_button: WidgetConfig = _DEFAULT_WIDGET_CONFIG
+    drink_button: WidgetConfig = _DEFAULT_WIDGET_CONFIG
+    snooze_button: WidgetConfig = _DEFAULT_WIDGET_CONFIG
     
     # Alert mode behavior
     alert_switches_layout: bool = False
@@ -44,25 +65,38 @@ class LayoutConfig:
     # Background box
     bg_box_geometry: Tuple[int, int, int, int] = (0, 0, 0, 0)
     
+    # Derived geometry, computed once per config
+    container_radius: int = field(init=False)
+    bg_radius: int = field(init=False)
+    
+    # Per-widget settings as parallel tuples indexed by Widget
+    visible: Tuple[bool, ...] = field(init=False)
+    sizes: Tuple[Optional[Tuple[int, int]], ...] = field(init=False)
+    alignments: Tuple[QtCore.Qt.AlignmentFlag, ...] = field(init=False)
+    stretches: Tuple[int, ...] = field(init=False)
+    
     def __post_init__(self):
-        """Initialize default widget configs if not provided"""
-        if self.progress_widget is None:
-            self.progress_widget = WidgetConfig()
-        if self.message_label is None:
-            self.message_label = WidgetConfig()
-        if self.info_label is None:
-            self.info_label = WidgetConfig()
-        if self.menu_button is None:
-            self.menu_button = WidgetConfig()
-        if self.drink_button is None:
-            self.drink_button = WidgetConfig()
-        if self.snooze_button is None:
-            self.snooze_button = WidgetConfig()
-
-
-# Predefined layout configurations
-LAYOUT_CONFIGS = {
-    "rectangular": LayoutConfig(
+        # Square (compact) shape uses tighter corners than the bar
+        if self.window_shape == "square":
+            container_radius, bg_radius = 8, 9
+        else:
+            container_radius, bg_radius = 12, 14
+        # Frozen dataclass: derived fields are set once, here
+        object.__setattr__(self, 'container_radius', container_radius)
+        object.__setattr__(self, 'bg_radius', bg_radius)
+        
+        widgets = (self.progress_widget, self.menu_button, self.message_label,
+                   self.snooze_button, self.drink_button, self.info_label)
+        object.__setattr__(self, 'visible', tuple(w.visible for w in widgets))
+        object.__setattr__(self, 'sizes', tuple(w.size for w in widgets))
+        object.__setattr__(self, 'alignments', tuple(w.alignment for w in widgets))
+        object.__setattr__(self, 'stretches', tuple(w.stretch for w in widgets))
+
+
+# Predefined layout configurations, built on first use
+def _build_rectangular() -> LayoutConfig:
+    """Full-width bar layout"""
+    return LayoutConfig(
         window_size=(416, 44),
         window_shape="rectangle",
         layout_direction="horizontal",
@@ -84,7 +118,7 @@ LAYOUT_CONFIGS = {
         message_label=WidgetConfig(
             visible=True,
             stretch=1,
-            alignment=QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
+            alignment=_ALIGN_LEFT_V
         ),
         
         snooze_button=WidgetConfig(
@@ -100,16 +134,19 @@ LAYOUT_CONFIGS = {
         info_label=WidgetConfig(
             visible=True,
             stretch=0,
-            alignment=QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+            alignment=_ALIGN_RIGHT_V
         ),
         
         alert_switches_layout=False,
         show_buttons_in_alert=True,
         
         bg_box_geometry=(0, 0, 416, 44)
-    ),
-    
-    "circular": LayoutConfig(
+    )
+
+
+def _build_circular() -> LayoutConfig:
+    """Compact progress-only layout"""
+    return LayoutConfig(
         window_size=(40, 40),
         window_shape="square",
         layout_direction="vertical",
@@ -120,7 +157,7 @@ LAYOUT_CONFIGS = {
             visible=True,
             size=(34, 34),
             stretch=0,
-            alignment=QtCore.Qt.AlignmentFlag.AlignCenter
+            alignment=_ALIGN_CENTER
         ),
         
         message_label=WidgetConfig(visible=False),
@@ -135,9 +172,21 @@ LAYOUT_CONFIGS = {
         
         bg_box_geometry=(0, 0, 40, 40)
     )
+
+
+_LAYOUT_BUILDERS = {
+    "rectangular": _build_rectangular,
+    "circular": _build_circular,
 }
 
+_CACHE = {}
+
 
 def get_layout_config(layout_name: str) -> LayoutConfig:
-    """Get layout configuration by name"""
-    return LAYOUT_CONFIGS.get(layout_name, LAYOUT_CONFIGS["rectangular"])
+    """Get layout configuration by name (configs are frozen, so sharing is safe)"""
+    config = _CACHE.get(layout_name)
+    if config is None:
+        if layout_name not in _LAYOUT_BUILDERS:
+            return get_layout_config("rectangular")
+        config = _CACHE[layout_name] = _LAYOUT_BUILDERS[layout_name]()
+    return config
@@ -3,193 +3,269 @@ Flexible layout manager that applies configurations
 """
 
 from PySide6 import QtCore, QtWidgets, QtGui
-from .layout_config import LayoutConfig, get_layout_config
+from .layout_config import LayoutConfig, Widget, get_layout_config
+
+
+# Window attribute names of the managed widgets, indexed by Widget
+_WIDGET_ORDER = ('_progress_widget', '_menu_button', '_message_label',
+                 '_snooze_button', '_drink_button', '_info_label')
+
+# Stretched widgets fill their cell, so they get no alignment
+_NO_ALIGNMENT = QtCore.Qt.AlignmentFlag(0)
+
+# (theme name, container radius, bg radius) -> (container QSS, bg_box QSS)
+_QSS_CACHE = {}
+
+
+def _shape_stylesheets(theme_manager, container_radius, bg_radius):
+    """Return the cached container/bg_box stylesheets for a theme and corner radii"""
+    key = (theme_manager.current_theme, container_radius, bg_radius)
+    cached = _QSS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    theme = theme_manager.get_theme()
+    container_qss = f"""
+        #overlayContainer {{
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:1,
+                stop:0 {theme.overlay_bg_start},
+                stop:1 {theme.overlay_bg_end}
+            );
+            border-radius: {container_radius}px;
+            border: 1px solid {theme.overlay_border};
+        }}
+    """
+    bg_qss = f"""
+        #hoverBackground {{
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:1,
+                stop:0 {theme.hover_bg_start},
+                stop:1 {theme.hover_bg_end}
+            );
+            border-radius: {bg_radius}px;
+            border: 1px solid {theme.hover_border};
+        }}
+    """
+    _QSS_CACHE[key] = (container_qss, bg_qss)
+    return container_qss, bg_qss
 
 
 class LayoutManager:
     """Manages layout creation and updates based on configuration"""
     
+    # (width, height) -> elliptical window mask, shared by all managers
+    _REGION_CACHE = {}
+    
     def __init__(self, parent_window):
         self.window = parent_window
         self.current_config = None
         self.current_layout_name = None
         self.preferred_layout = "rectangular"
+        self._alert_buttons_visible = False
+        self._dirty = False
+        self._alert_state = None
+        self._widget_refs = None  # widgets aligned with _WIDGET_ORDER (None if absent), set by bind()
+        self._container = None
+        self._bg_box = None
+        self._theme_manager = None
+        self._drink_button = None
+        self._snooze_button = None
         
+        # Cached visibility answers, refreshed whenever a layout is applied
+        self._show_info = True
+        self._show_msg = True
+        self._show_alert_btns = True
+        
+    def bind(self):
+        """Cache the window's sub-widget references once its UI has been created"""
+        window = self.window
+        self._container = getattr(window, '_container', None)
+        self._bg_box = getattr(window, '_bg_box', None)
+        self._theme_manager = getattr(window, 'theme_manager', None)
+        self._drink_button = getattr(window, '_drink_button', None)
+        self._snooze_button = getattr(window, '_snooze_button', None)
+        self._widget_refs = tuple(getattr(window, name, None) for name in _WIDGET_ORDER)
+    
+    def refresh_widgets(self):
+        """Re-bind after the window creates widgets lazily and re-sync the current layout"""
+        self.bind()
+        if self.current_layout_name is not None:
+            self._dirty = True
+            self.apply_layout(self.current_layout_name)
+    
     def apply_layout(self, layout_name: str):
-        """Apply a layout configuration"""
+        """Apply a layout configuration (no-op if it is already applied and unchanged)"""
+        if layout_name == self.current_layout_name and not self._dirty:
+            return self.current_config
+        
         self.current_layout_name = layout_name
         self.current_config = get_layout_config(layout_name)
         
-        # Apply window properties
-        self._apply_window_properties()
-        
-        # Update widget configurations
-        self._apply_widget_configs()
+        if self._widget_refs is None:
+            self.bind()
         
-        # Apply window mask (for circular shape)
-        self._apply_window_mask()
+        # Batch all writes so Qt coalesces them into a single relayout/repaint
+        self.window.setUpdatesEnabled(False)
+        try:
+            # Apply window properties
+            self._apply_window_properties()
+            
+            # Update layout first so every widget is parented to the container
+            # before it is shown (a parentless widget would show as its own window)
+            self._rebuild_layout()
+            
+            # Update widget configurations
+            self._apply_widget_configs()
+            
+            # Apply window mask (for circular shape)
+            self._apply_window_mask()
+        finally:
+            if self._container is not None and self._container.layout() is not None:
+                self._container.layout().activate()
+            # Re-enabling updates schedules one repaint for the whole window
+            self.window.setUpdatesEnabled(True)
         
-        # Update layout
-        self._rebuild_layout()
+        config = self.current_config
+        self._show_info = config.visible[Widget.INFO]
+        self._show_msg = config.visible[Widget.MESSAGE]
+        self._show_alert_btns = config.show_buttons_in_alert
+        self._alert_buttons_visible = config.visible[Widget.DRINK]
+        self._dirty = False
         
         return self.current_config
     
     def _apply_window_properties(self):
         """Apply window size and basic properties"""
         config = self.current_config
-        width, height = config.window_size
         
-        # Resize window
-        self.window.setFixedSize(width, height)
+        # Resize window (skipped when already fixed at this size)
+        size = QtCore.QSize(*config.window_size)
+        if self.window.minimumSize() != size or self.window.maximumSize() != size:
+            self.window.setFixedSize(size)
         
         # Update background box
-        x, y, w, h = config.bg_box_geometry
-        if hasattr(self.window, '_bg_box'):
-            self.window._bg_box.setGeometry(x, y, w, h)
+        if self._bg_box is not None:
+            rect = QtCore.QRect(*config.bg_box_geometry)
+            if self._bg_box.geometry() != rect:
+                self._bg_box.setGeometry(rect)
     
     def _apply_widget_configs(self):
-        """Apply configuration to all widgets"""
+        """Apply configuration to all widgets: read current state, then write only the diffs"""
+        # Read phase: collect the writes that would actually change something.
+        # isHidden() is the widget's own show/hide state, so it is meaningful
+        # even before the window itself has been shown.
+        resizes = []
+        visibility_changes = []
         config = self.current_config
+        for i, widget in enumerate(self._widget_refs):
+            if widget is None:
+                continue
+            
+            if config.sizes[i]:
+                size = QtCore.QSize(*config.sizes[i])
+                if widget.minimumSize() != size or widget.maximumSize() != size:
+                    resizes.append((widget, size))
+            
+            visible = config.visible[i]
+            if widget.isHidden() == visible:
+                visibility_changes.append((widget, visible))
         
-        widget_configs = [
-            ('_progress_widget', config.progress_widget),
-            ('_message_label', config.message_label),
-            ('_info_label', config.info_label),
-            ('_menu_button', config.menu_button),
-            ('_drink_button', config.drink_button),
-            ('_snooze_button', config.snooze_button),
-        ]
-        
-        for widget_name, widget_config in widget_configs:
-            if hasattr(self.window, widget_name):
-                widget = getattr(self.window, widget_name)
-                self._apply_widget_config(widget, widget_config)
-    
-    def _apply_widget_config(self, widget, config):
-        """Apply configuration to a single widget"""
-        # Visibility
-        widget.setVisible(config.visible)
-        
-        # Size
-        if config.size:
-            width, height = config.size
-            widget.setFixedSize(width, height)
+        # Write phase: sizes first so a show doesn't trigger a resize that is then overridden
+        for widget, size in resizes:
+            widget.setFixedSize(size)
+        for widget, visible in visibility_changes:
+            widget.setVisible(visible)
     
     def _rebuild_layout(self):
-        """Rebuild the container layout"""
+        """Update the container's persistent box layout for the current configuration"""
         config = self.current_config
         
-        if not hasattr(self.window, '_container'):
+        container = self._container
+        if container is None:
             return
         
-        container = self.window._container
-        
-        # Clear existing layout
-        old_layout = container.layout()
-        if old_layout:
-            # Remove all items from layout
-            while old_layout.count():
-                item = old_layout.takeAt(0)
-                if item.widget():
-                    item.widget().setParent(container)
-            QtWidgets.QWidget().setLayout(old_layout)
-        
-        # Create new layout
         if config.layout_direction == "horizontal":
-            layout = QtWidgets.QHBoxLayout(container)
+            direction = QtWidgets.QBoxLayout.Direction.LeftToRight
         else:
-            layout = QtWidgets.QVBoxLayout(container)
+            direction = QtWidgets.QBoxLayout.Direction.TopToBottom
+        
+        # Reuse the same layout across switches; only its direction changes
+        layout = container.layout()
+        if layout is None:
+            layout = QtWidgets.QBoxLayout(direction, container)
+            layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        elif layout.direction() != direction:
+            layout.setDirection(direction)
         
         # Apply layout properties
         layout.setSpacing(config.layout_spacing)
         layout.setContentsMargins(*config.layout_margins)
-        layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         
-        # Add widgets in order
+        # Place widgets in order
         self._add_widgets_to_layout(layout)
     
     def _add_widgets_to_layout(self, layout):
-        """Add widgets to layout based on configuration.
-        Snooze/drink buttons are always added so they appear inline when
-        toggled visible in alert mode. Other widgets follow their config."""
+        """Sync widget stretch/alignment in the layout with the configuration.
+        Every widget stays in the layout once added; hidden widgets take no
+        space, so snooze/drink appear inline when toggled visible in alert mode."""
         config = self.current_config
         
-        # Widgets that toggle during alert must always be in the layout
-        always_add = {'_snooze_button', '_drink_button'}
-        
-        # Define widget order and their configs
-        widget_order = [
-            ('_progress_widget', config.progress_widget),
-            ('_menu_button', config.menu_button),
-            ('_message_label', config.message_label),
-            ('_snooze_button', config.snooze_button),
-            ('_drink_button', config.drink_button),
-            ('_info_label', config.info_label),
-        ]
-        
-        for widget_name, widget_config in widget_order:
-            if not hasattr(self.window, widget_name):
+        index = 0
+        for i, widget in enumerate(self._widget_refs):
+            if widget is None:
                 continue
             
-            # Skip non-alert widgets that are hidden in this layout
-            if widget_name not in always_add and not widget_config.visible:
-                continue
-                
-            widget = getattr(self.window, widget_name)
+            if layout.indexOf(widget) < 0:
+                layout.insertWidget(index, widget)
             
-            if widget_config.stretch > 0:
-                layout.addWidget(widget, widget_config.stretch)
+            stretch = config.stretches[i]
+            layout.setStretch(index, stretch)
+            if stretch > 0:
+                layout.setAlignment(widget, _NO_ALIGNMENT)
             else:
-                layout.addWidget(widget, 0, widget_config.alignment)
+                layout.setAlignment(widget, config.alignments[i])
+            index += 1
     
     def _apply_window_mask(self):
-        """Clear any mask - rely on WA_TranslucentBackground + border-radius for smooth edges.
-        QBitmap masks are 1-bit (pixel on/off) and cannot produce anti-aliased curves."""
-        self.window.clearMask()
+        """Apply the cached ellipse mask for the "circle" shape, or clear it.
+        Rectangle/square shapes use no mask - masks are 1-bit (pixel on/off),
+        so WA_TranslucentBackground + border-radius gives anti-aliased edges."""
+        config = self.current_config
+        if config.window_shape == "circle":
+            size = config.window_size
+            region = self._REGION_CACHE.get(size)
+            if region is None:
+                region = self._REGION_CACHE[size] = QtGui.QRegion(
+                    0, 0, size[0], size[1], QtGui.QRegion.RegionType.Ellipse
+                )
+            self.window.setMask(region)
+        else:
+            self.window.clearMask()
         self._update_shape_border_radius()
     
     def _update_shape_border_radius(self):
         """Update container/bg_box border-radius to match current shape for smooth edges"""
         config = self.current_config
-        if not config:
+        if not config or self._theme_manager is None:
             return
-
-        if config.window_shape == "square":
-            container_radius = 8
-            bg_radius = 9
-        else:
-            container_radius = 12
-            bg_radius = 14
-
-        if hasattr(self.window, '_container') and hasattr(self.window, 'theme_manager'):
-            theme = self.window.theme_manager.get_theme()
-            self.window._container.setStyleSheet(f"""
-                #overlayContainer {{
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:1,
-                        stop:0 {theme['overlay_bg_start']},
-                        stop:1 {theme['overlay_bg_end']}
-                    );
-                    border-radius: {container_radius}px;
-                    border: 1px solid {theme['overlay_border']};
-                }}
-            """)
-        if hasattr(self.window, '_bg_box') and hasattr(self.window, 'theme_manager'):
-            theme = self.window.theme_manager.get_theme()
-            self.window._bg_box.setStyleSheet(f"""
-                #hoverBackground {{
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:1,
-                        stop:0 {theme['hover_bg_start']},
-                        stop:1 {theme['hover_bg_end']}
-                    );
-                    border-radius: {bg_radius}px;
-                    border: 1px solid {theme['hover_border']};
-                }}
-            """)
+        
+        container_qss, bg_qss = _shape_stylesheets(
+            self._theme_manager, config.container_radius, config.bg_radius
+        )
+        
+        # setStyleSheet re-parses QSS and restyles the subtree; skip it when unchanged
+        if self._container is not None and self._container.styleSheet() != container_qss:
+            self._container.setStyleSheet(container_qss)
+        if self._bg_box is not None and self._bg_box.styleSheet() != bg_qss:
+            self._bg_box.setStyleSheet(bg_qss)
 
     def set_alert_mode(self, is_alert: bool):
-        """Handle alert mode transitions"""
+        """Handle alert mode transitions (repeated calls with the same state are no-ops)"""
+        if is_alert == self._alert_state:
+            return
+        self._alert_state = is_alert
+        
         config = self.current_config
         
         if is_alert:
@@ -201,21 +277,28 @@ class LayoutManager:
             
             # Show buttons if configured (check NEW config after possible switch)
             if config.show_buttons_in_alert:
-                if hasattr(self.window, '_drink_button'):
-                    self.window._drink_button.setVisible(True)
-                if hasattr(self.window, '_snooze_button'):
-                    self.window._snooze_button.setVisible(True)
+                self._set_alert_buttons_visible(True)
         else:
             # Hide buttons
-            if hasattr(self.window, '_drink_button'):
-                self.window._drink_button.setVisible(False)
-            if hasattr(self.window, '_snooze_button'):
-                self.window._snooze_button.setVisible(False)
+            self._set_alert_buttons_visible(False)
             
             # Return to preferred layout if we switched
             if self.current_layout_name != self.preferred_layout:
                 self.apply_layout(self.preferred_layout)
     
+    def _set_alert_buttons_visible(self, visible: bool):
+        """Toggle drink/snooze buttons, marking the layout dirty only on an actual change"""
+        if visible == self._alert_buttons_visible:
+            return
+        
+        if self._drink_button is not None:
+            self._drink_button.setVisible(visible)
+        if self._snooze_button is not None:
+            self._snooze_button.setVisible(visible)
+        
+        self._alert_buttons_visible = visible
+        self._dirty = True
+    
     def get_current_config(self) -> LayoutConfig:
         """Get current layout configuration"""
         return self.current_config
@@ -226,18 +309,12 @@ class LayoutManager:
     
     def should_show_info_label(self):
         """Return True if info label should be visible on hover"""
-        if self.current_config:
-            return self.current_config.info_label.visible
-        return True
+        return self._show_info
     
     def should_show_message_label(self):
         """Return True if message label should be visible"""
-        if self.current_config:
-            return self.current_config.message_label.visible
-        return True
+        return self._show_msg
     
     def should_show_buttons_in_alert(self):
         """Return True if buttons should show in alert mode"""
-        if self.current_config:
-            return self.current_config.show_buttons_in_alert
-        return True
+        return self._show_alert_btns
@@ -7,19 +7,87 @@ Features: AI predictions, smart scheduling
 import sys
 import os
 import time
+import logging
+import logging.handlers
+import queue
 from datetime import datetime
-from PySide6 import QtCore, QtWidgets, QtGui
+from PySide6 import QtCore, QtWidgets
 
+from core.config import DB_MAINTENANCE_INTERVAL_MINUTES
 from core.data_manager import get_data_manager
-from core.auto_launch import is_auto_launch_enabled, enable_auto_launch, disable_auto_launch
 from core.pattern_analyzer import PatternAnalyzer
 from overlay_window import OverlayWindow
-from settings_dialog import SettingsDialog
+
+
+logger = logging.getLogger("hydraping")
+
+# Message box enums, resolved once instead of through Shiboken on every show
+_YES = QtWidgets.QMessageBox.StandardButton.Yes
+_NO = QtWidgets.QMessageBox.StandardButton.No
+_INFO_ICON = QtWidgets.QMessageBox.Icon.Information
+
+# Zero-padded two-digit strings for the countdown display
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
+
+
+def _format_mmss(seconds):
+    """Format a non-negative second count as MM:SS (minutes may exceed 99)"""
+    mins, secs = divmod(seconds, 60)
+    return (_PAD2[mins] if mins < 100 else str(mins)) + ":" + _PAD2[secs]
+
+
+def _setup_logging():
+    """Route the hydraping logger through a queue so the GUI thread never blocks on stdout"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', '%Y-%m-%d %H:%M:%S'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+
+class _DbWrite(QtCore.QRunnable):
+    """One database write, run on the controller's I/O thread"""
+    
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+    
+    def run(self):
+        try:
+            self._fn(*self._args, **self._kwargs)
+        except Exception as e:
+            logger.warning("Database write failed: %s", e)
 
 
 class HydraPingController(QtCore.QObject):
     """Main controller managing business logic, timers, and state coordination"""
     
+    # Shared stylesheet for the controller's message boxes
+    _MSGBOX_QSS = """
+        QMessageBox {
+            background: rgba(30,30,40,250);
+        }
+        QLabel {
+            color: rgba(255,255,255,250);
+            font-size: 12px;
+        }
+        QPushButton {
+            background: rgba(255,255,255,25);
+            color: rgba(255,255,255,250);
+            border: 1px solid rgba(255,255,255,50);
+            border-radius: 6px;
+            padding: 6px 16px;
+            min-width: 60px;
+        }
+    """
+    
     def __init__(self, data_manager):
         super().__init__()
         
@@ -48,7 +116,8 @@ class HydraPingController(QtCore.QObject):
         
         if overlay_x is not None:
             self._overlay.move(overlay_x, overlay_y)
-        self._overlay.update_consumption(self.today_intake, self.settings['daily_goal_ml'])
+        self._last_ui_state = None  # (intake, goal) last pushed to the overlay
+        self._refresh_consumption()
         
         # Connect overlay signals to handlers
         self._overlay.drink_now_clicked.connect(self._handle_drink_now)
@@ -57,32 +126,64 @@ class HydraPingController(QtCore.QObject):
         self._overlay.settings_requested.connect(self.open_settings)
         self._overlay.manual_drink_requested.connect(self._handle_manual_drink)
         self._overlay.terminate_requested.connect(self._terminate_app)
+        self._overlay.shown.connect(self._on_overlay_shown)
+        self._overlay.hidden.connect(self._on_overlay_hidden)
         
-        # Fast timer for countdown display (1 second)
+        # Display-only countdown tick (1 second), runs only while the overlay is shown
         self._countdown_timer = QtCore.QTimer(self)
+        self._countdown_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)  # display tolerates ~5% drift
         self._countdown_timer.setInterval(1000)
         self._countdown_timer.timeout.connect(self._update_countdown)
         
-        # Slow timer for system checks (60 seconds)
+        # Single-shot alert timer, armed for the exact reminder/snooze deadline
+        self._alert_timer = QtCore.QTimer(self)
+        self._alert_timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)  # the alert must fire on time
+        self._alert_timer.setSingleShot(True)
+        self._alert_timer.timeout.connect(self._on_alert_due)
+        
+        # Calendar-aligned timer for system checks (midnight, sleep hours, bedtime warning)
         self._system_check_timer = QtCore.QTimer(self)
-        self._system_check_timer.setInterval(60000)  # 1 minute
-        self._system_check_timer.timeout.connect(self._system_checks)
+        self._system_check_timer.setTimerType(QtCore.Qt.TimerType.VeryCoarseTimer)
+        self._system_check_timer.setSingleShot(True)
+        self._system_check_timer.timeout.connect(self._on_system_check_due)
         
         # AI message timer (30 seconds) - update smart messages
         self._ai_message_timer = QtCore.QTimer(self)
+        self._ai_message_timer.setTimerType(QtCore.Qt.TimerType.VeryCoarseTimer)
         self._ai_message_timer.setInterval(30000)  # 30 seconds
         self._ai_message_timer.timeout.connect(self._update_smart_message)
         
+        # Idle database maintenance (PRAGMA optimize)
+        self._maintenance_timer = QtCore.QTimer(self)
+        self._maintenance_timer.setTimerType(QtCore.Qt.TimerType.VeryCoarseTimer)
+        self._maintenance_timer.setInterval(DB_MAINTENANCE_INTERVAL_MINUTES * 60 * 1000)
+        self._maintenance_timer.timeout.connect(self._run_idle_maintenance)
+        
+        # Single background thread for database writes and maintenance (serialized, so no SQLite contention)
+        self._io_pool = QtCore.QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        
+        # Debounced overlay position persistence
+        self._pending_pos = None
+        self._pos_flush_timer = QtCore.QTimer(self)
+        self._pos_flush_timer.setSingleShot(True)
+        self._pos_flush_timer.setInterval(500)
+        self._pos_flush_timer.timeout.connect(self._flush_overlay_position)
+        
+        # Hot-path caches, refreshed in _apply_settings
+        self._reminder_interval = self.settings.get('reminder_interval_minutes', 45)
+        self._show_countdown = self._overlay.update_countdown
+        
         # Tracking - snap initial reminder to next clock-aligned time
-        self.last_reminder_time = time.time()
-        self._next_reminder_time = self._calc_next_clock_aligned_time(
-            self.settings.get('reminder_interval_minutes', 45)
-        )
+        self.last_reminder_time = time.monotonic()
+        self._next_reminder_time = self._calc_next_clock_aligned_time(self._reminder_interval)
         self.last_date = datetime.now().date()
         self._in_sleep_hours = False
         self._bedtime_warning_shown = False
         self._is_snoozed = False
         self._snooze_end_time = 0
+        self._bedtime_box = None  # Open non-modal message boxes
+        self._goal_box = None
         
         # Tray removed
         
@@ -91,6 +192,7 @@ class HydraPingController(QtCore.QObject):
         
         E.g. if interval is 25 min and current time is 2:03 PM,
         the raw next time would be 2:28 PM, which snaps to 2:30 PM.
+        Returned as a time.monotonic() deadline, immune to wall-clock adjustments.
         """
         from datetime import timedelta
         now = datetime.now()
@@ -106,70 +208,89 @@ class HydraPingController(QtCore.QObject):
         else:
             raw_next = raw_next.replace(minute=snapped_minute, second=0, microsecond=0)
         
-        return raw_next.timestamp()
+        return time.monotonic() + (raw_next - now).total_seconds()
         
     def start(self):
         """Start the application - show overlay"""
-        self._countdown_timer.start()
-        self._system_check_timer.start()
         self._ai_message_timer.start()
+        self._maintenance_timer.start()
         self._system_checks()  # Run initial check
+        self._schedule_system_checks()
         self._update_smart_message()  # Initial smart message
-        self._overlay.show()
+        self._schedule_alert()
+        self._overlay.show()  # Starts the countdown display via the shown signal
         self.overlay_is_visible = True
         
+    def _next_deadline(self):
+        """Seconds until the pending snooze end (if snoozed) or the next reminder (monotonic timebase)"""
+        deadline = self._snooze_end_time if self._is_snoozed else self._next_reminder_time
+        return deadline - time.monotonic()
+    
+    def _schedule_alert(self):
+        """Arm the single-shot alert timer for the next deadline"""
+        self._alert_timer.start(max(0, int(self._next_deadline() * 1000)))
+    
+    def _on_alert_due(self):
+        """Alert timer: trigger the alert and schedule the next clock-aligned reminder"""
+        if self.paused or self._in_sleep_hours:
+            # Re-armed when unpaused or when sleep hours end
+            return
+        
+        base_interval = self._reminder_interval
+        if self._is_snoozed:
+            # Snooze ended - next reminder uses the plain interval
+            self._is_snoozed = False
+            interval = base_interval
+        else:
+            interval = self.pattern_analyzer.get_smart_reminder_delay(base_interval)
+        
+        self._trigger_alert()
+        self.last_reminder_time = time.monotonic()
+        self._next_reminder_time = self._calc_next_clock_aligned_time(interval)
+        self._schedule_alert()
+    
+    def _on_overlay_shown(self):
+        """Run the countdown display only while the overlay is visible"""
+        self._update_countdown()
+        self._countdown_timer.start()
+    
+    def _on_overlay_hidden(self):
+        """Stop the countdown display while the overlay is hidden"""
+        self._countdown_timer.stop()
+        
     def _update_countdown(self):
-        """Fast timer: Update countdown display every second with AI predictions"""
+        """Display tick: format the time left until the scheduled alert, with AI predictions"""
+        if not self._overlay.isVisible():
+            return
+        
+        show_countdown = self._show_countdown
         if not self.paused and not self._in_sleep_hours:
             # Check if snoozed
+            # Same deadline the alert timer is armed for
+            remaining_seconds = int(self._next_deadline())
             if self._is_snoozed:
-                snooze_remaining = int(self._snooze_end_time - time.time())
-                if snooze_remaining <= 0:
-                    # Snooze ended, trigger alert
-                    self._is_snoozed = False
-                    self._trigger_alert()
-                    self.last_reminder_time = time.time()
-                    base_interval = self.settings.get('reminder_interval_minutes', 45)
-                    self._next_reminder_time = self._calc_next_clock_aligned_time(base_interval)
-                else:
-                    # Show snooze countdown
-                    mins = snooze_remaining // 60
-                    secs = snooze_remaining % 60
-                    self._overlay.update_countdown(f"Snoozed: {mins:02d}:{secs:02d}")
+                # Show snooze countdown (the alert timer ends the snooze)
+                show_countdown("Snoozed: " + _format_mmss(max(0, remaining_seconds)))
             else:
-                # Calculate remaining seconds until the clock-aligned reminder
-                remaining_seconds = int(self._next_reminder_time - time.time())
-                
-                # Check if time to trigger alert
-                if remaining_seconds <= 0:
-                    self._trigger_alert()
-                    self.last_reminder_time = time.time()
-                    # Schedule next reminder aligned to clock
-                    base_interval = self.settings.get('reminder_interval_minutes', 45)
-                    adjusted_interval = self.pattern_analyzer.get_smart_reminder_delay(base_interval)
-                    self._next_reminder_time = self._calc_next_clock_aligned_time(adjusted_interval)
-                    remaining_seconds = int(self._next_reminder_time - time.time())
-                
                 # Update display with AI prediction
                 if remaining_seconds > 0:
-                    mins = remaining_seconds // 60
-                    secs = remaining_seconds % 60
+                    mmss = _format_mmss(remaining_seconds)
                     
                     # Try to show AI prediction
                     prediction = self.pattern_analyzer.predict_next_drink_time()
                     if prediction and prediction[1] > 0.6:  # High confidence
                         pred_time, confidence, _ = prediction
                         pred_mins = int((pred_time - datetime.now()).total_seconds() / 60)
-                        if pred_mins > 0 and pred_mins < adjusted_interval * 1.5:
-                            self._overlay.update_countdown(f"AI: ~{pred_mins}m (Next: {mins:02d}:{secs:02d})")
+                        if pred_mins > 0 and pred_mins < self._reminder_interval * 1.5:
+                            show_countdown(f"AI: ~{pred_mins}m (Next: {mmss})")
                         else:
-                            self._overlay.update_countdown(f"Next: {mins:02d}:{secs:02d}")
+                            show_countdown("Next: " + mmss)
                     else:
-                        self._overlay.update_countdown(f"Next: {mins:02d}:{secs:02d}")
+                        show_countdown("Next: " + mmss)
                 else:
-                    self._overlay.update_countdown("Next: 00:00")
+                    show_countdown("Next: 00:00")
         elif self._in_sleep_hours:
-            self._overlay.update_countdown("Sleep Mode")
+            show_countdown("Sleep Mode")
     
     def _update_smart_message(self):
         """Update overlay message with AI predictions"""
@@ -200,34 +321,75 @@ class HydraPingController(QtCore.QObject):
             
             # Fallback to default rotation (do nothing, let normal rotation continue)
         except Exception as e:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] Smart message error: {e}")
+            logger.warning("Smart message error: %s", e)
+    
+    def _next_system_check_delay(self):
+        """Milliseconds until the next midnight, sleep start/end or bedtime warning boundary"""
+        from datetime import timedelta
+        now = datetime.now()
+        sleep_start = self.settings.get('sleep_start_hour', 22)
+        sleep_end = self.settings.get('sleep_end_hour', 7)
+        
+        boundaries = [(0, 0), (sleep_start, 0), (sleep_end, 0)]
+        if self.settings.get('bedtime_warning_enabled', True):
+            boundaries.append(((sleep_start - 1) % 24, 30))
+        
+        next_boundary = None
+        for hour, minute in boundaries:
+            target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if target <= now:
+                target += timedelta(days=1)
+            if next_boundary is None or target < next_boundary:
+                next_boundary = target
+        
+        # 1 s slack so the checks run after the boundary, not just before it
+        return int((next_boundary - now).total_seconds() * 1000) + 1000
+    
+    def _schedule_system_checks(self):
+        """Arm the system check timer for the next calendar boundary"""
+        self._system_check_timer.start(self._next_system_check_delay())
+    
+    def _on_system_check_due(self):
+        """System check timer: run the checks, then re-arm for the next boundary"""
+        try:
+            self._system_checks()
+        finally:
+            # Always re-arm; a failed check must not stop later boundaries from firing
+            self._schedule_system_checks()
     
     def _system_checks(self):
-        """Slow timer: Check date rollover, sleep hours, bedtime warning every minute"""
+        """Check date rollover, sleep hours and bedtime warning (runs at each calendar boundary)"""
+        now = datetime.now()
+        
         # Check for daily reset (midnight rollover)
-        current_date = datetime.now().date()
+        current_date = now.date()
         if current_date != self.last_date:
             self.last_date = current_date
             self.data_manager.reset_today()
             self.today_intake = 0
-            self._overlay.update_consumption(self.today_intake, self.settings['daily_goal_ml'])
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Auto-reset: New day detected, water intake reset to 0 ml")
+            self._refresh_consumption()
+            logger.info("Auto-reset: New day detected, water intake reset to 0 ml")
         
         # Check if in sleep hours
-        current_hour = datetime.now().hour
+        current_hour = now.hour
         sleep_start = self.settings.get('sleep_start_hour', 22)
         sleep_end = self.settings.get('sleep_end_hour', 7)
         
+        was_sleeping = self._in_sleep_hours
         if sleep_start < sleep_end:
             self._in_sleep_hours = sleep_start <= current_hour < sleep_end
         else:  # Sleep hours span midnight
             self._in_sleep_hours = current_hour >= sleep_start or current_hour < sleep_end
         
+        if was_sleeping and not self._in_sleep_hours:
+            # Deliver any reminder that came due during sleep hours
+            self._schedule_alert()
+        
         # Check for bedtime warning (30 min before sleep)
         if self.settings.get('bedtime_warning_enabled', True):
             warning_hour = (sleep_start - 1) % 24
             warning_min_start = 30
-            if current_hour == warning_hour and datetime.now().minute >= warning_min_start:
+            if current_hour == warning_hour and now.minute >= warning_min_start:
                 if not self._bedtime_warning_shown and self.today_intake < self.settings['daily_goal_ml']:
                     self._show_bedtime_warning()
                     self._bedtime_warning_shown = True
@@ -249,18 +411,20 @@ class HydraPingController(QtCore.QObject):
         self._log_water(default_amount)
         self._overlay.set_alert_mode(False)
         self._is_snoozed = False
-        self.last_reminder_time = time.time()
-        base_interval = self.settings.get('reminder_interval_minutes', 45)
+        self.last_reminder_time = time.monotonic()
+        base_interval = self._reminder_interval
         adjusted_interval = self.pattern_analyzer.get_smart_reminder_delay(base_interval)
         self._next_reminder_time = self._calc_next_clock_aligned_time(adjusted_interval)
+        self._schedule_alert()
         
     def _handle_snooze(self):
         """Handle snooze button click"""
         snooze_minutes = self.settings.get('snooze_duration_minutes', 5)
         self._is_snoozed = True
-        self._snooze_end_time = time.time() + (snooze_minutes * 60)
+        self._snooze_end_time = time.monotonic() + (snooze_minutes * 60)
+        self._schedule_alert()
         self._overlay.set_alert_mode(False)
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Snoozed for {snooze_minutes} minutes")
+        logger.info("Snoozed for %d minutes", snooze_minutes)
         
     def _handle_manual_drink(self, amount):
         """Handle manual drink logging from menu"""
@@ -268,107 +432,103 @@ class HydraPingController(QtCore.QObject):
         if self._overlay._alert_mode:
             self._overlay.set_alert_mode(False)
             self._is_snoozed = False
-            self.last_reminder_time = time.time()
-            base_interval = self.settings.get('reminder_interval_minutes', 45)
+            self.last_reminder_time = time.monotonic()
+            base_interval = self._reminder_interval
             adjusted_interval = self.pattern_analyzer.get_smart_reminder_delay(base_interval)
             self._next_reminder_time = self._calc_next_clock_aligned_time(adjusted_interval)
+            self._schedule_alert()
             
     def _log_water(self, amount):
         """Log water intake and update UI"""
-        was_below_goal = self.today_intake < self.settings['daily_goal_ml']
+        goal = self.settings['daily_goal_ml']
+        was_below_goal = self.today_intake < goal
         
-        self.data_manager.log_water(amount)
+        self._submit_write(self.data_manager.log_water, amount)
         self.today_intake += amount
-        self._overlay.update_consumption(self.today_intake, self.settings['daily_goal_ml'])
-        self._overlay.flash_success()
         
-        # Check if goal achieved (trigger confetti only on first time reaching goal)
-        if was_below_goal and self.today_intake >= self.settings['daily_goal_ml']:
-            self._overlay.celebrate_goal()  # Trigger confetti animation only
+        # Trigger confetti only on first time reaching goal
+        self._overlay.apply_drink(
+            self.today_intake, goal,
+            celebrate=was_below_goal and self.today_intake >= goal
+        )
+        self._last_ui_state = (self.today_intake, goal)
             
         # Dashboard removed; no additional UI to refresh
     
+    def _refresh_consumption(self):
+        """Push intake/goal to the overlay only when either value changed"""
+        state = (self.today_intake, self.settings['daily_goal_ml'])
+        if state != self._last_ui_state:
+            self._overlay.update_consumption(*state)
+            self._last_ui_state = state
+    
     def _show_bedtime_warning(self):
-        """Show warning to drink before bed"""
+        """Show warning to drink before bed (non-modal, so timers keep running)"""
         remaining = self.settings['daily_goal_ml'] - self.today_intake
         msg_box = QtWidgets.QMessageBox()
+        msg_box.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
         msg_box.setWindowTitle("Bedtime Reminder")
         msg_box.setText(f"You're {remaining}ml away from your goal!\\nDrink some water before bed?")
-        msg_box.setIcon(QtWidgets.QMessageBox.Icon.Information)
-        msg_box.setStandardButtons(
-            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
+        msg_box.setIcon(_INFO_ICON)
+        msg_box.setStandardButtons(_YES | _NO)
+        msg_box.setStyleSheet(self._MSGBOX_QSS)
+        msg_box.buttonClicked.connect(
+            lambda button: self._handle_drink_now()
+            if msg_box.standardButton(button) == _YES else None
         )
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background: rgba(30,30,40,250);
-            }
-            QLabel {
-                color: rgba(255,255,255,250);
-                font-size: 12px;
-            }
-            QPushButton {
-                background: rgba(255,255,255,25);
-                color: rgba(255,255,255,250);
-                border: 1px solid rgba(255,255,255,50);
-                border-radius: 6px;
-                padding: 6px 16px;
-                min-width: 60px;
-            }
-        """)
-        
-        if msg_box.exec() == QtWidgets.QMessageBox.StandardButton.Yes:
-            self._handle_drink_now()
+        
+        # Keep a reference so the box isn't garbage collected while open
+        self._bedtime_box = msg_box
+        msg_box.setModal(False)
+        msg_box.show()
             
     def _show_goal_achieved(self):
-        """Show goal achievement notification"""
+        """Show goal achievement notification (non-modal)"""
         msg_box = QtWidgets.QMessageBox()
+        msg_box.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
         msg_box.setWindowTitle("Goal Achieved!")
         msg_box.setText("Congratulations! You've reached your daily hydration goal!")
-        msg_box.setIcon(QtWidgets.QMessageBox.Icon.Information)
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background: rgba(30,30,40,250);
-            }
-            QLabel {
-                color: rgba(255,255,255,250);
-                font-size: 12px;
-            }
-            QPushButton {
-                background: rgba(255,255,255,25);
-                color: rgba(255,255,255,250);
-                border: 1px solid rgba(255,255,255,50);
-                border-radius: 6px;
-                padding: 6px 16px;
-            }
-        """)
-        msg_box.exec()
+        msg_box.setIcon(_INFO_ICON)
+        msg_box.setStyleSheet(self._MSGBOX_QSS)
+        self._goal_box = msg_box
+        msg_box.setModal(False)
+        msg_box.show()
         
     def _persist_overlay_position(self, x, y):
-        """Save overlay position to database"""
-        self.data_manager.set_setting('overlay_x', x)
-        self.data_manager.set_setting('overlay_y', y)
+        """Remember the overlay position; written to the database once drags settle"""
+        self._pending_pos = (x, y)
+        self._pos_flush_timer.start()
+        
+    def _flush_overlay_position(self):
+        """Save the pending overlay position in a single settings update"""
+        if self._pending_pos is None:
+            return
+        x, y = self._pending_pos
+        self._pending_pos = None
+        self._submit_write(self.data_manager.update_settings, overlay_x=x, overlay_y=y)
+        
+    def _run_idle_maintenance(self):
+        """Queue idle database maintenance on the I/O thread, behind any pending writes"""
+        self._submit_write(self.data_manager.run_idle_maintenance)
+        
+    def _submit_write(self, fn, *args, **kwargs):
+        """Queue a database write on the I/O thread; in-memory state stays authoritative"""
+        self._io_pool.start(_DbWrite(fn, *args, **kwargs))
         
     @QtCore.Slot()
     def open_settings(self):
         """Open settings dialog"""
         try:
-            # Refresh settings before opening dialog to ensure latest values
-            self.settings = self.data_manager.get_settings()
-            
+            # self.settings and self.today_intake are kept current in memory
+            # (_apply_settings / _log_water / _handle_water_reset), so no re-read is needed
+            from settings_dialog import SettingsDialog  # Deferred until first use
             dialog = SettingsDialog(self.data_manager, parent=self._overlay)
             dialog.settings_updated.connect(self._apply_settings)
             dialog.water_reset.connect(self._handle_water_reset)
             dialog.terminate_requested.connect(self._terminate_app)
-            if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
-                # Settings were saved - only update if overlay still exists
-                if self._overlay is not None:
-                    self.settings = self.data_manager.get_settings()
-                    self.today_intake = self.data_manager.get_today_total()
-                    self._overlay.update_consumption(self.today_intake, self.settings['daily_goal_ml'])
-        except Exception as e:
-            print(f"Error opening settings: {e}")
-            import traceback
-            traceback.print_exc()
+            dialog.exec()
+        except Exception:
+            logger.exception("Error opening settings")
     
     @QtCore.Slot()
     def launch_overlay(self):
@@ -382,14 +542,15 @@ class HydraPingController(QtCore.QObject):
     def _handle_water_reset(self):
         """Handle water reset from settings dialog"""
         self.today_intake = 0
-        self._overlay.update_consumption(self.today_intake, self.settings['daily_goal_ml'])
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Manual reset: Water intake reset to 0 ml")
+        self._refresh_consumption()
+        logger.info("Manual reset: Water intake reset to 0 ml")
     
     @QtCore.Slot(dict)
     def _apply_settings(self, updated_settings):
-        """Apply updated settings from dialog"""
-        self.settings = updated_settings
-        self._overlay.update_consumption(self.today_intake, self.settings['daily_goal_ml'])
+        """Apply updated settings from dialog (merged into the in-memory copy)"""
+        self.settings.update(updated_settings)
+        self._reminder_interval = self.settings.get('reminder_interval_minutes', 45)
+        self._refresh_consumption()
         
         # Update theme if changed
         new_theme = updated_settings.get('theme', 'Dark Glassmorphic')
@@ -400,13 +561,18 @@ class HydraPingController(QtCore.QObject):
         self._overlay.set_window_shape(new_shape, save_preference=True)
         
         if not self.paused:
-            self.last_reminder_time = time.time()  # Reset reminder timer with new interval
+            self.last_reminder_time = time.monotonic()  # Reset reminder timer with new interval
+            self._schedule_alert()
+        
+        # Sleep hours / bedtime warning may have moved
+        self._system_checks()
+        self._schedule_system_checks()
     
     @QtCore.Slot()
     def _handle_intake_reset(self):
         """Handle intake reset from settings"""
         self.today_intake = 0
-        self._overlay.update_consumption(self.today_intake, self.settings['daily_goal_ml'])
+        self._refresh_consumption()
         
             
     def toggle_overlay_visibility(self):
@@ -422,6 +588,9 @@ class HydraPingController(QtCore.QObject):
     def toggle_pause(self):
         """Toggle pause state"""
         self.paused = not self.paused
+        if not self.paused:
+            # Deliver any reminder that came due while paused
+            self._schedule_alert()
         
             
     def trigger_drink_now(self):
@@ -432,25 +601,24 @@ class HydraPingController(QtCore.QObject):
     
     def cleanup(self):
         """Cleanup resources before exit"""
-        print("[HydraPing] Starting cleanup...")
+        # Stop timers (all created in __init__)
+        for timer in (self._countdown_timer, self._alert_timer, self._system_check_timer,
+                      self._ai_message_timer, self._maintenance_timer, self._pos_flush_timer):
+            timer.stop()
         
-        # Stop timers
-        if hasattr(self, '_countdown_timer') and self._countdown_timer:
-            self._countdown_timer.stop()
-        if hasattr(self, '_system_check_timer') and self._system_check_timer:
-            self._system_check_timer.stop()
-            print("[HydraPing] Timers stopped")
+        # Persist the last drag, then let queued database writes finish
+        self._flush_overlay_position()
+        self._io_pool.waitForDone()
         
-        # Hide and cleanup overlay
-        if hasattr(self, '_overlay') and self._overlay:
+        # Hide the overlay; deleteLater only posts an event, Qt deletes it during shutdown
+        if self._overlay is not None:
             self._overlay.hide()
             self._overlay.deleteLater()
             self._overlay = None
-            print("[HydraPing] Overlay closed")
         
         # Tray removed
         
-        print("[HydraPing] Cleanup complete - Application will exit")
+        logger.info("Cleanup complete: timers stopped, pending writes flushed, overlay closed")
     
     def _terminate_app(self):
         """Terminate the entire application"""
@@ -470,6 +638,7 @@ class HydraPingApp:
         
     def start(self):
         """Start the application"""
+        log_listener = _setup_logging()
         self.app = QtWidgets.QApplication(sys.argv)
         self.app.setApplicationName("HydraPing")
         # Tray removed; quit when last window closes
@@ -483,7 +652,9 @@ class HydraPingApp:
         
         self.controller.start()
         
-        sys.exit(self.app.exec())
+        exit_code = self.app.exec()
+        log_listener.stop()  # Drains queued records
+        sys.exit(exit_code)
     
 
 
@@ -5,47 +5,335 @@ A sleek PySide6-based desktop overlay with advanced glassmorphism design
 
 import sys
 import os
+import re
 import time
+import ctypes
+from ctypes import wintypes
 from PySide6 import QtCore, QtWidgets, QtGui
 from theme_manager import ThemeManager
-from confetti_widget import ConfettiWidget
+from confetti_widget import ConfettiWidget, MAX_FALL
 from layouts import LayoutManager
 
+try:
+    import winsound
+except ImportError:  # Not on Windows; the sound paths fall back silently
+    winsound = None
+
+
+_RGBA_RE = re.compile(r'rgba\((\d+),\s*(\d+),\s*(\d+),\s*(\d+)\)')
+
+# rgba string -> (color, glow color at alpha 80); themes only use a handful of colors
+_RGBA_CACHE = {}
+
+# Win32 topmost enforcement: HWND_TOPMOST, GWL_EXSTYLE, WS_EX_TOPMOST and
+# SWP_NOSIZE | SWP_NOMOVE | SWP_NOACTIVATE | SWP_NOSENDCHANGING
+_HWND_TOPMOST = -1
+_GWL_EXSTYLE = -20
+_WS_EX_TOPMOST = 0x00000008
+_SWP_TOPMOST_FLAGS = 0x0013 | 0x0010 | 0x0400
+
+# Private user32 handle, so the prototypes set below don't leak to other
+# ctypes.windll.user32 users in the process (Windows only)
+_USER32 = None
+
+# (SetWindowPos, GetWindowLongW) with argtypes set, bound on first use
+_TOPMOST_API = None
+
+# Native drag-to-move: WM_NCLBUTTONDOWN on the caption lets the system run the move loop
+_WM_NCLBUTTONDOWN = 0x00A1
+_HTCAPTION = 2
+
+# (ReleaseCapture, SendMessageW) with argtypes set, bound on first use
+_DRAG_API = None
+
+# MCI commands for the looping "alertsound" alias, and the prototyped
+# winmm mciSendStringW bound on first use (Windows only)
+_MCI_PLAY = 'play alertsound from 0'
+_MCI_PLAY_REPEAT = 'play alertsound repeat'
+_MCI_STOP = 'stop alertsound'
+_MCI_CLOSE = 'close alertsound'
+_MCI_LENGTH = 'status alertsound length'
+_MCI_SEND = None
+
+# Overlay border shadow layers: (alpha, pen width, inset, corner radius reduction)
+_SHADOW_LAYERS = (
+    (14, 1.5, 1.0, 0.0),
+    (8, 1.0, 1.4, 0.3),
+)
+
+# theme name -> (consumed label QSS, message label QSS, menu button QSS)
+_TEXT_QSS_CACHE = {}
+
+# Rotating overlay messages; shared by every window
+_MOTIVATIONAL_MESSAGES = (
+    "Stay Hydrated, Stay Healthy",
+    "Water is Life's Elixir",
+    "Hydration is Key to Wellness",
+    "Drink Water, Feel Better",
+    "Your Body Needs Water",
+    "Keep Sipping, Keep Shining",
+    "Water: Nature's Medicine",
+    "Hydrate for Better Focus",
+    "Every Sip Counts",
+    "Refresh Your Body",
+    "Water Fuels Your Energy",
+    "Stay Fresh, Stay Hydrated",
+    "Your Health Starts Here",
+    "Drink Up, Live Well",
+    "Hydration = Happiness",
+    "Water is Vital",
+    "Nourish Your Body",
+    "Small Sips, Big Impact",
+    "Keep Your Body Happy",
+    "Water: Your Best Friend",
+    "Stay Balanced, Stay Hydrated",
+    "Hydrate to Elevate",
+    "Drink More, Worry Less",
+    "Wellness Begins with Water",
+    "Your Daily Dose of Health",
+    "Sip by Sip, Feel the Difference",
+    "Hydrate Your Mind & Body",
+    "Water: The Ultimate Reset",
+    "Quench Your Thirst for Life",
+    "Pure Hydration, Pure Joy",
+    "Drink Water, Embrace Vitality",
+    "Your Cells Thank You",
+    "Stay Hydrated, Stay Sharp",
+    "Water: Liquid Wellness",
+    "Every Drop Matters",
+    "Hydrate to Celebrate Life",
+    "Water is Your Superpower",
+    "Refresh, Recharge, Repeat",
+    "Hydration is Self-Care",
+    "Drink Up, Glow Up",
+    "Water: Nature's Perfect Drink",
+    "Stay Healthy, Stay Hydrated",
+    "Your Body is 60% Water",
+    "Hydrate Like a Champion",
+    "Sip Smart, Live Better",
+    "Water: Simple Yet Essential",
+    "Hydration Fuels Everything",
+    "Make Water Your Priority",
+    "Drink More, Thrive More",
+    "Water is Your Daily Ritual",
+    "Stay Hydrated, Stay Amazing",
+    "Pure Water, Pure Energy",
+    "Hydration Never Goes Out of Style",
+    "Your Best Health Starts with H2O",
+    "Sip Your Way to Wellness",
+)
+
+
+def _text_stylesheets(theme_manager):
+    """Return the cached label/menu button stylesheets for the current theme"""
+    key = theme_manager.current_theme
+    cached = _TEXT_QSS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    theme = theme_manager.get_theme()
+    consumed_qss = f"""
+        QLabel {{
+            color: {theme.text_primary};
+            font-size: 18px;
+            font-weight: 700;
+            background: transparent;
+        }}
+    """
+    message_qss = f"""
+        QLabel {{
+            color: {theme.text_secondary};
+            font-size: 10px;
+            font-weight: 500;
+            background: transparent;
+            letter-spacing: 0.5px;
+        }}
+    """
+    menu_qss = f"""
+        QToolButton {{
+            background: {theme.button_bg};
+            color: {theme.text_secondary};
+            border: none;
+            border-radius: 6px;
+            font-size: 16px;
+            font-weight: 600;
+        }}
+        QToolButton:hover {{
+            background: {theme.button_hover};
+            color: {theme.text_primary};
+        }}
+    """
+    _TEXT_QSS_CACHE[key] = (consumed_qss, message_qss, menu_qss)
+    return consumed_qss, message_qss, menu_qss
+
+
+def _warm_up_brightness():
+    """Import and pre-compile the brightness kernel on a pool thread"""
+    try:
+        from core.brightness import warm_up
+        warm_up()
+    except Exception as e:
+        print(f"[Overlay] Brightness warm-up error: {e}")
+
+
+def _user32():
+    """Return the module's private user32 WinDLL, loaded on first use (Windows only)"""
+    global _USER32
+    if _USER32 is None:
+        _USER32 = ctypes.WinDLL('user32')
+    return _USER32
+
+
+def _topmost_api():
+    """Return the prototyped user32 (SetWindowPos, GetWindowLongW) pair (Windows only)"""
+    global _TOPMOST_API
+    if _TOPMOST_API is None:
+        user32 = _user32()
+        set_window_pos = user32.SetWindowPos
+        set_window_pos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                                   ctypes.c_int, ctypes.c_int, wintypes.UINT]
+        set_window_pos.restype = wintypes.BOOL
+        get_window_long = user32.GetWindowLongW
+        get_window_long.argtypes = [wintypes.HWND, ctypes.c_int]
+        get_window_long.restype = wintypes.LONG
+        _TOPMOST_API = (set_window_pos, get_window_long)
+    return _TOPMOST_API
+
+
+def _drag_api():
+    """Return the prototyped user32 (ReleaseCapture, SendMessageW) pair (Windows only)"""
+    global _DRAG_API
+    if _DRAG_API is None:
+        user32 = _user32()
+        release_capture = user32.ReleaseCapture
+        release_capture.argtypes = []
+        release_capture.restype = wintypes.BOOL
+        send_message = user32.SendMessageW
+        send_message.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        send_message.restype = wintypes.LPARAM
+        _DRAG_API = (release_capture, send_message)
+    return _DRAG_API
+
+
+def _mci_send():
+    """Return winmm's mciSendStringW with argtypes set (Windows only)"""
+    global _MCI_SEND
+    if _MCI_SEND is None:
+        send = ctypes.WinDLL('winmm').mciSendStringW
+        send.argtypes = [wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.UINT, wintypes.HANDLE]
+        send.restype = wintypes.DWORD
+        _MCI_SEND = send
+    return _MCI_SEND
+
+
+def _parse_rgba(rgba_str):
+    """Parse rgba string to a cached (color, glow color) pair of QColors (treat as read-only)"""
+    cached = _RGBA_CACHE.get(rgba_str)
+    if cached is not None:
+        return cached
+    
+    # Parse "rgba(r,g,b,a)" format
+    match = _RGBA_RE.match(rgba_str)
+    if match:
+        r, g, b, a = map(int, match.groups())
+        color = QtGui.QColor(r, g, b, a)
+    else:
+        color = QtGui.QColor(255, 255, 255, 220)  # Fallback
+    glow_color = QtGui.QColor(color)
+    glow_color.setAlpha(80)
+    
+    cached = _RGBA_CACHE[rgba_str] = (color, glow_color)
+    return cached
+
+
+class _BrightnessSignals(QtCore.QObject):
+    """Carries a background worker's result back to the GUI thread"""
+    done = QtCore.Signal(float)
+
+
+class _BgBrightnessWorker(QtCore.QRunnable):
+    """Average the perceived brightness of a captured background image off the GUI thread"""
+    
+    def __init__(self, image, signals):
+        super().__init__()
+        self._image = image
+        self._signals = signals
+    
+    def run(self):
+        image = self._image
+        avg_brightness = -1.0  # Reported on failure so the overlay can accept new checks
+        try:
+            # View the raw buffer as (rows, padded row pixels, BGRA) without copying
+            import numpy as np
+            from core.brightness import mean_brightness
+            pixels = np.frombuffer(image.constBits(), dtype=np.uint8).reshape(
+                image.height(), image.bytesPerLine() // 4, 4
+            )[:, :image.width()]
+            
+            # Average the perceived brightness over every pixel
+            avg_brightness = float(mean_brightness(pixels))
+        except Exception as e:
+            print(f"[Overlay] Background analysis error: {e}")
+        self._signals.done.emit(avg_brightness)
+
 
 class CircularProgress(QtWidgets.QWidget):
     """Circular progress ring widget"""
     
+    # Enum values used on every repaint, resolved once
+    _CAP_ROUND = QtCore.Qt.PenCapStyle.RoundCap
+    _HINT_AA = QtGui.QPainter.RenderHint.Antialiasing
+    _HINT_TEXT_AA = QtGui.QPainter.RenderHint.TextAntialiasing
+    _BRUSH_NONE = QtCore.Qt.BrushStyle.NoBrush
+    _WEIGHT_BOLD = QtGui.QFont.Weight.Bold
+    
     def __init__(self, parent=None, theme_manager=None):
         super().__init__(parent)
         self.setFixedSize(46, 46)
         self._progress = 0  # 0-100
-        self._animated_progress = 0
+        self._animated_progress = 0.0
         self.theme_manager = theme_manager or ThemeManager()
         
-        # Animation for smooth progress updates (reused)
-        self._progress_anim = QtCore.QPropertyAnimation(self, b"animated_progress", self)
+        # Animation for smooth progress updates (reused); values go straight to a slot
+        self._progress_anim = QtCore.QVariantAnimation(self)
         self._progress_anim.setDuration(600)
         self._progress_anim.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
-        self._anim_running = False
+        self._progress_anim.valueChanged.connect(self._on_progress_value)
         
-    def get_animated_progress(self):
-        return self._animated_progress
+        # Outlines the progress arc at glow width so it can be filled in a single pass
+        self._arc_stroker = QtGui.QPainterPathStroker()
+        self._arc_stroker.setCapStyle(self._CAP_ROUND)
         
-    def set_animated_progress(self, value):
-        self._animated_progress = value
-        self.update()
+        # Percentage label: font and pre-laid-out "N%" texts, rebuilt only when the ring size changes
+        self._pct_size = None
+        self._pct_font = None
+        self._pct_static = {}
         
-    animated_progress = QtCore.Property(float, get_animated_progress, set_animated_progress)
+    def _on_progress_value(self, value):
+        self._animated_progress = float(value)
+        self.update()
     
     def set_progress(self, value):
-        """Set progress value (0-100)"""
-        self._progress = max(0, min(100, value))
-        if not self._anim_running or self._progress_anim.state() == QtCore.QAbstractAnimation.State.Stopped:
-            self._progress_anim.stop()
-            self._progress_anim.setStartValue(self._animated_progress)
-            self._progress_anim.setEndValue(self._progress)
-            self._progress_anim.start()
-            self._anim_running = True
+        """Set progress value (0-100), animating only changes of half a percent or more"""
+        value = max(0, min(100, value))
+        self._progress = value
+        
+        running = self._progress_anim.state() == QtCore.QAbstractAnimation.State.Running
+        if running:
+            if abs(self._progress_anim.endValue() - value) < 0.5:
+                return  # Already heading there
+        elif abs(self._animated_progress - value) < 0.5:
+            # Too small to animate; jump straight to it
+            self._animated_progress = float(value)
+            self.update()
+            return
+        
+        # Retarget from the current position; small steps animate for less than 600 ms
+        self._progress_anim.stop()
+        self._progress_anim.setDuration(min(600, int(300 + 3 * abs(value - self._animated_progress))))
+        self._progress_anim.setStartValue(self._animated_progress)
+        self._progress_anim.setEndValue(float(value))
+        self._progress_anim.start()
         
     def paintEvent(self, event):
         """Draw circular progress ring with enhanced visuals"""
@@ -53,8 +341,8 @@ class CircularProgress(QtWidgets.QWidget):
             return
             
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing)
+        painter.setRenderHint(self._HINT_AA)
+        painter.setRenderHint(self._HINT_TEXT_AA)
         
         # Calculate dimensions with perfect centering
         width = self.width()
@@ -69,16 +357,16 @@ class CircularProgress(QtWidgets.QWidget):
         # Subtle shadow/glow background
         shadow_pen = QtGui.QPen(QtGui.QColor(0, 0, 0, 40))
         shadow_pen.setWidthF(pen_width + 1.0)
-        shadow_pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
+        shadow_pen.setCapStyle(self._CAP_ROUND)
         painter.setPen(shadow_pen)
         painter.drawEllipse(center, radius - 0.5, radius - 0.5)
         
         # Background circle with gradient feel
         pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 25))
         pen.setWidthF(pen_width)
-        pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
+        pen.setCapStyle(self._CAP_ROUND)
         painter.setPen(pen)
-        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        painter.setBrush(self._BRUSH_NONE)
         painter.drawEllipse(center, radius, radius)
         
         # Progress arc with glow effect
@@ -93,54 +381,104 @@ class CircularProgress(QtWidgets.QWidget):
             else:
                 color_str = colors['high']
             
-            color = self._parse_rgba(color_str)
+            color, glow_color = _parse_rgba(color_str)
             rect = QtCore.QRectF(center.x() - radius, center.y() - radius, radius * 2, radius * 2)
-            span_angle = int(self._animated_progress * 360 / 100 * 16)
+            span = self._animated_progress * 360 / 100
             
-            # Outer glow
-            glow_pen = QtGui.QPen(color)
-            glow_pen.setWidthF(pen_width + 1.5)
-            glow_pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-            glow_color = QtGui.QColor(color)
-            glow_color.setAlpha(80)
-            glow_pen.setColor(glow_color)
-            painter.setPen(glow_pen)
-            painter.drawArc(rect, 90 * 16, -span_angle)
+            # Progress arc and its glow in one fill: outline the arc at glow width and
+            # shade it radially, solid across the pen width and fading to the glow color
+            arc_path = QtGui.QPainterPath()
+            arc_path.arcMoveTo(rect, 90)
+            arc_path.arcTo(rect, 90, -span)
+            glow_width = pen_width + 1.5
+            self._arc_stroker.setWidth(glow_width)
+            outline = self._arc_stroker.createStroke(arc_path)
             
-            # Main progress arc
-            pen = QtGui.QPen(color)
-            pen.setWidthF(pen_width)
-            pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-            painter.setPen(pen)
-            painter.drawArc(rect, 90 * 16, -span_angle)
+            outer = radius + glow_width / 2.0
+            gradient = QtGui.QRadialGradient(center, outer)
+            gradient.setColorAt((radius - glow_width / 2.0) / outer, glow_color)
+            gradient.setColorAt((radius - pen_width / 2.0) / outer, color)
+            gradient.setColorAt((radius + pen_width / 2.0) / outer, color)
+            gradient.setColorAt(1.0, glow_color)
+            painter.fillPath(outline, QtGui.QBrush(gradient))
             
         # Percentage text with shadow
-        font = painter.font()
-        font_size = max(9, int(size / 4.2))
-        font.setPixelSize(font_size)
-        font.setWeight(QtGui.QFont.Weight.Bold)
-        font.setFamily("Segoe UI")
-        painter.setFont(font)
-        
-        text = f"{int(self._animated_progress)}%"
+        static_text = self._percent_text(int(self._animated_progress), size)
+        painter.setFont(self._pct_font)
+        text_size = static_text.size()
+        pos = QtCore.QPointF((width - text_size.width()) / 2.0, (height - text_size.height()) / 2.0)
         
         # Text shadow for depth
         painter.setPen(QtGui.QColor(0, 0, 0, 120))
-        painter.drawText(self.rect().adjusted(0, 1, 0, 1), QtCore.Qt.AlignmentFlag.AlignCenter, text)
+        painter.drawStaticText(pos + QtCore.QPointF(0, 1), static_text)
         
         # Main text
         painter.setPen(QtGui.QColor(255, 255, 255, 255))
-        painter.drawText(self.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, text)
+        painter.drawStaticText(pos, static_text)
+    
+    def _percent_text(self, percent, size):
+        """Return the prepared QStaticText for a percentage at the given ring size"""
+        if size != self._pct_size:
+            font = QtGui.QFont("Segoe UI")
+            font.setPixelSize(max(9, int(size / 4.2)))
+            font.setWeight(self._WEIGHT_BOLD)
+            self._pct_font = font
+            self._pct_static = {}
+            self._pct_size = size
+        
+        static_text = self._pct_static.get(percent)
+        if static_text is None:
+            static_text = QtGui.QStaticText(f"{percent}%")
+            static_text.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+            static_text.prepare(QtGui.QTransform(), self._pct_font)
+            self._pct_static[percent] = static_text
+        return static_text
+    
+class _InfoLabel(QtWidgets.QWidget):
+    """Right-aligned info text (consumed / countdown) drawn from a QStaticText.
+    Paints itself in the old QLabel's fixed white, with no stylesheet or QLabel."""
+    
+    _PADDING = 4  # Right padding, as the old QLabel's "padding: 2px 4px"
+    _TEXT_COLOR = QtGui.QColor(255, 255, 255, 250)  # The old QLabel's "color: rgba(255,255,255,250)"
+    
+    def __init__(self, text, parent=None):
+        super().__init__(parent)
+        self.setFixedWidth(110)
+        
+        self._font = QtGui.QFont()
+        self._font.setFamilies(['Segoe UI Variable Display', 'Segoe UI'])
+        self._font.setPixelSize(11)
+        self._font.setWeight(QtGui.QFont.Weight.DemiBold)
+        self.setFont(self._font)
+        
+        self._static_text = QtGui.QStaticText(text)
+        self._static_text.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+        self._static_text.prepare(QtGui.QTransform(), self._font)
     
-    def _parse_rgba(self, rgba_str):
-        """Parse rgba string to QColor"""
-        # Parse "rgba(r,g,b,a)" format
-        import re
-        match = re.match(r'rgba\((\d+),\s*(\d+),\s*(\d+),\s*(\d+)\)', rgba_str)
-        if match:
-            r, g, b, a = map(int, match.groups())
-            return QtGui.QColor(r, g, b, a)
-        return QtGui.QColor(255, 255, 255, 220)  # Fallback
+    def text(self):
+        return self._static_text.text()
+    
+    def setText(self, text):
+        """Re-lay out and repaint only when the text actually changes"""
+        if text == self._static_text.text():
+            return
+        self._static_text.setText(text)
+        self._static_text.prepare(QtGui.QTransform(), self._font)
+        self.update()
+    
+    def sizeHint(self):
+        return QtCore.QSize(110, self.fontMetrics().height() + 4)  # 2px top/bottom padding
+    
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.setFont(self._font)
+        painter.setPen(self._TEXT_COLOR)
+        text_size = self._static_text.size()
+        pos = QtCore.QPointF(
+            self.width() - self._PADDING - text_size.width(),
+            (self.height() - text_size.height()) / 2.0
+        )
+        painter.drawStaticText(pos, self._static_text)
 
 
 class OverlayWindow(QtWidgets.QWidget):
@@ -153,121 +491,158 @@ class OverlayWindow(QtWidgets.QWidget):
     settings_requested = QtCore.Signal()
     manual_drink_requested = QtCore.Signal(int)
     terminate_requested = QtCore.Signal()
+    shown = QtCore.Signal()
+    hidden = QtCore.Signal()
+    
+    # Popup stylesheets, shared by the cached menu and custom amount dialog
+    _MENU_QSS = """
+        QMenu {
+            background: rgba(30,30,40,240);
+            color: rgba(255,255,255,250);
+            border: 1px solid rgba(255,255,255,90);
+            border-radius: 8px;
+            padding: 6px;
+            font-size: 11px;
+            font-family: 'Segoe UI Variable Display', 'Segoe UI', system-ui;
+        }
+        QMenu::item {
+            padding: 8px 24px 8px 12px;
+            border-radius: 4px;
+            margin: 2px;
+        }
+        QMenu::item:selected {
+            background: rgba(255,255,255,25);
+        }
+        QMenu::separator {
+            height: 1px;
+            background: rgba(255,255,255,15);
+            margin: 4px 8px;
+        }
+    """
+    
+    _DIALOG_QSS = """
+        QDialog {
+            background: rgba(30,30,40,250);
+            border: 1px solid rgba(255,255,255,90);
+            border-radius: 12px;
+        }
+        QLabel {
+            color: rgba(255,255,255,250);
+            font-size: 12px;
+            font-weight: 600;
+            font-family: 'Segoe UI Variable Display', 'Segoe UI', system-ui;
+        }
+        QSpinBox {
+            background: rgba(255,255,255,15);
+            color: rgba(255,255,255,250);
+            border: 1px solid rgba(255,255,255,50);
+            border-radius: 6px;
+            padding: 6px;
+            font-size: 11px;
+        }
+        QPushButton {
+            background: rgba(255,255,255,25);
+            color: rgba(255,255,255,250);
+            border: 1px solid rgba(255,255,255,50);
+            border-radius: 6px;
+            padding: 8px 16px;
+            font-size: 11px;
+            font-weight: 600;
+        }
+        QPushButton:hover {
+            background: rgba(255,255,255,35);
+        }
+    """
     
     def paintEvent(self, event):
         """Custom paint event for adaptive shape border with ultra-smooth edges"""
         super().paintEvent(event)
         
+        # The border only depends on size, shape and pixel ratio; re-render when any changes
+        cache_key = (self.width(), self.height(), self._window_shape, self.devicePixelRatioF())
+        if cache_key != self._paint_cache_key:
+            self._rebuild_paint_cache()
+            self._paint_cache_key = cache_key
+        
+        # Child updates (e.g. label text) repaint only the area under them;
+        # skip stroking when none of the exposed area can touch the border
+        if event.region().subtracted(self._stroke_free_region).isEmpty():
+            return
+        
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, True)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing, True)
         painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_SourceOver)
+        painter.drawPixmap(0, 0, self._border_pixmap)
+        painter.end()
+    
+    def _rebuild_paint_cache(self):
+        """Pre-render the border for the current size and shape"""
+        # Minimal mode: small rounded square matching taskbar icon size
+        corner_radius = 8.0 if self._window_shape == 'circular' else 12.0
         
-        rect = self.rect()
-        
-        # Draw shape based on current window shape
-        if self._window_shape == 'circular':
-            # Minimal mode: small rounded square matching taskbar icon size
-            corner_radius = 8.0
-            
-            # Soft outer shadow
-            for i in range(2):
-                shadow_alpha = 14 - (i * 6)
-                shadow_pen = QtGui.QPen(QtGui.QColor(0, 0, 0, shadow_alpha))
-                shadow_pen.setWidthF(1.5 - (i * 0.5))
-                shadow_pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
-                shadow_pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-                painter.setPen(shadow_pen)
-                painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
-                shadow_path = QtGui.QPainterPath()
-                offset = 1.0 + i * 0.4
-                shadow_path.addRoundedRect(
-                    QtCore.QRectF(rect).adjusted(offset, offset, -offset, -offset),
-                    corner_radius - i * 0.3, corner_radius - i * 0.3
-                )
-                painter.drawPath(shadow_path)
-            
-            # Main border
-            main_path = QtGui.QPainterPath()
-            inset = 1.0
-            main_path.addRoundedRect(
-                QtCore.QRectF(rect).adjusted(inset, inset, -inset, -inset),
-                corner_radius, corner_radius
-            )
-            
-            pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 65))
-            pen.setWidthF(1.5)
-            pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-            pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
-            painter.setPen(pen)
-            painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
-            painter.drawPath(main_path)
-            
-            # Subtle inner highlight
-            inner_path = QtGui.QPainterPath()
-            inner_inset = 2.2
-            inner_path.addRoundedRect(
-                QtCore.QRectF(rect).adjusted(inner_inset, inner_inset, -inner_inset, -inner_inset),
-                corner_radius - 1, corner_radius - 1
-            )
-            highlight_pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 22))
-            highlight_pen.setWidthF(0.5)
-            highlight_pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
-            painter.setPen(highlight_pen)
-            painter.drawPath(inner_path)
-        else:
-            # Rounded rectangle with QPainterPath for smooth curves
-            corner_radius = 12.0
-            
-            # Soft outer shadow (2 feathered layers)
-            for i in range(2):
-                shadow_alpha = 14 - (i * 6)
-                shadow_pen = QtGui.QPen(QtGui.QColor(0, 0, 0, shadow_alpha))
-                shadow_pen.setWidthF(1.5 - (i * 0.5))
-                shadow_pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
-                shadow_pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-                painter.setPen(shadow_pen)
-                painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
-                shadow_path = QtGui.QPainterPath()
-                offset = 1.0 + i * 0.4
-                shadow_path.addRoundedRect(
-                    QtCore.QRectF(rect).adjusted(offset, offset, -offset, -offset),
-                    corner_radius - i * 0.3, corner_radius - i * 0.3
-                )
-                painter.drawPath(shadow_path)
-            
-            # Main border via QPainterPath
-            main_path = QtGui.QPainterPath()
-            inset = 1.0
-            main_path.addRoundedRect(
-                QtCore.QRectF(rect).adjusted(inset, inset, -inset, -inset),
-                corner_radius, corner_radius
-            )
-            
-            pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 65))
-            pen.setWidthF(1.5)
-            pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-            pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
-            painter.setPen(pen)
-            painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
-            painter.drawPath(main_path)
-            
-            # Subtle inner highlight
-            inner_path = QtGui.QPainterPath()
-            inner_inset = 2.2
-            inner_path.addRoundedRect(
-                QtCore.QRectF(rect).adjusted(inner_inset, inner_inset, -inner_inset, -inner_inset),
-                corner_radius - 1, corner_radius - 1
-            )
-            
-            highlight_pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 22))
-            highlight_pen.setWidthF(0.5)
-            highlight_pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
-            painter.setPen(highlight_pen)
-            painter.drawPath(inner_path)
+        pixmap = QtGui.QPixmap(self.size() * self.devicePixelRatioF())
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
         
+        painter = QtGui.QPainter(pixmap)
+        self._draw_border(painter, QtCore.QRectF(self.rect()), corner_radius)
         painter.end()
+        self._border_pixmap = pixmap
+        
+        # Interior the strokes never reach: edge band of 4px (stroke extent + antialiasing),
+        # widened to corner_radius + 3 along the other axis to clear the rounded corners
+        edge = 4
+        corner = int(corner_radius) + 3
+        inner = self.rect()
+        self._stroke_free_region = (
+            QtGui.QRegion(inner.adjusted(edge, corner, -edge, -corner))
+            .united(QtGui.QRegion(inner.adjusted(corner, edge, -corner, -edge)))
+        )
+    
+    def _draw_border(self, painter, rect, corner_radius):
+        """Stroke the shadows, main border and inner highlight for either shape"""
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        
+        # Soft outer shadow (2 feathered layers)
+        for shadow_alpha, width, offset, radius_adj in _SHADOW_LAYERS:
+            shadow_pen = QtGui.QPen(QtGui.QColor(0, 0, 0, shadow_alpha))
+            shadow_pen.setWidthF(width)
+            shadow_pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
+            shadow_pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
+            shadow_path = QtGui.QPainterPath()
+            shadow_path.addRoundedRect(
+                rect.adjusted(offset, offset, -offset, -offset),
+                corner_radius - radius_adj, corner_radius - radius_adj
+            )
+            painter.setPen(shadow_pen)
+            painter.drawPath(shadow_path)
+        
+        # Main border via QPainterPath
+        main_path = QtGui.QPainterPath()
+        inset = 1.0
+        main_path.addRoundedRect(
+            rect.adjusted(inset, inset, -inset, -inset),
+            corner_radius, corner_radius
+        )
+        pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 65))
+        pen.setWidthF(1.5)
+        pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
+        pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
+        painter.setPen(pen)
+        painter.drawPath(main_path)
+        
+        # Subtle inner highlight
+        inner_path = QtGui.QPainterPath()
+        inner_inset = 2.2
+        inner_path.addRoundedRect(
+            rect.adjusted(inner_inset, inner_inset, -inner_inset, -inner_inset),
+            corner_radius - 1, corner_radius - 1
+        )
+        highlight_pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 22))
+        highlight_pen.setWidthF(0.5)
+        highlight_pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
+        painter.setPen(highlight_pen)
+        painter.drawPath(inner_path)
     
     def __init__(self, parent=None, theme_name='Dark Glassmorphic'):
         super().__init__(parent)
@@ -280,6 +655,22 @@ class OverlayWindow(QtWidgets.QWidget):
         self._saved_shape = 'rectangular'  # User's preferred shape (for auto-revert)
         self._layout_manager = LayoutManager(self)
         
+        # Pre-rendered border for paintEvent, keyed by (width, height, shape, pixel ratio)
+        self._paint_cache_key = None
+        self._border_pixmap = None
+        self._stroke_free_region = QtGui.QRegion()
+        
+        # Context menu and custom amount dialog, created on first use
+        self._menu = None
+        self._custom_dialog = None
+        self._custom_spinbox = None
+        
+        # Native handle, call count and foreground-change hook for _ensure_topmost (Windows only)
+        self._hwnd = None
+        self._topmost_calls = 0
+        self._foreground_hook = None
+        self._foreground_proc = None  # ctypes callback; must outlive the hook
+        
         # State management
         self._drag_active = False
         self._drag_offset = QtCore.QPoint()
@@ -288,6 +679,7 @@ class OverlayWindow(QtWidgets.QWidget):
         self._current_message_index = 0
         self._current_consumed = 0
         self._current_goal = 2000
+        self._consumption_text = "0ml / 2000ml"  # Formatted once per consumption change
         self._show_consumed = True  # Toggle between consumed and countdown
         
         # Sound loop timer (reused)
@@ -295,65 +687,6 @@ class OverlayWindow(QtWidgets.QWidget):
         self._sound_loop_timer.timeout.connect(self._replay_sound_internal)
         self._current_sound_path = None
         
-        # Motivational messages
-        self._motivational_messages = [
-            "Stay Hydrated, Stay Healthy",
-            "Water is Life's Elixir",
-            "Hydration is Key to Wellness",
-            "Drink Water, Feel Better",
-            "Your Body Needs Water",
-            "Keep Sipping, Keep Shining",
-            "Water: Nature's Medicine",
-            "Hydrate for Better Focus",
-            "Every Sip Counts",
-            "Refresh Your Body",
-            "Water Fuels Your Energy",
-            "Stay Fresh, Stay Hydrated",
-            "Your Health Starts Here",
-            "Drink Up, Live Well",
-            "Hydration = Happiness",
-            "Water is Vital",
-            "Nourish Your Body",
-            "Small Sips, Big Impact",
-            "Keep Your Body Happy",
-            "Water: Your Best Friend",
-            "Stay Balanced, Stay Hydrated",
-            "Hydrate to Elevate",
-            "Drink More, Worry Less",
-            "Wellness Begins with Water",
-            "Your Daily Dose of Health",
-            "Sip by Sip, Feel the Difference",
-            "Hydrate Your Mind & Body",
-            "Water: The Ultimate Reset",
-            "Quench Your Thirst for Life",
-            "Pure Hydration, Pure Joy",
-            "Drink Water, Embrace Vitality",
-            "Your Cells Thank You",
-            "Stay Hydrated, Stay Sharp",
-            "Water: Liquid Wellness",
-            "Every Drop Matters",
-            "Hydrate to Celebrate Life",
-            "Water is Your Superpower",
-            "Refresh, Recharge, Repeat",
-            "Hydration is Self-Care",
-            "Drink Up, Glow Up",
-            "Water: Nature's Perfect Drink",
-            "Stay Healthy, Stay Hydrated",
-            "Your Body is 60% Water",
-            "Hydrate Like a Champion",
-            "Sip Smart, Live Better",
-            "Water: Simple Yet Essential",
-            "Hydration Fuels Everything",
-            "Make Water Your Priority",
-            "Drink More, Thrive More",
-            "Water is Your Daily Ritual",
-            "Stay Hydrated, Stay Amazing",
-            "Pure Water, Pure Energy",
-            "Hydration Never Goes Out of Style",
-            "Your Best Health Starts with H2O",
-            "Sip Your Way to Wellness"
-        ]
-        
         self._setup_window()
         self._create_ui()
         self._setup_animations()
@@ -378,10 +711,9 @@ class OverlayWindow(QtWidgets.QWidget):
             QtCore.Qt.WindowType.WindowStaysOnTopHint |
             QtCore.Qt.WindowType.NoDropShadowWindowHint
         )
+        # WA_TranslucentBackground already implies WA_NoSystemBackground
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_NoSystemBackground)
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_ShowWithoutActivating)
-        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
         self.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
         
         # Fixed size for overlay (will be updated based on shape)
@@ -394,12 +726,22 @@ class OverlayWindow(QtWidgets.QWidget):
         """Setup timer for background brightness detection"""
         self._bg_check_timer = QtCore.QTimer(self)
         self._bg_check_timer.timeout.connect(self._check_background_and_switch_theme)
+        self._last_bg_region = None  # (x, y, w, h) of the last analysed capture
+        self._last_bg_ts = 0.0
+        
+        # Brightness is computed on a pool thread; only the grab and theme swap run here
+        self._bg_pool = QtCore.QThreadPool.globalInstance()
+        self._bg_worker_busy = False
+        self._bg_signals = _BrightnessSignals(self)
+        self._bg_signals.done.connect(self._apply_background_brightness)
+        if self.theme_manager.auto_switch_enabled:
+            self._bg_pool.start(_warm_up_brightness)
         # Disabled by default - user's manual theme choice should persist
         # self._bg_check_timer.start(2000)  # Check every 2 seconds
         
     def _check_background_and_switch_theme(self):
-        """Detect background brightness and switch theme dynamically"""
-        if not self.theme_manager.auto_switch_enabled:
+        """Capture the background behind the overlay and queue its brightness analysis"""
+        if not self.theme_manager.auto_switch_enabled or self._bg_worker_busy:
             return
             
         try:
@@ -414,89 +756,71 @@ class OverlayWindow(QtWidgets.QWidget):
             w = self.width()
             h = self.height()
             
-            pixmap = screen.grabWindow(0, x, y, w, h)
-            image = pixmap.toImage()
-            
-            # Sample pixels to determine average brightness
-            total_brightness = 0
-            sample_count = 0
-            step = 10  # Sample every 10 pixels
-            
-            for py in range(0, h, step):
-                for px in range(0, w, step):
-                    if px < image.width() and py < image.height():
-                        color = image.pixelColor(px, py)
-                        # Calculate perceived brightness
-                        brightness = (0.299 * color.red() + 0.587 * color.green() + 0.114 * color.blue())
-                        total_brightness += brightness
-                        sample_count += 1
+            # Skip re-analysing an unmoved overlay for 10 seconds
+            region = (x, y, w, h)
+            now = time.monotonic()
+            if region == self._last_bg_region and now - self._last_bg_ts < 10:
+                return
+            self._last_bg_region = region
+            self._last_bg_ts = now
             
-            if sample_count == 0:
+            # Downscale natively before converting, so only ~1/100 of the pixels reach Python
+            pixmap = screen.grabWindow(0, x, y, w, h).scaled(
+                max(16, w // 10), max(16, h // 10),
+                QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+                QtCore.Qt.TransformationMode.FastTransformation
+            )
+            image = pixmap.toImage().convertToFormat(QtGui.QImage.Format.Format_RGB32)
+            if image.isNull() or image.width() == 0 or image.height() == 0:
                 return
-                
-            avg_brightness = total_brightness / sample_count
             
-            # Switch theme based on brightness
-            # If background is dark (< 128), use light theme
-            # If background is light (>= 128), use dark theme
-            if avg_brightness < 128:
-                new_theme = 'Dark Glassmorphic'  # Light overlay on dark background
-            else:
-                new_theme = 'Light Glassmorphic'  # Dark overlay on light background
+            # Hand the small capture to a worker; the result comes back via _apply_background_brightness
+            self._bg_worker_busy = True
+            self._bg_pool.start(_BgBrightnessWorker(image, self._bg_signals))
             
-            # Only update if theme changed
-            if self.theme_manager.current_theme != new_theme:
-                self.theme_manager.set_theme(new_theme)
-                self._update_theme_colors()
-                
         except Exception as e:
             print(f"[Overlay] Background detection error: {e}")
     
+    def _apply_background_brightness(self, avg_brightness):
+        """Switch theme from a worker's brightness result (runs on the GUI thread)"""
+        self._bg_worker_busy = False
+        if avg_brightness < 0:
+            return
+        
+        # Switch theme based on brightness
+        # If background is dark (< 128), use light theme
+        # If background is light (>= 128), use dark theme
+        if avg_brightness < 128:
+            new_theme = 'Dark Glassmorphic'  # Light overlay on dark background
+        else:
+            new_theme = 'Light Glassmorphic'  # Dark overlay on light background
+        
+        # Only update if theme changed
+        if self.theme_manager.current_theme != new_theme:
+            self.theme_manager.set_theme(new_theme)
+            self._update_theme_colors()
+    
     def _update_theme_colors(self):
         """Update overlay colors based on current theme"""
         # Update stylesheets
-        self._bg_box.setStyleSheet(self.theme_manager.get_overlay_stylesheet())
-        self._container.setStyleSheet(self.theme_manager.get_overlay_stylesheet())
+        overlay_qss = self.theme_manager.get_overlay_stylesheet()
+        self._bg_box.setStyleSheet(overlay_qss)
+        self._container.setStyleSheet(overlay_qss)
         
-        # Update text colors
-        theme = self.theme_manager.get_theme()
+        # Update text colors (strings are cached per theme, so flipping back re-uses them)
+        consumed_qss, message_qss, menu_qss = _text_stylesheets(self.theme_manager)
         
         if hasattr(self, '_consumed_label'):
-            self._consumed_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {theme['text_primary']};
-                    font-size: 18px;
-                    font-weight: 700;
-                    background: transparent;
-                }}
-            """)
+            self._consumed_label.setStyleSheet(consumed_qss)
         
         if hasattr(self, '_message_label'):
-            self._message_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {theme['text_secondary']};
-                    font-size: 10px;
-                    font-weight: 500;
-                    background: transparent;
-                    letter-spacing: 0.5px;
-                }}
-            """)
+            self._message_label.setStyleSheet(message_qss)
         
         if hasattr(self, '_menu_button'):
-            self._menu_button.setStyleSheet(f"""
-                QToolButton {{
-                    background: {theme['button_bg']};
-                    color: {theme['text_secondary']};
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 16px;
-                    font-weight: 600;
-                }}
-                QToolButton:hover {{
-                    background: {theme['button_hover']};
-                    color: {theme['text_primary']};
-                }}
-            """)
+            self._menu_button.setStyleSheet(menu_qss)
+        
+        if hasattr(self, '_info_label'):
+            self._info_label.update()
         
         # Update progress widget
         if hasattr(self, '_progress_widget'):
@@ -518,12 +842,12 @@ class OverlayWindow(QtWidgets.QWidget):
         self._bg_opacity_effect = QtWidgets.QGraphicsOpacityEffect(self._bg_box)
         self._bg_opacity_effect.setOpacity(0.0)
         self._bg_box.setGraphicsEffect(self._bg_opacity_effect)
+        self._bg_box.hide()
         
         # Main container
         container = QtWidgets.QFrame(self)
         container.setObjectName("overlayContainer")
         container.setStyleSheet(self.theme_manager.get_overlay_stylesheet())
-        container.installEventFilter(self)
         main_layout.addWidget(container)
         self._container = container
         
@@ -531,6 +855,7 @@ class OverlayWindow(QtWidgets.QWidget):
         self._create_all_widgets(container)
         
         # Apply initial layout using LayoutManager
+        self._layout_manager.bind()
         self._layout_manager.set_preferred_layout(self._window_shape)
         self._layout_manager.apply_layout(self._window_shape)
         
@@ -564,7 +889,7 @@ class OverlayWindow(QtWidgets.QWidget):
         self._menu_button.clicked.connect(self._show_menu)
         
         # Message label (rotating motivational messages)
-        self._message_label = QtWidgets.QLabel(self._motivational_messages[0])
+        self._message_label = QtWidgets.QLabel(_MOTIVATIONAL_MESSAGES[0])
         self._message_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self._message_label.setStyleSheet("""
             QLabel {
@@ -577,8 +902,24 @@ class OverlayWindow(QtWidgets.QWidget):
             }
         """)
         
+        # Drink Now / Snooze buttons are only needed once an alert fires; see _ensure_alert_widgets
+        self._drink_button = None
+        self._snooze_button = None
+        
+        # Info label (alternates between consumed and countdown on hover)
+        self._info_label = _InfoLabel("0ml / 2000ml")
+        self._info_label.setVisible(False)
+        
+        # Store countdown text for alternating display
+        self._countdown_text = "Next: --:--"
+    
+    def _ensure_alert_widgets(self):
+        """Create the alert buttons on first use and hand them to the layout manager"""
+        if self._drink_button is not None:
+            return
+        
         # Drink Now button (hidden initially)
-        self._drink_button = QtWidgets.QPushButton("Drink Now")
+        self._drink_button = QtWidgets.QPushButton("Drink Now", self._container)
         self._drink_button.setFixedSize(87, 32)
         self._drink_button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
         self._drink_button.setStyleSheet("""
@@ -615,7 +956,7 @@ class OverlayWindow(QtWidgets.QWidget):
         self._drink_button.setVisible(False)
         
         # Snooze button (hidden initially)
-        self._snooze_button = QtWidgets.QPushButton("Snooze")
+        self._snooze_button = QtWidgets.QPushButton("Snooze", self._container)
         self._snooze_button.setFixedSize(69, 32)
         self._snooze_button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
         self._snooze_button.setStyleSheet("""
@@ -651,27 +992,7 @@ class OverlayWindow(QtWidgets.QWidget):
         self._snooze_button.clicked.connect(self.snooze_clicked.emit)
         self._snooze_button.setVisible(False)
         
-        # Info label (alternates between consumed and countdown on hover)
-        self._info_label = QtWidgets.QLabel("0ml / 2000ml")
-        self._info_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
-        self._info_label.setFixedWidth(110)
-        self._info_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255,255,255,250);
-                font-size: 11px;
-                font-weight: 600;
-                font-family: 'Segoe UI Variable Display', 'Segoe UI', system-ui;
-                background-color: transparent;
-                background: transparent;
-                border: none;
-                padding: 2px 4px;
-            }
-        """)
-        self._info_label.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        self._info_label.setVisible(False)
-        
-        # Store countdown text for alternating display
-        self._countdown_text = "Next: --:--"
+        self._layout_manager.refresh_widgets()
     
     def _update_bg_box_geometry(self):
         """Update background box geometry based on current window shape"""
@@ -689,36 +1010,58 @@ class OverlayWindow(QtWidgets.QWidget):
         self._bg_box_anim = QtCore.QPropertyAnimation(self._bg_opacity_effect, b"opacity", self)
         self._bg_box_anim.setDuration(350)
         self._bg_box_anim.setEasingCurve(QtCore.QEasingCurve.Type.InOutQuad)
-        
-        # Drink button fade animation
-        self._drink_button_anim = QtCore.QPropertyAnimation(self._drink_button, b"maximumHeight", self)
-        self._drink_button_anim.setDuration(300)
-        self._drink_button_anim.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
+        self._bg_box_anim.finished.connect(self._on_bg_box_faded)
         
         # Info label - no animations, just show/hide
         
     def _setup_timers(self):
-        """Setup timers for message rotation and topmost enforcement"""
-        # Message rotation timer (15 seconds)
-        self._message_timer = QtCore.QTimer(self)
-        self._message_timer.timeout.connect(self._rotate_message)
-        self._message_timer.start(15000)
-        
-        # Info alternation timer (2 seconds) - switches between consumed and countdown
-        self._info_alternation_timer = QtCore.QTimer(self)
-        self._info_alternation_timer.timeout.connect(self._alternate_info_display)
-        
-        # Always-on-top enforcement timer (4 seconds)
-        if sys.platform == "win32":
-            self._topmost_timer = QtCore.QTimer(self)
-            self._topmost_timer.timeout.connect(self._ensure_topmost)
-            self._topmost_timer.start(4000)
+        """Setup the shared tick for message rotation, info alternation and topmost enforcement"""
+        # One coarse 2 s tick fans out to the periodic jobs instead of three separate timers;
+        # it only runs while the overlay is visible (see showEvent/hideEvent)
+        self._master_timer = QtCore.QTimer(self)
+        self._master_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        self._master_timer.setInterval(2000)
+        self._master_timer.timeout.connect(self._on_master_tick)
+        self._tick = 0
+        self._info_alternating = False  # Set while hovered in layouts with the info label
+        
+        # Hover debounce: enter/leave crossings only record the latest state and
+        # restart this timer, so fast cursor motion settles into one transition
+        self._hover_state_timer = QtCore.QTimer(self)
+        self._hover_state_timer.setSingleShot(True)
+        self._hover_state_timer.setInterval(80)
+        self._hover_state_timer.timeout.connect(self._apply_hover_state)
+        self._pending_hover = False
+        
+        # Coalesces consumption updates into one label/ring refresh per frame
+        self._consumption_apply_timer = QtCore.QTimer(self)
+        self._consumption_apply_timer.setSingleShot(True)
+        self._consumption_apply_timer.setInterval(16)
+        self._consumption_apply_timer.timeout.connect(self._apply_consumption)
+        
+    def _on_master_tick(self):
+        """Dispatch the periodic overlay jobs from the shared 2 s tick"""
+        self._tick += 1
+        
+        # Info alternation (every tick) - switches between consumed and countdown
+        if self._info_alternating:
+            self._alternate_info_display()
+        
+        # Always-on-top enforcement: a 30 s safety net when the foreground hook
+        # is installed, otherwise every 4 seconds
+        topmost_every = 15 if self._foreground_hook else 2
+        if self._tick % topmost_every == 0 and sys.platform == "win32":
+            self._ensure_topmost()
+        
+        # Message rotation (16 seconds); the message is hidden during alerts
+        if self._tick % 8 == 0 and not self._alert_mode:
+            self._rotate_message()
             
     def _rotate_message(self):
         """Rotate to next motivational message"""
         if not self._alert_mode:
-            self._current_message_index = (self._current_message_index + 1) % len(self._motivational_messages)
-            self._message_label.setText(self._motivational_messages[self._current_message_index])
+            self._current_message_index = (self._current_message_index + 1) % len(_MOTIVATIONAL_MESSAGES)
+            self._message_label.setText(_MOTIVATIONAL_MESSAGES[self._current_message_index])
     
     def set_smart_message(self, message: str):
         """Set a smart message (AI prediction or context-aware)"""
@@ -732,60 +1075,123 @@ class OverlayWindow(QtWidgets.QWidget):
             
             # Determine new text
             if self._show_consumed:
-                new_text = f"{self._current_consumed}ml / {self._current_goal}ml"
+                new_text = self._consumption_text
             else:
                 new_text = self._countdown_text
             
             # Update text and ensure visible
             self._info_label.setText(new_text)
             self._info_label.setVisible(True)
-            self._info_label.update()
             
-    def _ensure_topmost(self):
-        """Ensure window stays on top using Win32 API"""
-        if sys.platform == "win32":
-            try:
-                import ctypes
-                hwnd = int(self.winId())
-                # HWND_TOPMOST = -1, SWP_NOMOVE | SWP_NOSIZE = 0x0013
-                ctypes.windll.user32.SetWindowPos(hwnd, -1, 0, 0, 0, 0, 0x0013)
-            except:
-                pass
+    def _ensure_topmost(self, force=False):
+        """Ensure window stays on top using Win32 API (skipped while WS_EX_TOPMOST is still set)"""
+        if sys.platform != "win32":
+            return
+        set_window_pos, get_window_long = _topmost_api()
+        if self._hwnd is None:
+            self._hwnd = int(self.winId())
+        
+        # Re-assert unconditionally on a foreground change and every 15th call,
+        # in case another topmost window has been placed above ours
+        self._topmost_calls += 1
+        if (not force and get_window_long(self._hwnd, _GWL_EXSTYLE) & _WS_EX_TOPMOST
+                and self._topmost_calls % 15):
+            return
+        if not set_window_pos(self._hwnd, _HWND_TOPMOST, 0, 0, 0, 0, _SWP_TOPMOST_FLAGS):
+            print("[Overlay] SetWindowPos failed to re-assert topmost")
                 
+    def _install_foreground_hook(self):
+        """Re-assert topmost whenever another window comes to the foreground (Windows only)"""
+        if sys.platform != "win32" or self._foreground_hook:
+            return
+        try:
+            win_event_proc = ctypes.WINFUNCTYPE(
+                None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+            )
+            
+            def on_foreground(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+                # Out-of-context hooks are delivered on this (GUI) thread's message loop;
+                # queue the re-assert so it runs after the foreground switch settles
+                if hwnd != self._hwnd:
+                    QtCore.QTimer.singleShot(0, lambda: self._ensure_topmost(force=True))
+            
+            user32 = _user32()
+            user32.SetWinEventHook.argtypes = [
+                wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, win_event_proc,
+                wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+            ]
+            user32.SetWinEventHook.restype = wintypes.HANDLE
+            self._foreground_proc = win_event_proc(on_foreground)
+            # EVENT_SYSTEM_FOREGROUND = 0x0003, WINEVENT_OUTOFCONTEXT = 0x0000
+            self._foreground_hook = user32.SetWinEventHook(
+                0x0003, 0x0003, None, self._foreground_proc, 0, 0, 0x0000
+            )
+        except Exception as e:
+            print(f"[Overlay] Foreground hook error: {e}")
+            self._foreground_hook = None
+    
+    def _remove_foreground_hook(self):
+        """Unregister the foreground-change hook installed by _install_foreground_hook"""
+        if not self._foreground_hook:
+            return
+        try:
+            unhook = _user32().UnhookWinEvent
+            unhook.argtypes = [wintypes.HANDLE]
+            unhook.restype = wintypes.BOOL
+            unhook(self._foreground_hook)
+        except Exception as e:
+            print(f"[Overlay] Foreground unhook error: {e}")
+        self._foreground_hook = None
+        self._foreground_proc = None
+    
     def _animate_opacity(self, target_opacity):
-        """Smoothly animate window opacity"""
-        self._fade_anim.stop()
-        self._fade_anim.setStartValue(self.windowOpacity())
-        self._fade_anim.setEndValue(target_opacity)
-        self._fade_anim.start()
+        """Smoothly animate window opacity (no-op if already at or heading to the target)"""
+        self._animate_towards(self._fade_anim, self.windowOpacity(), target_opacity)
+    
+    def _animate_bg_box(self, target_opacity):
+        """Fade the hover background box (no-op if already at or heading to the target)"""
+        # The effect renders the box offscreen every frame, so it is only enabled while fading
+        if self._animate_towards(self._bg_box_anim, self._bg_opacity_effect.opacity(), target_opacity):
+            self._bg_opacity_effect.setEnabled(True)
+            self._bg_box.show()
+    
+    def _on_bg_box_faded(self):
+        """Hide the box when faded out, or drop the opacity effect once fully opaque"""
+        if self._bg_opacity_effect.opacity() < 0.005:
+            self._bg_box.hide()
+        else:
+            self._bg_opacity_effect.setEnabled(False)
+    
+    @staticmethod
+    def _animate_towards(anim, current, target):
+        """Restart an opacity animation from its current value; returns False for redundant restarts"""
+        if anim.state() == QtCore.QAbstractAnimation.State.Running:
+            if abs(anim.endValue() - target) < 0.005:
+                return False
+        elif abs(current - target) < 0.005:
+            return False
+        anim.stop()
+        anim.setStartValue(current)
+        anim.setEndValue(target)
+        anim.start()
+        return True
         
     def _show_menu(self):
-        """Show context menu with drink presets and settings"""
+        """Show context menu with drink presets and settings (built once, then reused)"""
+        if self._menu is None:
+            self._menu = self._build_menu()
+        elif self._menu.isVisible():
+            return
+        
+        # Show menu below menu button
+        pos = self._menu_button.mapToGlobal(QtCore.QPoint(0, self._menu_button.height()))
+        self._menu.exec(pos)
+    
+    def _build_menu(self):
+        """Create the drink presets / settings menu"""
         menu = QtWidgets.QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background: rgba(30,30,40,240);
-                color: rgba(255,255,255,250);
-                border: 1px solid rgba(255,255,255,90);
-                border-radius: 8px;
-                padding: 6px;
-                font-size: 11px;
-                font-family: 'Segoe UI Variable Display', 'Segoe UI', system-ui;
-            }
-            QMenu::item {
-                padding: 8px 24px 8px 12px;
-                border-radius: 4px;
-                margin: 2px;
-            }
-            QMenu::item:selected {
-                background: rgba(255,255,255,25);
-            }
-            QMenu::separator {
-                height: 1px;
-                background: rgba(255,255,255,15);
-                margin: 4px 8px;
-            }
-        """)
+        menu.setStyleSheet(self._MENU_QSS)
         
         # Drink preset actions
         menu.addAction("Drink 100ml", lambda: self.manual_drink_requested.emit(100))
@@ -795,55 +1201,31 @@ class OverlayWindow(QtWidgets.QWidget):
         menu.addSeparator()
         
         # Custom amount action
-        custom_action = menu.addAction("Custom Amount...", self._show_custom_dialog)
+        menu.addAction("Custom Amount...", self._show_custom_dialog)
         menu.addSeparator()
         
         # Settings action
         menu.addAction("Settings", self.settings_requested.emit)
-        
-        # Show menu below menu button
-        pos = self._menu_button.mapToGlobal(QtCore.QPoint(0, self._menu_button.height()))
-        menu.exec(pos)
+        return menu
         
     def _show_custom_dialog(self):
-        """Show dialog for custom water amount"""
+        """Show dialog for custom water amount (built once, then reused)"""
+        if self._custom_dialog is None:
+            self._custom_dialog = self._build_custom_dialog()
+        elif self._custom_dialog.isVisible():
+            return
+        
+        self._custom_spinbox.setValue(250)
+        if self._custom_dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
+            self.manual_drink_requested.emit(self._custom_spinbox.value())
+    
+    def _build_custom_dialog(self):
+        """Create the custom amount dialog; its spinbox is kept as _custom_spinbox"""
         dialog = QtWidgets.QDialog(self)
         dialog.setWindowTitle("Custom Amount")
         dialog.setModal(True)
         dialog.setFixedSize(280, 140)
-        dialog.setStyleSheet("""
-            QDialog {
-                background: rgba(30,30,40,250);
-                border: 1px solid rgba(255,255,255,90);
-                border-radius: 12px;
-            }
-            QLabel {
-                color: rgba(255,255,255,250);
-                font-size: 12px;
-                font-weight: 600;
-                font-family: 'Segoe UI Variable Display', 'Segoe UI', system-ui;
-            }
-            QSpinBox {
-                background: rgba(255,255,255,15);
-                color: rgba(255,255,255,250);
-                border: 1px solid rgba(255,255,255,50);
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 11px;
-            }
-            QPushButton {
-                background: rgba(255,255,255,25);
-                color: rgba(255,255,255,250);
-                border: 1px solid rgba(255,255,255,50);
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 11px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: rgba(255,255,255,35);
-            }
-        """)
+        dialog.setStyleSheet(self._DIALOG_QSS)
         
         layout = QtWidgets.QVBoxLayout(dialog)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -870,8 +1252,8 @@ class OverlayWindow(QtWidgets.QWidget):
         button_layout.addWidget(cancel_button)
         layout.addLayout(button_layout)
         
-        if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
-            self.manual_drink_requested.emit(spinbox.value())
+        self._custom_spinbox = spinbox
+        return dialog
             
     def _handle_hover_enter(self):
         """Consolidated hover enter logic"""
@@ -881,40 +1263,58 @@ class OverlayWindow(QtWidgets.QWidget):
         # Fade in background box only in rectangular mode
         # In circular mode the bg_box corners are visible outside the circle
         if self._window_shape != 'circular':
-            self._bg_box_anim.stop()
-            self._bg_box_anim.setStartValue(self._bg_opacity_effect.opacity())
-            self._bg_box_anim.setEndValue(1.0)
-            self._bg_box_anim.start()
+            self._animate_bg_box(1.0)
         
         # Only show info/close in rectangular mode
         if self._layout_manager.should_show_info_label():
             # Show info label and start alternation
             self._show_consumed = True
-            self._info_label.setText(f"{self._current_consumed}ml / {self._current_goal}ml")
+            self._info_label.setText(self._consumption_text)
             self._info_label.setVisible(True)
-            self._info_alternation_timer.start(2000)
+            self._info_alternating = True
     
+    def showEvent(self, event):
+        """Notify the controller so display-only timers run only while visible"""
+        super().showEvent(event)
+        self._master_timer.start()
+        self._install_foreground_hook()
+        self.shown.emit()
+        
+    def hideEvent(self, event):
+        """Notify the controller that the overlay is no longer visible"""
+        super().hideEvent(event)
+        self._master_timer.stop()
+        self._remove_foreground_hook()
+        self.hidden.emit()
+        
     def enterEvent(self, event):
         """Handle mouse entering the overlay widget"""
-        self._handle_hover_enter()
+        self._request_hover(True)
         super().enterEvent(event)
         
     def leaveEvent(self, event):
         """Handle mouse leaving the overlay widget"""
-        QtCore.QTimer.singleShot(100, self._check_and_hide)
+        self._request_hover(False)
         super().leaveEvent(event)
         
-    def eventFilter(self, watched, event):
-        """Handle hover events for container"""
-        if hasattr(self, "_container") and watched == self._container:
-            if event.type() == QtCore.QEvent.Type.Enter:
+    def _request_hover(self, hovered):
+        """Record the latest hover state and (re)start the debounce timer"""
+        self._pending_hover = hovered
+        self._hover_state_timer.start()
+    
+    def _apply_hover_state(self):
+        """Run the hover enter/exit transition once the cursor has settled"""
+        if self._pending_hover:
+            if not self._is_hovered:
                 self._handle_hover_enter()
-            elif event.type() == QtCore.QEvent.Type.Leave:
-                QtCore.QTimer.singleShot(100, self._check_and_hide)
-        return super().eventFilter(watched, event)
+        else:
+            self._check_and_hide()
         
     def _check_and_hide(self):
         """Check if mouse is truly outside and hide elements"""
+        if not self._is_hovered:
+            return  # Already hidden
+        
         cursor_pos = QtGui.QCursor.pos()
         widget_rect = self.rect()
         local_pos = self.mapFromGlobal(cursor_pos)
@@ -925,21 +1325,35 @@ class OverlayWindow(QtWidgets.QWidget):
                 self._animate_opacity(0.65)
                 
             # Fade out background box
-            self._bg_box_anim.stop()
-            self._bg_box_anim.setStartValue(self._bg_opacity_effect.opacity())
-            self._bg_box_anim.setEndValue(0.0)
-            self._bg_box_anim.start()
+            self._animate_bg_box(0.0)
             
-            # Hide info label and stop alternation (only if should be shown)
+            # Stop alternation; hide info label (only if it is a hover-only element)
+            self._info_alternating = False
             if self._layout_manager.should_show_info_label():
                 self._info_label.setVisible(False)
-                self._info_alternation_timer.stop()
             
     def mousePressEvent(self, event):
         """Handle mouse press for drag-to-move"""
         if event.button() == QtCore.Qt.MouseButton.LeftButton:
+            if sys.platform == 'win32' and self._start_native_drag():
+                # The move loop has ended; report where it left the window
+                self.position_changed.emit(self.x(), self.y())
+                return
             self._drag_active = True
             self._drag_offset = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+    
+    def _start_native_drag(self):
+        """Hand the drag to the system move loop; returns once the button is released"""
+        try:
+            if self._hwnd is None:
+                self._hwnd = int(self.winId())
+            release_capture, send_message = _drag_api()
+            release_capture()
+            send_message(self._hwnd, _WM_NCLBUTTONDOWN, _HTCAPTION, 0)
+        except Exception as e:
+            print(f"[Overlay] Native drag failed: {e}")
+            return False
+        return True
             
     def mouseMoveEvent(self, event):
         """Handle mouse move for drag-to-move"""
@@ -962,12 +1376,11 @@ class OverlayWindow(QtWidgets.QWidget):
         # Stop any existing loop
         self._sound_loop_timer.stop()
         self._current_sound_path = custom_sound_path
+        if winsound is None:
+            return  # winsound and MCI are Windows-only
             
         if custom_sound_path and os.path.exists(custom_sound_path):
             try:
-                import winsound
-                import ctypes
-                
                 # Use MCI for MP3/other formats, fallback to winsound for WAV
                 if custom_sound_path.lower().endswith('.wav'):
                     flags = winsound.SND_FILENAME | winsound.SND_ASYNC
@@ -976,86 +1389,82 @@ class OverlayWindow(QtWidgets.QWidget):
                     winsound.PlaySound(custom_sound_path, flags)
                 else:
                     # Use Windows MCI for MP3/OGG/FLAC
-                    winmm = ctypes.windll.winmm
-                    winmm.mciSendStringW(f'close alertsound', None, 0, None)  # Close previous
-                    winmm.mciSendStringW(f'open "{custom_sound_path}" type mpegvideo alias alertsound', None, 0, None)
+                    mci = _mci_send()
+                    mci(_MCI_CLOSE, None, 0, None)  # Close previous
+                    mci(f'open "{custom_sound_path}" type mpegvideo alias alertsound', None, 0, None)
                     
-                    if loop:
-                        # Set up loop timer for non-WAV files
-                        winmm.mciSendStringW('play alertsound from 0', None, 0, None)
+                    if not loop:
+                        mci(_MCI_PLAY, None, 0, None)
+                    elif mci(_MCI_PLAY_REPEAT, None, 0, None) != 0:
+                        # The mpegvideo device loops by itself when "repeat" succeeds (returns 0);
+                        # otherwise play once and replay from a loop timer
+                        mci(_MCI_PLAY, None, 0, None)
                         
                         # Get duration
                         buffer = ctypes.create_unicode_buffer(255)
-                        winmm.mciSendStringW('status alertsound length', buffer, 254, None)
+                        mci(_MCI_LENGTH, buffer, 254, None)
                         try:
                             duration_ms = int(buffer.value)
                             self._sound_loop_timer.start(duration_ms + 100)  # Add small gap
-                        except:
+                        except ValueError:
                             pass
-                    else:
-                        winmm.mciSendStringW('play alertsound from 0', None, 0, None)
-            except Exception as e:
+            except (OSError, RuntimeError) as e:
                 print(f"[Overlay] Failed to play custom sound: {e}")
                 try:
-                    import winsound
                     winsound.MessageBeep(winsound.MB_ICONASTERISK)
-                except:
+                except RuntimeError:
                     pass
         else:
             try:
-                import winsound
                 winsound.MessageBeep(winsound.MB_ICONASTERISK)
-            except:
+            except RuntimeError:
                 pass
     
     def _replay_sound_internal(self):
         """Replay sound for looping (internal method)"""
         try:
-            import ctypes
-            winmm = ctypes.windll.winmm
-            winmm.mciSendStringW('play alertsound from 0', None, 0, None)
-        except:
+            _mci_send()(_MCI_PLAY, None, 0, None)
+        except OSError:
             pass
     
     def stop_alert_sound(self):
         """Stop any playing alert sound"""
         self._sound_loop_timer.stop()
         self._current_sound_path = None
+        if winsound is None:
+            return
         
         try:
-            import winsound
-            import ctypes
-            
             # Stop WAV playback
             winsound.PlaySound(None, winsound.SND_PURGE)
             
             # Stop MCI playback
-            winmm = ctypes.windll.winmm
-            winmm.mciSendStringW('stop alertsound', None, 0, None)
-            winmm.mciSendStringW('close alertsound', None, 0, None)
-        except:
+            mci = _mci_send()
+            mci(_MCI_STOP, None, 0, None)
+            mci(_MCI_CLOSE, None, 0, None)
+        except (OSError, RuntimeError):
             pass
     
     def set_alert_mode(self, enabled, custom_sound_path=None, loop_sound=False):
         """Toggle alert mode (time to drink)"""
         self._alert_mode = enabled
+        if enabled:
+            self._ensure_alert_widgets()
         
         # Use LayoutManager to handle alert mode transitions
         self._layout_manager.set_alert_mode(enabled)
         
         if enabled:
-            # Alert state - hide message but show consumption info
+            # Alert state - hide message but show consumption info (held, not alternating)
+            self._info_alternating = False
             self._message_label.setVisible(False)
-            self._info_label.setText(f"{self._current_consumed}ml / {self._current_goal}ml")
+            self._info_label.setText(self._consumption_text)
             self._info_label.setVisible(True)
             
             self._animate_opacity(1.0)
             
             # Glow effect
-            self._bg_box_anim.stop()
-            self._bg_box_anim.setStartValue(self._bg_opacity_effect.opacity())
-            self._bg_box_anim.setEndValue(1.0)
-            self._bg_box_anim.start()
+            self._animate_bg_box(1.0)
             
             # Play sound
             self.play_alert_sound(custom_sound_path, loop_sound)
@@ -1067,34 +1476,43 @@ class OverlayWindow(QtWidgets.QWidget):
             # Show message label based on layout
             if self._layout_manager.should_show_message_label():
                 self._message_label.setVisible(True)
-                self._message_label.setText(self._motivational_messages[self._current_message_index])
+                self._message_label.setText(_MOTIVATIONAL_MESSAGES[self._current_message_index])
             
             if not self._is_hovered:
                 self._animate_opacity(0.65)
-                self._bg_box_anim.stop()
-                self._bg_box_anim.setStartValue(self._bg_opacity_effect.opacity())
-                self._bg_box_anim.setEndValue(0.0)
-                self._bg_box_anim.start()
+                self._animate_bg_box(0.0)
+            elif self._layout_manager.should_show_info_label():
+                self._info_alternating = True  # Still hovered: resume alternation
                 
     def update_countdown(self, text):
-        """Update countdown text (only in non-alert mode)"""
-        if not self._alert_mode:
-            self._countdown_text = text
-            # Update display ONLY if currently showing countdown AND hovered AND in rectangular mode
-            if self._is_hovered and not self._show_consumed and self._layout_manager.should_show_info_label():
-                self._info_label.setText(text)
+        """Update countdown text (only in non-alert mode, and only when it changed)"""
+        if self._alert_mode or text == self._countdown_text:
+            return
+        self._countdown_text = text
+        # Update display ONLY if currently showing countdown AND hovered AND in rectangular mode
+        if self._is_hovered and not self._show_consumed and self._layout_manager.should_show_info_label():
+            self._info_label.setText(text)
             
     def update_consumption(self, consumed, goal):
-        """Update consumption display"""
-        self._current_consumed = consumed
-        self._current_goal = goal
-        
+        """Update consumption state now; the label and ring follow within one frame"""
+        if consumed != self._current_consumed or goal != self._current_goal:
+            self._current_consumed = consumed
+            self._current_goal = goal
+            self._consumption_text = f"{consumed}ml / {goal}ml"
+        
+        # A burst of updates (e.g. several logs in one turn) restarts the timer and
+        # is applied once, with the latest values
+        self._consumption_apply_timer.start()
+    
+    def _apply_consumption(self):
+        """Push the latest consumption to the info label and progress ring"""
         # Update display ONLY if currently showing consumed AND hovered
         if self._is_hovered and self._show_consumed:
-            self._info_label.setText(f"{consumed}ml / {goal}ml")
+            self._info_label.setText(self._consumption_text)
         
         # Update progress ring
-        percentage = (consumed / goal * 100) if goal > 0 else 0
+        goal = self._current_goal
+        percentage = (self._current_consumed / goal * 100) if goal > 0 else 0
         self._progress_widget.set_progress(percentage)
         
     def flash_success(self):
@@ -1106,22 +1524,28 @@ class OverlayWindow(QtWidgets.QWidget):
         # Return to previous state after 300ms
         QtCore.QTimer.singleShot(300, lambda: self._animate_opacity(current_opacity))
     
+    def apply_drink(self, consumed, goal, celebrate=False):
+        """Show a logged drink: consumption, success flash and confetti"""
+        self.update_consumption(consumed, goal)
+        self.flash_success()
+        if celebrate:
+            self.celebrate_goal()
+    
     def celebrate_goal(self):
         """Trigger confetti celebration animation"""
-        # Position confetti widget at screen center
+        # Position confetti widget at screen center; particles never fall past
+        # MAX_FALL, so the (composited) window need not be any taller
         screen = QtWidgets.QApplication.primaryScreen().geometry()
         confetti_width = screen.width()
-        confetti_height = screen.height()
+        confetti_height = min(screen.height(), MAX_FALL + 20)
         self._confetti.start_celebration(confetti_width, confetti_height)
     
     def set_theme(self, theme_name):
         """Change the overlay theme"""
         self.theme_manager.set_theme(theme_name)
-        # Update all theme-dependent colors immediately
+        # Update all theme-dependent colors immediately; this also schedules the
+        # progress ring's repaint (it shares this theme manager)
         self._update_theme_colors()
-        # Update progress widget theme
-        self._progress_widget.theme_manager = self.theme_manager
-        self._progress_widget.update()
     
     def set_window_shape(self, shape, save_preference=True):
         """Change window shape between rectangular and circular"""
@@ -4,8 +4,408 @@ Accessible from overlay context menu
 """
 
 import os
+import ctypes
+from functools import partial
 from PySide6 import QtWidgets, QtCore, QtGui
-from core.auto_launch import is_auto_launch_enabled, enable_auto_launch, disable_auto_launch
+
+try:
+    import winsound
+except ImportError:  # Not on Windows; sound tests fall back to the message boxes
+    winsound = None
+
+# Window icon, loaded on first open and reused by every later dialog
+_ICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.png')
+_WINDOW_ICON = None
+
+
+def _window_icon():
+    """Return the cached dialog icon, or None if icon.png is missing"""
+    global _WINDOW_ICON
+    if _WINDOW_ICON is None and os.path.exists(_ICON_PATH):
+        _WINDOW_ICON = QtGui.QIcon(_ICON_PATH)
+    return _WINDOW_ICON
+
+
+# Themes offered in the dialog; one list model is shared by every dialog's combo box
+_THEMES = ('Dark Glassmorphic', 'Wine Red', 'Forest Green', 'Ocean Blue', 'Sunset Orange', 'Midnight Blue')
+_THEME_MODEL = None
+
+# Spin box rows at the top of the form: (row label, widget attr, minimum, maximum, step, suffix)
+_SPIN_ROWS = (
+    ("Daily Goal:", 'goal_spin', 250, 10000, 50, " ml"),
+    ("Reminder Interval:", 'interval_spin', 5, 240, 1, " min"),
+    ("Default Sip Size:", 'sip_spin', 50, 1000, 50, " ml"),
+    ("Snooze Duration:", 'snooze_spin', 5, 30, 1, " min"),
+)
+
+# Goal preset buttons: (label, daily goal in ml)
+_GOAL_PRESETS = (
+    ("Light Activity\n2000ml", 2000),
+    ("Moderate\n2500ml", 2500),
+    ("High Activity\n3000ml", 3000),
+)
+
+
+def _theme_model():
+    """Return the shared theme list model, created on first use"""
+    global _THEME_MODEL
+    if _THEME_MODEL is None:
+        _THEME_MODEL = QtCore.QStringListModel(list(_THEMES))
+    return _THEME_MODEL
+
+
+# Settings that map one-to-one onto a form widget:
+# (settings key, widget attribute, default, getter, setter)
+_FIELDS = (
+    ('daily_goal_ml', 'goal_spin', 2000, 'value', 'setValue'),
+    ('reminder_interval_minutes', 'interval_spin', 60, 'value', 'setValue'),
+    ('default_sip_ml', 'sip_spin', 250, 'value', 'setValue'),
+    ('snooze_duration_minutes', 'snooze_spin', 5, 'value', 'setValue'),
+    ('theme', 'theme_combo', 'Dark Glassmorphic', 'currentText', 'setCurrentText'),
+    ('chime_enabled', 'sound_check', True, 'isChecked', 'setChecked'),
+    ('loop_alert_sound', 'loop_btn', False, 'isChecked', 'setChecked'),
+    ('sleep_start_hour', 'sleep_start_spin', 22, 'value', 'setValue'),
+    ('sleep_end_hour', 'sleep_end_spin', 7, 'value', 'setValue'),
+    ('bedtime_warning_enabled', 'bedtime_warning_check', True, 'isChecked', 'setChecked'),
+)
+
+
+# The whole dialog is styled by one stylesheet; widgets are matched by object name
+_DIALOG_QSS = """
+    /* Dialog background and default label color */
+    QDialog {
+        background: #202124; /* Chrome dark */
+    }
+    QLabel { color: #E8EAED; }
+
+    /* Scroll area and its scroll bars */
+    QScrollArea#settingsScroll {
+        background: transparent;
+        border: none;
+    }
+    QScrollArea#settingsScroll QScrollBar:vertical {
+        background: #202124;
+        width: 6px;
+        border-radius: 3px;
+    }
+    QScrollArea#settingsScroll QScrollBar::handle:vertical {
+        background: #5F6368;
+        border-radius: 3px;
+        min-height: 20px;
+    }
+    QScrollArea#settingsScroll QScrollBar::handle:vertical:hover {
+        background: #8AB4F8;
+    }
+    QScrollArea#settingsScroll QScrollBar::add-line:vertical, QScrollArea#settingsScroll QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+
+    /* Section titles */
+    QLabel#settingsTitle, QLabel#presetsTitle {
+        font-size: 18px;
+        font-weight: 700;
+        color: #E8EAED;
+    }
+    QLabel#presetsTitle {
+        margin: 1px 0px 0px 0px;
+        padding: 0px;
+        background: transparent;
+    }
+
+    /* Scrollable content; the form rows are transparent over it */
+    QWidget#scrollContent, #scrollContent QWidget {
+        background: #202124;
+    }
+    QWidget#settingsForm {
+        background: #202124; /* Chrome dark background */
+        border-radius: 8px;
+        padding: 12px 12px 0px 12px;
+    }
+    /* Form labels (left column) */
+    #settingsForm QLabel { color: #BDC1C6; font-size: 12px; }
+    QWidget#displayModeRow, #displayModeRow QWidget,
+    QWidget#soundFileRow, #soundFileRow QWidget,
+    QWidget#sleepHoursRow, #sleepHoursRow QWidget {
+        background: transparent;
+    }
+
+    /* Spin boxes */
+    QSpinBox#settingsSpin {
+        padding: 6px 10px;
+        border: 2px solid #3C4043;
+        border-radius: 6px;
+        font-size: 13px;
+        background: #2B2B2B;
+        color: #E8EAED;
+    }
+    QSpinBox#settingsSpin:focus {
+        border-color: #5F6368; /* neutral focus */
+    }
+    QSpinBox#settingsSpin::up-button, QSpinBox#settingsSpin::down-button {
+        border: none;
+        background: transparent;
+    }
+
+    /* Theme combo box */
+    QComboBox#themeCombo {
+        padding: 6px 10px;
+        border: 2px solid #3C4043;
+        border-radius: 6px;
+        font-size: 13px;
+        background: #2B2B2B;
+        color: #E8EAED;
+    }
+    QComboBox#themeCombo:focus {
+        border-color: #5F6368; /* neutral focus */
+    }
+    QComboBox#themeCombo::drop-down {
+        border: none;
+        width: 30px;
+    }
+    QComboBox#themeCombo::down-arrow {
+        width: 16px;
+        height: 16px;
+    }
+    /* Popup list view */
+    QComboBox#themeCombo QAbstractItemView {
+        background: #202124;
+        color: #E8EAED;
+        selection-background-color: #3A3B3F;
+        selection-color: #E8EAED;
+        border: 1px solid #3C4043;
+        outline: 0;
+    }
+
+    /* Display mode radio buttons */
+    QRadioButton#displayModeRadio {
+        font-size: 13px;
+        color: #E8EAED;
+        spacing: 8px;
+    }
+    QRadioButton#displayModeRadio::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QRadioButton#displayModeRadio::indicator:unchecked {
+        border: 2px solid #5F6368;
+        border-radius: 9px;
+        background: #2B2B2B;
+    }
+    QRadioButton#displayModeRadio::indicator:checked {
+        border: 2px solid #8AB4F8;
+        border-radius: 9px;
+        background: qradialgradient(cx:0.5, cy:0.5, radius:0.5, fx:0.5, fy:0.5, stop:0 #8AB4F8, stop:0.5 #8AB4F8, stop:0.51 transparent);
+    }
+
+    /* Check boxes */
+    QCheckBox#settingsCheck {
+        font-size: 13px;
+        color: #E8EAED;
+        spacing: 8px; /* gap between box and text */
+        padding-left: 2px; /* ensure text not clipped */
+    }
+    QCheckBox#settingsCheck::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid #3C4043;
+        border-radius: 4px;
+        background: #2B2B2B;
+        margin-right: 8px;
+    }
+    QCheckBox#settingsCheck::indicator:checked {
+        background: #E8EAED; /* neutral check */
+        border-color: #E8EAED;
+    }
+
+    /* Custom sound row */
+    QLabel#soundPathLabel {
+        color: #9AA0A6;
+        font-size: 11px;
+        padding: 4px 8px;
+        background: transparent;
+    }
+    QPushButton#browseButton {
+        padding: 4px 12px;
+        border: 1px solid rgba(60, 64, 67, 200);
+        border-radius: 7px;
+        font-size: 11px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
+        color: #E8EAED;
+    }
+    QPushButton#browseButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
+        border: 1px solid rgba(95, 99, 104, 220);
+    }
+    QPushButton#browseButton:pressed {
+        background: #242628;
+        border: 1px solid rgba(74, 77, 81, 180);
+    }
+    QPushButton#testSoundButton {
+        padding: 0px;
+        border: 1px solid rgba(60, 64, 67, 200);
+        border-radius: 7px;
+        font-size: 12px;
+        font-weight: bold;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
+        color: #E8EAED;
+    }
+    QPushButton#testSoundButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
+        border: 1px solid rgba(95, 99, 104, 220);
+    }
+    QPushButton#testSoundButton:pressed {
+        background: #242628;
+    }
+    QPushButton#loopButton {
+        padding: 0px;
+        border: 1px solid rgba(60, 64, 67, 200);
+        border-radius: 7px;
+        font-size: 16px;
+        font-weight: bold;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
+        color: #E8EAED;
+    }
+    QPushButton#loopButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
+        border: 1px solid rgba(95, 99, 104, 220);
+    }
+    QPushButton#loopButton:checked {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
+        border: 1px solid rgba(138, 180, 248, 240);
+        color: #8AB4F8;
+    }
+    QPushButton#loopButton:pressed {
+        background: #242628;
+    }
+    QPushButton#clearSoundButton {
+        padding: 0px;
+        border: 1px solid rgba(60, 64, 67, 200);
+        border-radius: 7px;
+        font-size: 16px;
+        font-weight: bold;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
+        color: #E8EAED;
+    }
+    QPushButton#clearSoundButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(255,100,100,45), stop:1 rgba(255,100,100,35));
+        border: 1px solid rgba(232,71,71,180);
+    }
+    QPushButton#clearSoundButton:pressed {
+        background: rgba(255,100,100,55);
+    }
+
+    /* Sleep hours row */
+    QLabel#sleepToLabel {
+        color: #9AA0A6;
+        font-size: 11px;
+        background: transparent;
+    }
+
+    /* Goal presets */
+    QPushButton#presetButton {
+        padding: 8px;
+        border: 1px solid rgba(60, 64, 67, 200);
+        border-radius: 8px;
+        font-size: 11px;
+        font-weight: 600;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
+        color: #E8EAED;
+    }
+    QPushButton#presetButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
+        border: 1px solid rgba(138, 180, 248, 240);
+    }
+    QPushButton#presetButton:pressed {
+        background: #242628;
+    }
+
+    /* Dialog buttons */
+    QPushButton#cancelButton {
+        padding: 6px 18px;
+        border: 1px solid rgba(60, 64, 67, 200);
+        border-radius: 8px;
+        font-size: 13px;
+        font-weight: 600;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #303134, stop:1 #2D2F33);
+        color: #E8EAED;
+    }
+    QPushButton#cancelButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
+        border: 1px solid rgba(95, 99, 104, 220);
+    }
+    QPushButton#cancelButton:pressed {
+        background: #242628;
+        border: 1px solid rgba(95, 99, 104, 180);
+    }
+    QPushButton#saveButton {
+        padding: 6px 18px;
+        border: 1px solid rgba(74, 77, 81, 220);
+        border-radius: 8px;
+        font-size: 13px;
+        font-weight: 600;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #303134);
+        color: #E8EAED;
+    }
+    QPushButton#saveButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4A4D51, stop:1 #3C4043);
+        border: 1px solid rgba(95, 99, 104, 240);
+    }
+    QPushButton#saveButton:pressed {
+        background: #202124;
+        border: 1px solid rgba(60, 64, 67, 200);
+    }
+    QPushButton#resetButton {
+        padding: 6px 18px;
+        border: 1px solid rgba(232, 71, 71, 100);
+        border-radius: 8px;
+        font-size: 13px;
+        font-weight: 600;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(232,71,71,30), stop:1 rgba(232,71,71,25));
+        color: #E8EAED;
+    }
+    QPushButton#resetButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(232,71,71,55), stop:1 rgba(232,71,71,45));
+        border: 1px solid rgba(232, 71, 71, 150);
+    }
+    QPushButton#resetButton:pressed {
+        background: rgba(232,71,71,65);
+        border: 1px solid rgba(232, 71, 71, 120);
+    }
+    QPushButton#resetWaterButton {
+        padding: 6px 18px;
+        border: 1px solid rgba(100, 150, 232, 100);
+        border-radius: 8px;
+        font-size: 13px;
+        font-weight: 600;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(100,150,232,30), stop:1 rgba(100,150,232,25));
+        color: #E8EAED;
+    }
+    QPushButton#resetWaterButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(100,150,232,55), stop:1 rgba(100,150,232,45));
+        border: 1px solid rgba(100, 150, 232, 150);
+    }
+    QPushButton#resetWaterButton:pressed {
+        background: rgba(100,150,232,65);
+        border: 1px solid rgba(100, 150, 232, 120);
+    }
+    QPushButton#closeAppButton {
+        padding: 8px 20px;
+        border: 1px solid rgba(232, 71, 71, 120);
+        border-radius: 10px;
+        font-size: 14px;
+        font-weight: 600;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(232,71,71,35), stop:1 rgba(232,71,71,25));
+        color: #E8EAED;
+    }
+    QPushButton#closeAppButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(232,71,71,55), stop:1 rgba(232,71,71,45));
+        border: 1px solid rgba(232, 71, 71, 180);
+    }
+    QPushButton#closeAppButton:pressed {
+        background: rgba(232,71,71,75);
+        border: 1px solid rgba(232, 71, 71, 150);
+    }
+"""
 
 
 class SettingsDialog(QtWidgets.QDialog):
@@ -19,20 +419,21 @@ class SettingsDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.data_manager = data_manager
         self.settings = self.data_manager.get_settings()
+        self._custom_sound_path = None  # Full path of the chosen sound; the label only shows its name
+        self._test_sound_path = None  # File currently open under the MCI "testsound" alias
         
         self.setWindowTitle("HydraPing Settings")
         self.setModal(True)
         self.setFixedSize(525, 650)  # Increased height for new settings
         
         # Set window icon
-        import os
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.png')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QtGui.QIcon(icon_path))
+        icon = _window_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
         
         self._setup_ui()
         self._load_settings()
-        self._apply_monochrome_style()
+        self.setStyleSheet(_DIALOG_QSS)
     
     def _create_smooth_effect(self):
         """Create a graphics effect for ultra-smooth button edges"""
@@ -49,39 +450,18 @@ class SettingsDialog(QtWidgets.QDialog):
         
         # Title
         title = QtWidgets.QLabel("Settings")
-        title.setStyleSheet("font-size: 18px; font-weight: 700; color: #E8EAED;")
+        title.setObjectName("settingsTitle")
         layout.addWidget(title)
         
         # Scroll area for settings
         scroll_area = QtWidgets.QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: #202124;
-                width: 6px;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:vertical {
-                background: #5F6368;
-                border-radius: 3px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #8AB4F8;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        scroll_area.setObjectName("settingsScroll")
         
         # Container widget for scrollable content
         scroll_content = QtWidgets.QWidget()
-        scroll_content.setStyleSheet("background: #202124;")
+        scroll_content.setObjectName("scrollContent")
         scroll_layout = QtWidgets.QVBoxLayout(scroll_content)
         scroll_layout.setContentsMargins(0, 0, 0, 0)
         scroll_layout.setSpacing(0)
@@ -89,15 +469,6 @@ class SettingsDialog(QtWidgets.QDialog):
         # Settings form
         form_widget = QtWidgets.QWidget()
         form_widget.setObjectName("settingsForm")
-        form_widget.setStyleSheet("""
-            QWidget#settingsForm {
-                background: #202124; /* Chrome dark background */
-                border-radius: 8px;
-                padding: 12px 12px 0px 12px;
-            }
-            /* Form labels (left column) */
-            #settingsForm QLabel { color: #BDC1C6; font-size: 12px; }
-        """)
         form_layout = QtWidgets.QFormLayout(form_widget)
         form_layout.setContentsMargins(12, 12, 12, 12)
         form_layout.setSpacing(0)
@@ -106,127 +477,36 @@ class SettingsDialog(QtWidgets.QDialog):
         form_layout.setLabelAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
         form_layout.setFieldGrowthPolicy(QtWidgets.QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
         
-        # Daily Goal
-        self.goal_spin = QtWidgets.QSpinBox()
-        self.goal_spin.setRange(250, 10000)
-        self.goal_spin.setSingleStep(50)
-        self.goal_spin.setSuffix(" ml")
-        self.goal_spin.setMinimumWidth(150)
-        self.goal_spin.setStyleSheet("""
-            QSpinBox {
-                padding: 6px 10px;
-                border: 2px solid #3C4043;
-                border-radius: 6px;
-                font-size: 13px;
-                background: #2B2B2B;
-                color: #E8EAED;
-            }
-            QSpinBox:focus {
-                border-color: #5F6368; /* neutral focus */
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                border: none;
-                background: transparent;
-            }
-        """)
-        form_layout.addRow("Daily Goal:", self.goal_spin)
-        
-        # Reminder Interval
-        self.interval_spin = QtWidgets.QSpinBox()
-        self.interval_spin.setRange(5, 240)
-        self.interval_spin.setSingleStep(1)
-        self.interval_spin.setSuffix(" min")
-        self.interval_spin.setMinimumWidth(150)
-        self.interval_spin.setStyleSheet(self.goal_spin.styleSheet())
-        form_layout.addRow("Reminder Interval:", self.interval_spin)
-        
-        # Default Sip Size
-        self.sip_spin = QtWidgets.QSpinBox()
-        self.sip_spin.setRange(50, 1000)
-        self.sip_spin.setSingleStep(50)
-        self.sip_spin.setSuffix(" ml")
-        self.sip_spin.setMinimumWidth(150)
-        self.sip_spin.setStyleSheet(self.goal_spin.styleSheet())
-        form_layout.addRow("Default Sip Size:", self.sip_spin)
-        
-        # Snooze Duration
-        self.snooze_spin = QtWidgets.QSpinBox()
-        self.snooze_spin.setRange(5, 30)
-        self.snooze_spin.setSingleStep(1)
-        self.snooze_spin.setSuffix(" min")
-        self.snooze_spin.setMinimumWidth(150)
-        self.snooze_spin.setStyleSheet(self.goal_spin.styleSheet())
-        form_layout.addRow("Snooze Duration:", self.snooze_spin)
+        # Daily goal, reminder interval, sip size and snooze duration
+        for label, attr, minimum, maximum, step, suffix in _SPIN_ROWS:
+            spin = QtWidgets.QSpinBox()
+            spin.setRange(minimum, maximum)
+            spin.setSingleStep(step)
+            spin.setSuffix(suffix)
+            spin.setMinimumWidth(150)
+            spin.setObjectName("settingsSpin")
+            setattr(self, attr, spin)
+            form_layout.addRow(label, spin)
         
         # Theme Selection
         self.theme_combo = QtWidgets.QComboBox()
-        self.theme_combo.addItems(['Dark Glassmorphic', 'Wine Red', 'Forest Green', 'Ocean Blue', 'Sunset Orange', 'Midnight Blue'])
+        self.theme_combo.setModel(_theme_model())
         self.theme_combo.setMinimumWidth(150)
-        self.theme_combo.setStyleSheet("""
-            QComboBox {
-                padding: 6px 10px;
-                border: 2px solid #3C4043;
-                border-radius: 6px;
-                font-size: 13px;
-                background: #2B2B2B;
-                color: #E8EAED;
-            }
-            QComboBox:focus {
-                border-color: #5F6368; /* neutral focus */
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox::down-arrow {
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTQgNkw4IDEwTDEyIDYiIHN0cm9rZT0iIzlBQTBBNiIgc3Ryb2tlLXdpZHRoPSIyIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KPC9zdmc+);
-                width: 16px;
-                height: 16px;
-            }
-            /* Popup list view */
-            QComboBox QAbstractItemView {
-                background: #202124;
-                color: #E8EAED;
-                selection-background-color: #3A3B3F;
-                selection-color: #E8EAED;
-                border: 1px solid #3C4043;
-                outline: 0;
-            }
-        """)
+        self.theme_combo.setObjectName("themeCombo")
         form_layout.addRow("Theme:", self.theme_combo)
         
         # Display Mode Selection (Radio Buttons)
         display_mode_widget = QtWidgets.QWidget()
-        display_mode_widget.setStyleSheet("QWidget { background: transparent; }")
+        display_mode_widget.setObjectName("displayModeRow")
         display_mode_layout = QtWidgets.QHBoxLayout(display_mode_widget)
         display_mode_layout.setContentsMargins(0, 0, 0, 0)
         display_mode_layout.setSpacing(12)
         
         self.normal_mode_radio = QtWidgets.QRadioButton("Normal")
-        self.normal_mode_radio.setStyleSheet("""
-            QRadioButton {
-                font-size: 13px;
-                color: #E8EAED;
-                spacing: 8px;
-            }
-            QRadioButton::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QRadioButton::indicator:unchecked {
-                border: 2px solid #5F6368;
-                border-radius: 9px;
-                background: #2B2B2B;
-            }
-            QRadioButton::indicator:checked {
-                border: 2px solid #8AB4F8;
-                border-radius: 9px;
-                background: qradialgradient(cx:0.5, cy:0.5, radius:0.5, fx:0.5, fy:0.5, stop:0 #8AB4F8, stop:0.5 #8AB4F8, stop:0.51 transparent);
-            }
-        """)
+        self.normal_mode_radio.setObjectName("displayModeRadio")
         
         self.minimal_mode_radio = QtWidgets.QRadioButton("Minimal")
-        self.minimal_mode_radio.setStyleSheet(self.normal_mode_radio.styleSheet())
+        self.minimal_mode_radio.setObjectName("displayModeRadio")
         
         # Set default checked
         self.normal_mode_radio.setChecked(True)
@@ -239,49 +519,23 @@ class SettingsDialog(QtWidgets.QDialog):
         
         # Auto-launch checkbox
         self.auto_launch_check = QtWidgets.QCheckBox("Launch on system startup")
-        self.auto_launch_check.setStyleSheet("""
-            QCheckBox {
-                font-size: 13px;
-                color: #E8EAED;
-                spacing: 8px; /* gap between box and text */
-                padding-left: 2px; /* ensure text not clipped */
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #3C4043;
-                border-radius: 4px;
-                background: #2B2B2B;
-                margin-right: 8px;
-            }
-            QCheckBox::indicator:checked {
-                background: #E8EAED; /* neutral check */
-                border-color: #E8EAED;
-            }
-        """)
+        self.auto_launch_check.setObjectName("settingsCheck")
         form_layout.addRow("Auto Launch:", self.auto_launch_check)
         
         # Sound enabled checkbox
         self.sound_check = QtWidgets.QCheckBox("Enable reminder sounds")
-        self.sound_check.setStyleSheet(self.auto_launch_check.styleSheet())
+        self.sound_check.setObjectName("settingsCheck")
         form_layout.addRow("Sound:", self.sound_check)
         
         # Custom sound file picker
         sound_file_widget = QtWidgets.QWidget()
-        sound_file_widget.setStyleSheet("QWidget { background: transparent; }")
+        sound_file_widget.setObjectName("soundFileRow")
         sound_file_layout = QtWidgets.QHBoxLayout(sound_file_widget)
         sound_file_layout.setContentsMargins(0, 0, 0, 0)
         sound_file_layout.setSpacing(8)
         
         self.sound_path_label = QtWidgets.QLabel("Default")
-        self.sound_path_label.setStyleSheet("""
-            QLabel {
-                color: #9AA0A6;
-                font-size: 11px;
-                padding: 4px 8px;
-                background: transparent;
-            }
-        """)
+        self.sound_path_label.setObjectName("soundPathLabel")
         self.sound_path_label.setMinimumWidth(120)
         self.sound_path_label.setWordWrap(False)
         self.sound_path_label.setTextFormat(QtCore.Qt.TextFormat.PlainText)
@@ -290,47 +544,13 @@ class SettingsDialog(QtWidgets.QDialog):
         browse_btn = QtWidgets.QPushButton("Browse...")
         browse_btn.setFixedHeight(28)
         browse_btn.setGraphicsEffect(self._create_smooth_effect())
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                padding: 4px 12px;
-                border: 1px solid rgba(60, 64, 67, 200);
-                border-radius: 7px;
-                font-size: 11px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
-                border: 1px solid rgba(95, 99, 104, 220);
-            }
-            QPushButton:pressed {
-                background: #242628;
-                border: 1px solid rgba(74, 77, 81, 180);
-            }
-        """)
+        browse_btn.setObjectName("browseButton")
         browse_btn.clicked.connect(self._browse_sound_file)
         
         test_btn = QtWidgets.QPushButton("▶")
         test_btn.setFixedSize(28, 28)
         test_btn.setGraphicsEffect(self._create_smooth_effect())
-        test_btn.setStyleSheet("""
-            QPushButton {
-                padding: 0px;
-                border: 1px solid rgba(60, 64, 67, 200);
-                border-radius: 7px;
-                font-size: 12px;
-                font-weight: bold;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
-                border: 1px solid rgba(95, 99, 104, 220);
-            }
-            QPushButton:pressed {
-                background: #242628;
-            }
-        """)
+        test_btn.setObjectName("testSoundButton")
         test_btn.setToolTip("Test sound")
         test_btn.clicked.connect(self._test_sound)
         
@@ -338,52 +558,13 @@ class SettingsDialog(QtWidgets.QDialog):
         self.loop_btn.setFixedSize(28, 28)
         self.loop_btn.setCheckable(True)
         self.loop_btn.setGraphicsEffect(self._create_smooth_effect())
-        self.loop_btn.setStyleSheet("""
-            QPushButton {
-                padding: 0px;
-                border: 1px solid rgba(60, 64, 67, 200);
-                border-radius: 7px;
-                font-size: 16px;
-                font-weight: bold;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
-                border: 1px solid rgba(95, 99, 104, 220);
-            }
-            QPushButton:checked {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
-                border: 1px solid rgba(138, 180, 248, 240);
-                color: #8AB4F8;
-            }
-            QPushButton:pressed {
-                background: #242628;
-            }
-        """)
+        self.loop_btn.setObjectName("loopButton")
         self.loop_btn.setToolTip("Loop alert sound")
         
         clear_btn = QtWidgets.QPushButton("×")
         clear_btn.setFixedSize(28, 28)
         clear_btn.setGraphicsEffect(self._create_smooth_effect())
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                padding: 0px;
-                border: 1px solid rgba(60, 64, 67, 200);
-                border-radius: 7px;
-                font-size: 16px;
-                font-weight: bold;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(255,100,100,45), stop:1 rgba(255,100,100,35));
-                border: 1px solid rgba(232,71,71,180);
-            }
-            QPushButton:pressed {
-                background: rgba(255,100,100,55);
-            }
-        """)
+        clear_btn.setObjectName("clearSoundButton")
         clear_btn.setToolTip("Clear custom sound")
         clear_btn.clicked.connect(self._clear_sound_file)
         
@@ -397,7 +578,7 @@ class SettingsDialog(QtWidgets.QDialog):
         
         # Sleep Hours
         sleep_hours_widget = QtWidgets.QWidget()
-        sleep_hours_widget.setStyleSheet("QWidget { background: transparent; }")
+        sleep_hours_widget.setObjectName("sleepHoursRow")
         sleep_hours_layout = QtWidgets.QHBoxLayout(sleep_hours_widget)
         sleep_hours_layout.setContentsMargins(0, 0, 0, 0)
         sleep_hours_layout.setSpacing(8)
@@ -406,16 +587,16 @@ class SettingsDialog(QtWidgets.QDialog):
         self.sleep_start_spin.setRange(0, 23)
         self.sleep_start_spin.setSuffix(":00")
         self.sleep_start_spin.setMinimumWidth(70)
-        self.sleep_start_spin.setStyleSheet(self.goal_spin.styleSheet())
+        self.sleep_start_spin.setObjectName("settingsSpin")
         
         sleep_to_label = QtWidgets.QLabel("to")
-        sleep_to_label.setStyleSheet("color: #9AA0A6; font-size: 11px; background: transparent;")
+        sleep_to_label.setObjectName("sleepToLabel")
         
         self.sleep_end_spin = QtWidgets.QSpinBox()
         self.sleep_end_spin.setRange(0, 23)
         self.sleep_end_spin.setSuffix(":00")
         self.sleep_end_spin.setMinimumWidth(70)
-        self.sleep_end_spin.setStyleSheet(self.goal_spin.styleSheet())
+        self.sleep_end_spin.setObjectName("settingsSpin")
         
         sleep_hours_layout.addWidget(self.sleep_start_spin)
         sleep_hours_layout.addWidget(sleep_to_label)
@@ -426,57 +607,26 @@ class SettingsDialog(QtWidgets.QDialog):
         
         # Bedtime Warning
         self.bedtime_warning_check = QtWidgets.QCheckBox("Remind before bedtime")
-        self.bedtime_warning_check.setStyleSheet(self.auto_launch_check.styleSheet())
+        self.bedtime_warning_check.setObjectName("settingsCheck")
         form_layout.addRow("Bedtime Warning:", self.bedtime_warning_check)
         
         scroll_layout.addWidget(form_widget)
         
         # Goal Presets
         presets_label = QtWidgets.QLabel("Quick Presets")
-        presets_label.setStyleSheet("font-size: 18px; font-weight: 700; color: #E8EAED; margin: 1px 0px 0px 0px; padding: 0px; background: transparent;")
+        presets_label.setObjectName("presetsTitle")
         scroll_layout.addWidget(presets_label)
         
         presets_layout = QtWidgets.QHBoxLayout()
         presets_layout.setSpacing(8)
         
-        light_btn = QtWidgets.QPushButton("Light Activity\n2000ml")
-        light_btn.setMinimumHeight(50)
-        light_btn.setGraphicsEffect(self._create_smooth_effect())
-        light_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px;
-                border: 1px solid rgba(60, 64, 67, 200);
-                border-radius: 8px;
-                font-size: 11px;
-                font-weight: 600;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2D2F33, stop:1 #2B2B2B);
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
-                border: 1px solid rgba(138, 180, 248, 240);
-            }
-            QPushButton:pressed {
-                background: #242628;
-            }
-        """)
-        light_btn.clicked.connect(lambda: self.goal_spin.setValue(2000))
-        
-        moderate_btn = QtWidgets.QPushButton("Moderate\n2500ml")
-        moderate_btn.setMinimumHeight(50)
-        moderate_btn.setGraphicsEffect(self._create_smooth_effect())
-        moderate_btn.setStyleSheet(light_btn.styleSheet())
-        moderate_btn.clicked.connect(lambda: self.goal_spin.setValue(2500))
-        
-        high_btn = QtWidgets.QPushButton("High Activity\n3000ml")
-        high_btn.setMinimumHeight(50)
-        high_btn.setGraphicsEffect(self._create_smooth_effect())
-        high_btn.setStyleSheet(light_btn.styleSheet())
-        high_btn.clicked.connect(lambda: self.goal_spin.setValue(3000))
-        
-        presets_layout.addWidget(light_btn)
-        presets_layout.addWidget(moderate_btn)
-        presets_layout.addWidget(high_btn)
+        for text, goal_ml in _GOAL_PRESETS:
+            preset_btn = QtWidgets.QPushButton(text)
+            preset_btn.setMinimumHeight(50)
+            preset_btn.setGraphicsEffect(self._create_smooth_effect())
+            preset_btn.setObjectName("presetButton")
+            preset_btn.clicked.connect(partial(self.goal_spin.setValue, goal_ml))
+            presets_layout.addWidget(preset_btn)
         
         scroll_layout.addLayout(presets_layout)
         
@@ -491,97 +641,25 @@ class SettingsDialog(QtWidgets.QDialog):
         cancel_btn = QtWidgets.QPushButton("Cancel")
         cancel_btn.setMinimumHeight(32)
         cancel_btn.setGraphicsEffect(self._create_smooth_effect())
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                padding: 6px 18px;
-                border: 1px solid rgba(60, 64, 67, 200);
-                border-radius: 8px;
-                font-size: 13px;
-                font-weight: 600;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #303134, stop:1 #2D2F33);
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #3A3B3F);
-                border: 1px solid rgba(95, 99, 104, 220);
-            }
-            QPushButton:pressed {
-                background: #242628;
-                border: 1px solid rgba(95, 99, 104, 180);
-            }
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
         
         save_btn = QtWidgets.QPushButton("Save Changes")
         save_btn.setMinimumHeight(32)
         save_btn.setGraphicsEffect(self._create_smooth_effect())
-        save_btn.setStyleSheet("""
-            QPushButton {
-                padding: 6px 18px;
-                border: 1px solid rgba(74, 77, 81, 220);
-                border-radius: 8px;
-                font-size: 13px;
-                font-weight: 600;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3C4043, stop:1 #303134);
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4A4D51, stop:1 #3C4043);
-                border: 1px solid rgba(95, 99, 104, 240);
-            }
-            QPushButton:pressed {
-                background: #202124;
-                border: 1px solid rgba(60, 64, 67, 200);
-            }
-        """)
+        save_btn.setObjectName("saveButton")
         save_btn.clicked.connect(self._save_settings)
         
         reset_btn = QtWidgets.QPushButton("Reset to Defaults")
         reset_btn.setMinimumHeight(32)
         reset_btn.setGraphicsEffect(self._create_smooth_effect())
-        reset_btn.setStyleSheet("""
-            QPushButton {
-                padding: 6px 18px;
-                border: 1px solid rgba(232, 71, 71, 100);
-                border-radius: 8px;
-                font-size: 13px;
-                font-weight: 600;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(232,71,71,30), stop:1 rgba(232,71,71,25));
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(232,71,71,55), stop:1 rgba(232,71,71,45));
-                border: 1px solid rgba(232, 71, 71, 150);
-            }
-            QPushButton:pressed {
-                background: rgba(232,71,71,65);
-                border: 1px solid rgba(232, 71, 71, 120);
-            }
-        """)
+        reset_btn.setObjectName("resetButton")
         reset_btn.clicked.connect(self._reset_to_defaults)
         
         reset_water_btn = QtWidgets.QPushButton("Reset Water")
         reset_water_btn.setMinimumHeight(32)
         reset_water_btn.setGraphicsEffect(self._create_smooth_effect())
-        reset_water_btn.setStyleSheet("""
-            QPushButton {
-                padding: 6px 18px;
-                border: 1px solid rgba(100, 150, 232, 100);
-                border-radius: 8px;
-                font-size: 13px;
-                font-weight: 600;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(100,150,232,30), stop:1 rgba(100,150,232,25));
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(100,150,232,55), stop:1 rgba(100,150,232,45));
-                border: 1px solid rgba(100, 150, 232, 150);
-            }
-            QPushButton:pressed {
-                background: rgba(100,150,232,65);
-                border: 1px solid rgba(100, 150, 232, 120);
-            }
-        """)
+        reset_water_btn.setObjectName("resetWaterButton")
         reset_water_btn.clicked.connect(self._reset_water)
         
         button_layout.addWidget(reset_btn)
@@ -599,118 +677,98 @@ class SettingsDialog(QtWidgets.QDialog):
         close_app_btn = QtWidgets.QPushButton("Close HydraPing")
         close_app_btn.setMinimumHeight(38)
         close_app_btn.setGraphicsEffect(self._create_smooth_effect())
-        close_app_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 20px;
-                border: 1px solid rgba(232, 71, 71, 120);
-                border-radius: 10px;
-                font-size: 14px;
-                font-weight: 600;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(232,71,71,35), stop:1 rgba(232,71,71,25));
-                color: #E8EAED;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(232,71,71,55), stop:1 rgba(232,71,71,45));
-                border: 1px solid rgba(232, 71, 71, 180);
-            }
-            QPushButton:pressed {
-                background: rgba(232,71,71,75);
-                border: 1px solid rgba(232, 71, 71, 150);
-            }
-        """)
+        close_app_btn.setObjectName("closeAppButton")
         close_app_btn.clicked.connect(self._terminate_app)
         
         close_layout.addWidget(close_app_btn)
         layout.addLayout(close_layout)
-
-    def _apply_monochrome_style(self):
-        """Apply grayscale, dialog-scoped styling only to settings window.
-        Keeps app theme intact elsewhere.
-        """
-        self.setStyleSheet(self.styleSheet() + """
-            /* Dialog background */
-            QDialog {
-                background: #202124; /* Chrome dark */
-            }
-            /* Generic labels if not overridden */
-            QLabel { color: #E8EAED; }
-        """)
-        
+    
     def _browse_sound_file(self):
         """Open file dialog to select custom sound file"""
+        # Start in the last folder used rather than letting the shell enumerate its default
+        start_dir = self.settings.get('last_sound_dir') or os.path.expanduser("~")
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Select Sound File",
-            "",
-            "Sound Files (*.wav *.mp3 *.ogg *.flac);;All Files (*.*)"
+            start_dir,
+            "Sound Files (*.wav *.mp3 *.ogg *.flac);;All Files (*.*)",
+            options=QtWidgets.QFileDialog.Option.ReadOnly
         )
         
         if file_path:
-            import os
-            self.sound_path_label.setText(os.path.basename(file_path))
-            self.sound_path_label.setToolTip(file_path)
+            sound_dir = os.path.dirname(file_path)
+            if sound_dir != self.settings.get('last_sound_dir'):
+                self.settings['last_sound_dir'] = sound_dir
+                self.data_manager.update_settings(last_sound_dir=sound_dir)
+            self._set_custom_sound(file_path)
     
     def _clear_sound_file(self):
         """Clear custom sound file selection"""
-        self.sound_path_label.setText("Default")
-        self.sound_path_label.setToolTip("")
+        self._set_custom_sound(None)
+    
+    def _set_custom_sound(self, path):
+        """Remember the custom sound path and show its file name (or "Default")"""
+        self._custom_sound_path = path or None
+        if path:
+            self.sound_path_label.setText(os.path.basename(path))
+            self.sound_path_label.setToolTip(path)
+        else:
+            self.sound_path_label.setText("Default")
+            self.sound_path_label.setToolTip("")
     
     def _test_sound(self):
         """Test the selected sound file"""
-        custom_sound_path = None
-        if self.sound_path_label.text() != "Default" and self.sound_path_label.toolTip():
-            custom_sound_path = self.sound_path_label.toolTip()
-        
+        custom_sound_path = self._custom_sound_path
         if custom_sound_path and os.path.exists(custom_sound_path):
             try:
-                import winsound
-                import ctypes
-                
                 # Use MCI for MP3/other formats, fallback to winsound for WAV
                 if custom_sound_path.lower().endswith('.wav'):
                     winsound.PlaySound(custom_sound_path, winsound.SND_FILENAME | winsound.SND_ASYNC)
                 else:
-                    # Use Windows MCI for MP3/OGG/FLAC
+                    # Use Windows MCI for MP3/OGG/FLAC; the file stays open for replays
                     winmm = ctypes.windll.winmm
-                    winmm.mciSendStringW(f'open "{custom_sound_path}" type mpegvideo alias mp3', None, 0, None)
-                    winmm.mciSendStringW('play mp3 from 0', None, 0, None)
+                    if custom_sound_path != self._test_sound_path:
+                        self._close_test_sound()
+                        winmm.mciSendStringW(f'open "{custom_sound_path}" type mpegvideo alias testsound', None, 0, None)
+                        self._test_sound_path = custom_sound_path
+                    winmm.mciSendStringW('play testsound from 0', None, 0, None)
             except Exception as e:
                 QtWidgets.QMessageBox.warning(self, 'Sound Test', 
                     f'Could not play sound: {str(e)}')
         else:
             try:
-                import winsound
                 winsound.MessageBeep(winsound.MB_ICONASTERISK)
             except:
                 QtWidgets.QMessageBox.information(self, 'Sound Test', 
                     'Playing default system beep')
     
+    def _close_test_sound(self):
+        """Stop and close the MCI device opened by _test_sound, if any"""
+        if self._test_sound_path is None:
+            return
+        self._test_sound_path = None
+        try:
+            ctypes.windll.winmm.mciSendStringW('close testsound', None, 0, None)
+        except OSError:
+            pass
+    
+    def done(self, result):
+        """Release the test sound device however the dialog is closed"""
+        self._close_test_sound()
+        super().done(result)
+    
     def _load_settings(self):
         """Load current settings into form"""
-        self.goal_spin.setValue(self.settings.get('daily_goal_ml', 2000))
-        self.interval_spin.setValue(self.settings.get('reminder_interval_minutes', 60))
-        self.sip_spin.setValue(self.settings.get('default_sip_ml', 250))
-        self.snooze_spin.setValue(self.settings.get('snooze_duration_minutes', 5))
-        self.theme_combo.setCurrentText(self.settings.get('theme', 'Dark Glassmorphic'))
+        settings = self.settings
+        for key, attr, default, _getter, setter in _FIELDS:
+            getattr(getattr(self, attr), setter)(settings.get(key, default))
+        from core.auto_launch import is_auto_launch_enabled  # Registry helpers only needed once the dialog opens
         self.auto_launch_check.setChecked(is_auto_launch_enabled())
-        self.sound_check.setChecked(self.settings.get('chime_enabled', True))
         
-        custom_sound = self.settings.get('custom_sound_path', None)
-        if custom_sound:
-            import os
-            self.sound_path_label.setText(os.path.basename(custom_sound))
-            self.sound_path_label.setToolTip(custom_sound)
-        else:
-            self.sound_path_label.setText("Default")
-            self.sound_path_label.setToolTip("")
-        
-        self.loop_btn.setChecked(self.settings.get('loop_alert_sound', False))
-        self.sleep_start_spin.setValue(self.settings.get('sleep_start_hour', 22))
-        self.sleep_end_spin.setValue(self.settings.get('sleep_end_hour', 7))
-        self.bedtime_warning_check.setChecked(self.settings.get('bedtime_warning_enabled', True))
+        self._set_custom_sound(settings.get('custom_sound_path', None))
         
         # Load window shape setting
-        window_shape = self.settings.get('window_shape', 'rectangular')
+        window_shape = settings.get('window_shape', 'rectangular')
         if window_shape == 'rectangular':
             self.normal_mode_radio.setChecked(True)
         else:
@@ -719,41 +777,17 @@ class SettingsDialog(QtWidgets.QDialog):
     def _save_settings(self):
         """Save settings and close dialog"""
         # Get values
-        new_goal = self.goal_spin.value()
-        new_interval = self.interval_spin.value()
-        new_sip = self.sip_spin.value()
-        new_snooze = self.snooze_spin.value()
-        new_theme = self.theme_combo.currentText()
-        sound_enabled = self.sound_check.isChecked()
-        
-        # Get custom sound path
-        custom_sound_path = None
-        if self.sound_path_label.text() != "Default" and self.sound_path_label.toolTip():
-            custom_sound_path = self.sound_path_label.toolTip()
-        
-        loop_enabled = self.loop_btn.isChecked()
-        sleep_start = self.sleep_start_spin.value()
-        sleep_end = self.sleep_end_spin.value()
-        bedtime_warning = self.bedtime_warning_check.isChecked()
-        window_shape = 'rectangular' if self.normal_mode_radio.isChecked() else 'circular'
+        updated_settings = {key: getattr(getattr(self, attr), getter)()
+                            for key, attr, _default, getter, _setter in _FIELDS}
+        
+        updated_settings['custom_sound_path'] = self._custom_sound_path
+        updated_settings['window_shape'] = 'rectangular' if self.normal_mode_radio.isChecked() else 'circular'
         
         # Update via data_manager
-        self.data_manager.update_settings(
-            daily_goal_ml=new_goal,
-            reminder_interval_minutes=new_interval,
-            default_sip_ml=new_sip,
-            snooze_duration_minutes=new_snooze,
-            theme=new_theme,
-            chime_enabled=sound_enabled,
-            custom_sound_path=custom_sound_path,
-            loop_alert_sound=loop_enabled,
-            sleep_start_hour=sleep_start,
-            sleep_end_hour=sleep_end,
-            bedtime_warning_enabled=bedtime_warning,
-            window_shape=window_shape
-        )
+        self.data_manager.update_settings(**updated_settings)
         
         # Handle auto-launch
+        from core.auto_launch import enable_auto_launch, disable_auto_launch
         if self.auto_launch_check.isChecked():
             success, message = enable_auto_launch()
             if not success:
@@ -766,20 +800,6 @@ class SettingsDialog(QtWidgets.QDialog):
                     f'Could not disable auto-launch: {message}')
         
         # Emit signal with new settings
-        updated_settings = {
-            'daily_goal_ml': new_goal,
-            'reminder_interval_minutes': new_interval,
-            'default_sip_ml': new_sip,
-            'snooze_duration_minutes': new_snooze,
-            'theme': new_theme,
-            'chime_enabled': sound_enabled,
-            'custom_sound_path': custom_sound_path,
-            'loop_alert_sound': loop_enabled,
-            'sleep_start_hour': sleep_start,
-            'sleep_end_hour': sleep_end,
-            'bedtime_warning_enabled': bedtime_warning,
-            'window_shape': window_shape
-        }
         self.settings_updated.emit(updated_settings)
         
         self.accept()
@@ -794,18 +814,9 @@ class SettingsDialog(QtWidgets.QDialog):
         )
         
         if reply == QtWidgets.QMessageBox.StandardButton.Yes:
-            self.goal_spin.setValue(2000)
-            self.interval_spin.setValue(60)
-            self.sip_spin.setValue(250)
-            self.snooze_spin.setValue(5)
-            self.theme_combo.setCurrentText('Dark Glassmorphic')
-            self.sound_check.setChecked(True)
-            self.sound_path_label.setText("Default")
-            self.sound_path_label.setToolTip("")
-            self.loop_btn.setChecked(False)
-            self.sleep_start_spin.setValue(22)
-            self.sleep_end_spin.setValue(7)
-            self.bedtime_warning_check.setChecked(True)
+            for _key, attr, default, _getter, setter in _FIELDS:
+                getattr(getattr(self, attr), setter)(default)
+            self._set_custom_sound(None)
             self.normal_mode_radio.setChecked(True)
     
     def _reset_water(self):
@@ -3,278 +3,98 @@ Theme Manager for HydraPing
 Handles color schemes and styling for the application
 """
 
-class ThemeManager:
-    """Manage application themes and color schemes"""
-    
-    THEMES = {
-        'Light Glassmorphic': {
-            'name': 'Light Glassmorphic',
-            'overlay_bg_start': 'rgba(30,30,30,40)',
-            'overlay_bg_end': 'rgba(20,20,20,30)',
-            'overlay_border': 'rgba(0,0,0,90)',
-            'hover_bg_start': 'rgba(30,30,30,60)',
-            'hover_bg_end': 'rgba(20,20,20,50)',
-            'hover_border': 'rgba(0,0,0,120)',
-            'text_primary': 'rgba(0,0,0,250)',
-            'text_secondary': 'rgba(0,0,0,200)',
-            'text_tertiary': 'rgba(0,0,0,180)',
-            'button_bg': 'rgba(0,0,0,25)',
-            'button_hover': 'rgba(0,0,0,35)',
-            'dialog_bg': 'rgba(240,240,240,250)',
-            'progress_low': 'rgba(232,71,71,220)',
-            'progress_mid': 'rgba(255,193,7,220)',
-            'progress_high': 'rgba(76,175,80,220)',
-        },
-        'Dark Glassmorphic': {
-            'name': 'Dark Glassmorphic',
-            'overlay_bg_start': 'rgba(255,255,255,40)',
-            'overlay_bg_end': 'rgba(255,255,255,30)',
-            'overlay_border': 'rgba(255,255,255,90)',
-            'hover_bg_start': 'rgba(255,255,255,60)',
-            'hover_bg_end': 'rgba(255,255,255,50)',
-            'hover_border': 'rgba(255,255,255,120)',
-            'text_primary': 'rgba(255,255,255,250)',
-            'text_secondary': 'rgba(255,255,255,200)',
-            'text_tertiary': 'rgba(255,255,255,180)',
-            'button_bg': 'rgba(255,255,255,25)',
-            'button_hover': 'rgba(255,255,255,35)',
-            'dialog_bg': 'rgba(30,30,40,250)',
-            'progress_low': 'rgba(232,71,71,220)',
-            'progress_mid': 'rgba(255,193,7,220)',
-            'progress_high': 'rgba(76,175,80,220)',
-        },
-        'Wine Red': {
-            'name': 'Wine Red',
-            'overlay_bg_start': 'rgba(139,0,0,45)',
-            'overlay_bg_end': 'rgba(115,0,0,35)',
-            'overlay_border': 'rgba(178,34,34,100)',
-            'hover_bg_start': 'rgba(139,0,0,65)',
-            'hover_bg_end': 'rgba(115,0,0,55)',
-            'hover_border': 'rgba(178,34,34,130)',
-            'text_primary': 'rgba(255,255,255,250)',
-            'text_secondary': 'rgba(255,255,255,220)',
-            'text_tertiary': 'rgba(255,255,255,200)',
-            'button_bg': 'rgba(139,0,0,30)',
-            'button_hover': 'rgba(139,0,0,45)',
-            'dialog_bg': 'rgba(80,0,0,250)',
-            'progress_low': 'rgba(255,138,101,220)',
-            'progress_mid': 'rgba(255,193,7,220)',
-            'progress_high': 'rgba(255,182,193,220)',
-        },
-        'Forest Green': {
-            'name': 'Forest Green',
-            'overlay_bg_start': 'rgba(129,199,132,45)',
-            'overlay_bg_end': 'rgba(102,187,106,35)',
-            'overlay_border': 'rgba(165,214,167,100)',
-            'hover_bg_start': 'rgba(129,199,132,65)',
-            'hover_bg_end': 'rgba(102,187,106,55)',
-            'hover_border': 'rgba(165,214,167,130)',
-            'text_primary': 'rgba(255,255,255,250)',
-            'text_secondary': 'rgba(255,255,255,220)',
-            'text_tertiary': 'rgba(255,255,255,200)',
-            'button_bg': 'rgba(129,199,132,30)',
-            'button_hover': 'rgba(129,199,132,45)',
-            'dialog_bg': 'rgba(27,94,32,250)',
-            'progress_low': 'rgba(255,138,101,220)',
-            'progress_mid': 'rgba(255,213,79,220)',
-            'progress_high': 'rgba(165,214,167,220)',
-        },
-        'Ocean Blue': {
-            'name': 'Ocean Blue',
-            'overlay_bg_start': 'rgba(100,181,246,45)',
-            'overlay_bg_end': 'rgba(66,165,245,35)',
-            'overlay_border': 'rgba(129,212,250,100)',
-            'hover_bg_start': 'rgba(100,181,246,65)',
-            'hover_bg_end': 'rgba(66,165,245,55)',
-            'hover_border': 'rgba(129,212,250,130)',
-            'text_primary': 'rgba(255,255,255,250)',
-            'text_secondary': 'rgba(255,255,255,220)',
-            'text_tertiary': 'rgba(255,255,255,200)',
-            'button_bg': 'rgba(100,181,246,30)',
-            'button_hover': 'rgba(100,181,246,45)',
-            'dialog_bg': 'rgba(13,71,161,250)',
-            'progress_low': 'rgba(244,143,177,220)',
-            'progress_mid': 'rgba(255,213,79,220)',
-            'progress_high': 'rgba(129,212,250,220)',
-        },
-        'Sunset Orange': {
-            'name': 'Sunset Orange',
-            'overlay_bg_start': 'rgba(255,183,77,45)',
-            'overlay_bg_end': 'rgba(255,167,38,35)',
-            'overlay_border': 'rgba(255,204,128,100)',
-            'hover_bg_start': 'rgba(255,183,77,65)',
-            'hover_bg_end': 'rgba(255,167,38,55)',
-            'hover_border': 'rgba(255,204,128,130)',
-            'text_primary': 'rgba(255,255,255,250)',
-            'text_secondary': 'rgba(255,255,255,220)',
-            'text_tertiary': 'rgba(255,255,255,200)',
-            'button_bg': 'rgba(255,183,77,30)',
-            'button_hover': 'rgba(255,183,77,45)',
-            'dialog_bg': 'rgba(191,54,12,250)',
-            'progress_low': 'rgba(239,83,80,220)',
-            'progress_mid': 'rgba(255,213,79,220)',
-            'progress_high': 'rgba(255,183,77,220)',
-        },
-        'Light Overlay': {
-            'name': 'Light Overlay',
-            'overlay_bg_start': 'rgba(255,255,255,20)',
-            'overlay_bg_end': 'rgba(250,250,250,15)',
-            'overlay_border': 'rgba(200,200,200,80)',
-            'hover_bg_start': 'rgba(255,255,255,40)',
-            'hover_bg_end': 'rgba(250,250,250,30)',
-            'hover_border': 'rgba(180,180,180,110)',
-            'text_primary': 'rgba(33,33,33,250)',
-            'text_secondary': 'rgba(66,66,66,220)',
-            'text_tertiary': 'rgba(100,100,100,200)',
-            'button_bg': 'rgba(220,220,220,30)',
-            'button_hover': 'rgba(200,200,200,45)',
-            'dialog_bg': 'rgba(255,255,255,250)',
-            'progress_low': 'rgba(244,67,54,220)',
-            'progress_mid': 'rgba(255,193,7,220)',
-            'progress_high': 'rgba(76,175,80,220)',
-        },
-        'Midnight Blue': {
-            'name': 'Midnight Blue',
-            'overlay_bg_start': 'rgba(13,27,42,50)',
-            'overlay_bg_end': 'rgba(27,38,59,40)',
-            'overlay_border': 'rgba(65,105,225,100)',
-            'hover_bg_start': 'rgba(13,27,42,70)',
-            'hover_bg_end': 'rgba(27,38,59,60)',
-            'hover_border': 'rgba(65,105,225,130)',
-            'text_primary': 'rgba(255,255,255,250)',
-            'text_secondary': 'rgba(220,230,255,220)',
-            'text_tertiary': 'rgba(200,210,235,200)',
-            'button_bg': 'rgba(65,105,225,30)',
-            'button_hover': 'rgba(65,105,225,45)',
-            'dialog_bg': 'rgba(13,27,42,250)',
-            'progress_low': 'rgba(220,20,60,220)',
-            'progress_mid': 'rgba(255,215,0,220)',
-            'progress_high': 'rgba(100,149,237,220)',
-        },
-    }
-    
-    def __init__(self, theme_name='Dark Glassmorphic'):
-        # Ensure attribute exists even if provided theme is invalid
-        self.current_theme = 'Dark Glassmorphic'
-        self.auto_switch_enabled = False  # Disable auto-switching to preserve user choice
-        
-        # Cache for generated stylesheets
-        self._overlay_stylesheet_cache = {}
-        self._dialog_stylesheet_cache = {}
-        
-        self.set_theme(theme_name)
-        
-    def get_theme(self, theme_name=None):
-        """Get theme colors"""
-        if theme_name is None:
-            theme_name = self.current_theme
-        return self.THEMES.get(theme_name, self.THEMES['Dark Glassmorphic'])
-        
-    def set_theme(self, theme_name):
-        """Set current theme"""
-        if theme_name in self.THEMES:
-            self.current_theme = theme_name
-            # Clear caches when theme changes
-            self._overlay_stylesheet_cache.clear()
-            self._dialog_stylesheet_cache.clear()
-            return True
-        return False
-        
-    def get_theme_names(self):
-        """Get list of available theme names"""
-        return list(self.THEMES.keys())
-        
-    def get_overlay_stylesheet(self, theme_name=None):
-        """Get overlay window stylesheet for the current theme"""
-        cache_key = theme_name or self.current_theme
-        
-        # Return cached if available
-        if cache_key in self._overlay_stylesheet_cache:
-            return self._overlay_stylesheet_cache[cache_key]
-        
-        theme = self.get_theme(theme_name)
-        
-        stylesheet = f"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ThemeColors:
+    """Color entries for a single theme"""
+    name: str
+    overlay_bg_start: str
+    overlay_bg_end: str
+    overlay_border: str
+    hover_bg_start: str
+    hover_bg_end: str
+    hover_border: str
+    text_primary: str
+    text_secondary: str
+    text_tertiary: str
+    button_bg: str
+    button_hover: str
+    dialog_bg: str
+    progress_low: str
+    progress_mid: str
+    progress_high: str
+
+
+# str.format templates filled from a theme's color entries (as "t")
+_OVERLAY_TEMPLATE = """
             #overlayContainer {{
                 background: qlineargradient(
                     x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {theme['overlay_bg_start']},
-                    stop:1 {theme['overlay_bg_end']}
+                    stop:0 {t.overlay_bg_start},
+                    stop:1 {t.overlay_bg_end}
                 );
                 border-radius: 12px;
-                border: 1px solid {theme['overlay_border']};
+                border: 1px solid {t.overlay_border};
             }}
             #hoverBackground {{
                 background: qlineargradient(
                     x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {theme['hover_bg_start']},
-                    stop:1 {theme['hover_bg_end']}
+                    stop:0 {t.hover_bg_start},
+                    stop:1 {t.hover_bg_end}
                 );
                 border-radius: 14px;
-                border: 1.5px solid {theme['hover_border']};
+                border: 1.5px solid {t.hover_border};
             }}
         """
-        
-        # Cache and return
-        self._overlay_stylesheet_cache[cache_key] = stylesheet
-        return stylesheet
-        
-    def get_dialog_stylesheet(self, theme_name=None):
-        """Get dialog stylesheet for the current theme"""
-        cache_key = theme_name or self.current_theme
-        
-        # Return cached if available
-        if cache_key in self._dialog_stylesheet_cache:
-            return self._dialog_stylesheet_cache[cache_key]
-        
-        theme = self.get_theme(theme_name)
-        
-        return f"""
+
+_DIALOG_TEMPLATE = """
             QDialog {{ 
-                background: {theme['dialog_bg']}; 
-                border: 1px solid {theme['overlay_border']}; 
+                background: {t.dialog_bg}; 
+                border: 1px solid {t.overlay_border}; 
                 border-radius: 12px; 
             }}
             QLabel {{ 
-                color: {theme['text_primary']}; 
+                color: {t.text_primary}; 
                 font-size: 12px; 
                 font-weight: 600; 
                 background: transparent; 
             }}
             QSpinBox {{ 
                 background: rgba(255,255,255,15); 
-                color: {theme['text_primary']}; 
-                border: 1px solid {theme['overlay_border']}; 
+                color: {t.text_primary}; 
+                border: 1px solid {t.overlay_border}; 
                 border-radius: 6px; 
                 padding: 8px; 
                 font-size: 11px; 
                 min-height: 28px; 
             }}
             QCheckBox {{ 
-                color: {theme['text_primary']}; 
+                color: {t.text_primary}; 
                 font-size: 11px; 
             }}
             QCheckBox::indicator {{ 
                 width: 18px; 
                 height: 18px; 
                 border-radius: 4px; 
-                border: 1px solid {theme['overlay_border']}; 
+                border: 1px solid {t.overlay_border}; 
                 background: rgba(255,255,255,15); 
             }}
             QCheckBox::indicator:checked {{ 
                 background: rgba(71,160,232,255); 
             }}
             QPushButton {{ 
-                background: {theme['button_bg']}; 
-                color: {theme['text_primary']}; 
-                border: 1px solid {theme['overlay_border']}; 
+                background: {t.button_bg}; 
+                color: {t.text_primary}; 
+                border: 1px solid {t.overlay_border}; 
                 border-radius: 6px; 
                 padding: 10px 20px; 
                 font-size: 11px; 
                 min-height: 32px; 
             }}
             QPushButton:hover {{ 
-                background: {theme['button_hover']}; 
+                background: {t.button_hover}; 
             }}
             QPushButton#primaryButton {{ 
                 background: rgba(71,160,232,255); 
@@ -287,8 +107,8 @@ class ThemeManager:
             }}
             QComboBox {{
                 background: rgba(255,255,255,15);
-                color: {theme['text_primary']};
-                border: 1px solid {theme['overlay_border']};
+                color: {t.text_primary};
+                border: 1px solid {t.overlay_border};
                 border-radius: 6px;
                 padding: 8px;
                 font-size: 11px;
@@ -301,27 +121,220 @@ class ThemeManager:
                 image: none;
                 border-left: 4px solid transparent;
                 border-right: 4px solid transparent;
-                border-top: 6px solid {theme['text_primary']};
+                border-top: 6px solid {t.text_primary};
                 margin-right: 8px;
             }}
             QComboBox QAbstractItemView {{
-                background: {theme['dialog_bg']};
-                color: {theme['text_primary']};
-                selection-background-color: {theme['button_hover']};
-                border: 1px solid {theme['overlay_border']};
+                background: {t.dialog_bg};
+                color: {t.text_primary};
+                selection-background-color: {t.button_hover};
+                border: 1px solid {t.overlay_border};
                 border-radius: 4px;
             }}
         """
+
+
+class ThemeManager:
+    """Manage application themes and color schemes"""
+    
+    __slots__ = ('current_theme', '_current_colors', 'auto_switch_enabled')
+    
+    THEMES = {
+        'Light Glassmorphic': ThemeColors(
+            name='Light Glassmorphic',
+            overlay_bg_start='rgba(30,30,30,40)',
+            overlay_bg_end='rgba(20,20,20,30)',
+            overlay_border='rgba(0,0,0,90)',
+            hover_bg_start='rgba(30,30,30,60)',
+            hover_bg_end='rgba(20,20,20,50)',
+            hover_border='rgba(0,0,0,120)',
+            text_primary='rgba(0,0,0,250)',
+            text_secondary='rgba(0,0,0,200)',
+            text_tertiary='rgba(0,0,0,180)',
+            button_bg='rgba(0,0,0,25)',
+            button_hover='rgba(0,0,0,35)',
+            dialog_bg='rgba(240,240,240,250)',
+            progress_low='rgba(232,71,71,220)',
+            progress_mid='rgba(255,193,7,220)',
+            progress_high='rgba(76,175,80,220)',
+        ),
+        'Dark Glassmorphic': ThemeColors(
+            name='Dark Glassmorphic',
+            overlay_bg_start='rgba(255,255,255,40)',
+            overlay_bg_end='rgba(255,255,255,30)',
+            overlay_border='rgba(255,255,255,90)',
+            hover_bg_start='rgba(255,255,255,60)',
+            hover_bg_end='rgba(255,255,255,50)',
+            hover_border='rgba(255,255,255,120)',
+            text_primary='rgba(255,255,255,250)',
+            text_secondary='rgba(255,255,255,200)',
+            text_tertiary='rgba(255,255,255,180)',
+            button_bg='rgba(255,255,255,25)',
+            button_hover='rgba(255,255,255,35)',
+            dialog_bg='rgba(30,30,40,250)',
+            progress_low='rgba(232,71,71,220)',
+            progress_mid='rgba(255,193,7,220)',
+            progress_high='rgba(76,175,80,220)',
+        ),
+        'Wine Red': ThemeColors(
+            name='Wine Red',
+            overlay_bg_start='rgba(139,0,0,45)',
+            overlay_bg_end='rgba(115,0,0,35)',
+            overlay_border='rgba(178,34,34,100)',
+            hover_bg_start='rgba(139,0,0,65)',
+            hover_bg_end='rgba(115,0,0,55)',
+            hover_border='rgba(178,34,34,130)',
+            text_primary='rgba(255,255,255,250)',
+            text_secondary='rgba(255,255,255,220)',
+            text_tertiary='rgba(255,255,255,200)',
+            button_bg='rgba(139,0,0,30)',
+            button_hover='rgba(139,0,0,45)',
+            dialog_bg='rgba(80,0,0,250)',
+            progress_low='rgba(255,138,101,220)',
+            progress_mid='rgba(255,193,7,220)',
+            progress_high='rgba(255,182,193,220)',
+        ),
+        'Forest Green': ThemeColors(
+            name='Forest Green',
+            overlay_bg_start='rgba(129,199,132,45)',
+            overlay_bg_end='rgba(102,187,106,35)',
+            overlay_border='rgba(165,214,167,100)',
+            hover_bg_start='rgba(129,199,132,65)',
+            hover_bg_end='rgba(102,187,106,55)',
+            hover_border='rgba(165,214,167,130)',
+            text_primary='rgba(255,255,255,250)',
+            text_secondary='rgba(255,255,255,220)',
+            text_tertiary='rgba(255,255,255,200)',
+            button_bg='rgba(129,199,132,30)',
+            button_hover='rgba(129,199,132,45)',
+            dialog_bg='rgba(27,94,32,250)',
+            progress_low='rgba(255,138,101,220)',
+            progress_mid='rgba(255,213,79,220)',
+            progress_high='rgba(165,214,167,220)',
+        ),
+        'Ocean Blue': ThemeColors(
+            name='Ocean Blue',
+            overlay_bg_start='rgba(100,181,246,45)',
+            overlay_bg_end='rgba(66,165,245,35)',
+            overlay_border='rgba(129,212,250,100)',
+            hover_bg_start='rgba(100,181,246,65)',
+            hover_bg_end='rgba(66,165,245,55)',
+            hover_border='rgba(129,212,250,130)',
+            text_primary='rgba(255,255,255,250)',
+            text_secondary='rgba(255,255,255,220)',
+            text_tertiary='rgba(255,255,255,200)',
+            button_bg='rgba(100,181,246,30)',
+            button_hover='rgba(100,181,246,45)',
+            dialog_bg='rgba(13,71,161,250)',
+            progress_low='rgba(244,143,177,220)',
+            progress_mid='rgba(255,213,79,220)',
+            progress_high='rgba(129,212,250,220)',
+        ),
+        'Sunset Orange': ThemeColors(
+            name='Sunset Orange',
+            overlay_bg_start='rgba(255,183,77,45)',
+            overlay_bg_end='rgba(255,167,38,35)',
+            overlay_border='rgba(255,204,128,100)',
+            hover_bg_start='rgba(255,183,77,65)',
+            hover_bg_end='rgba(255,167,38,55)',
+            hover_border='rgba(255,204,128,130)',
+            text_primary='rgba(255,255,255,250)',
+            text_secondary='rgba(255,255,255,220)',
+            text_tertiary='rgba(255,255,255,200)',
+            button_bg='rgba(255,183,77,30)',
+            button_hover='rgba(255,183,77,45)',
+            dialog_bg='rgba(191,54,12,250)',
+            progress_low='rgba(239,83,80,220)',
+            progress_mid='rgba(255,213,79,220)',
+            progress_high='rgba(255,183,77,220)',
+        ),
+        'Light Overlay': ThemeColors(
+            name='Light Overlay',
+            overlay_bg_start='rgba(255,255,255,20)',
+            overlay_bg_end='rgba(250,250,250,15)',
+            overlay_border='rgba(200,200,200,80)',
+            hover_bg_start='rgba(255,255,255,40)',
+            hover_bg_end='rgba(250,250,250,30)',
+            hover_border='rgba(180,180,180,110)',
+            text_primary='rgba(33,33,33,250)',
+            text_secondary='rgba(66,66,66,220)',
+            text_tertiary='rgba(100,100,100,200)',
+            button_bg='rgba(220,220,220,30)',
+            button_hover='rgba(200,200,200,45)',
+            dialog_bg='rgba(255,255,255,250)',
+            progress_low='rgba(244,67,54,220)',
+            progress_mid='rgba(255,193,7,220)',
+            progress_high='rgba(76,175,80,220)',
+        ),
+        'Midnight Blue': ThemeColors(
+            name='Midnight Blue',
+            overlay_bg_start='rgba(13,27,42,50)',
+            overlay_bg_end='rgba(27,38,59,40)',
+            overlay_border='rgba(65,105,225,100)',
+            hover_bg_start='rgba(13,27,42,70)',
+            hover_bg_end='rgba(27,38,59,60)',
+            hover_border='rgba(65,105,225,130)',
+            text_primary='rgba(255,255,255,250)',
+            text_secondary='rgba(220,230,255,220)',
+            text_tertiary='rgba(200,210,235,200)',
+            button_bg='rgba(65,105,225,30)',
+            button_hover='rgba(65,105,225,45)',
+            dialog_bg='rgba(13,27,42,250)',
+            progress_low='rgba(220,20,60,220)',
+            progress_mid='rgba(255,215,0,220)',
+            progress_high='rgba(100,149,237,220)',
+        ),
+    }
+    
+    THEME_NAMES = tuple(THEMES)
+    
+    # Fallback for unknown theme names
+    _DEFAULT_THEME = THEMES['Dark Glassmorphic']
+    
+    # Stylesheets rendered once per theme when the class is defined
+    _OVERLAY_STYLESHEETS = {name: _OVERLAY_TEMPLATE.format(t=theme) for name, theme in THEMES.items()}
+    _DIALOG_STYLESHEETS = {name: _DIALOG_TEMPLATE.format(t=theme) for name, theme in THEMES.items()}
+    _PROGRESS_COLORS = {
+        name: {'low': theme.progress_low, 'mid': theme.progress_mid, 'high': theme.progress_high}
+        for name, theme in THEMES.items()
+    }
+    
+    def __init__(self, theme_name='Dark Glassmorphic'):
+        # Ensure attribute exists even if provided theme is invalid
+        self.current_theme = 'Dark Glassmorphic'
+        self._current_colors = self._DEFAULT_THEME
+        self.auto_switch_enabled = False  # Disable auto-switching to preserve user choice
+        
+        self.set_theme(theme_name)
+        
+    def get_theme(self, theme_name=None):
+        """Get theme colors"""
+        if theme_name is None:
+            return self._current_colors
+        return self.THEMES.get(theme_name, self._DEFAULT_THEME)
         
-        # Cache and return
-        self._dialog_stylesheet_cache[cache_key] = stylesheet
-        return stylesheet
+    def set_theme(self, theme_name):
+        """Set current theme"""
+        colors = self.THEMES.get(theme_name)
+        if colors is not None:
+            # Keep the palette's own name string so later lookups keyed on it match by identity
+            self.current_theme = colors.name
+            self._current_colors = colors
+            return True
+        return False
+        
+    def get_theme_names(self):
+        """Get the available theme names (a shared tuple)"""
+        return self.THEME_NAMES
+        
+    def get_overlay_stylesheet(self, theme_name=None):
+        """Get overlay window stylesheet for the current theme"""
+        return self._OVERLAY_STYLESHEETS[self.get_theme(theme_name).name]
+        
+    def get_dialog_stylesheet(self, theme_name=None):
+        """Get dialog stylesheet for the current theme"""
+        return self._DIALOG_STYLESHEETS[self.get_theme(theme_name).name]
         
     def get_progress_colors(self, theme_name=None):
         """Get progress bar colors"""
-        theme = self.get_theme(theme_name)
-        return {
-            'low': theme['progress_low'],
-            'mid': theme['progress_mid'],
-            'high': theme['progress_high'],
-        }
+        return self._PROGRESS_COLORS[self.get_theme(theme_name).name]